@@ -0,0 +1,164 @@
+import os
+import re
+import tempfile
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from ingestao import copiar_para_zip
+
+NIVEL_COMPRESSAO_PADRAO = 6
+# Membros maiores que isto não passam pela memória: são comprimidos em fluxo direto no ZIP.
+LIMITE_MEMBRO_EM_MEMORIA = 8 * 1024 * 1024
+# Membros comprimidos em andamento por thread, antes de o próximo ter de esperar a gravação.
+MEMBROS_POR_THREAD = 16
+# Teto dos bytes (sem compressão) dos membros em andamento, seja qual for o número de threads: com membros
+# grandes, a memória fica limitada por aqui e não pela contagem acima.
+LIMITE_BYTES_EM_ANDAMENTO = 64 * 1024 * 1024
+
+
+def comprimir(dados, nivel):
+    """ Devolve (dados comprimidos em deflate cru, CRC32). Com nível 0 os dados vão sem compressão. """
+    crc = zlib.crc32(dados)
+    if nivel == 0:
+        return dados, crc
+    compressor = zlib.compressobj(nivel, zlib.DEFLATED, -15)
+    return compressor.compress(dados) + compressor.flush(), crc
+
+def gravar_comprimido(zipf, zinfo, comprimido, crc, tamanho):
+    """
+    Grava no ZIP um membro já comprimido, fazendo o mesmo que ZipFile.open(zinfo, "w") faria,
+    mas sem recomprimir. Só vale para membros abaixo do limite ZIP64 (ver LIMITE_MEMBRO_EM_MEMORIA).
+    """
+    zinfo.file_size = tamanho
+    zinfo.compress_size = len(comprimido)
+    zinfo.CRC = crc
+    zinfo.flag_bits = 0x00
+    if not zinfo.external_attr:
+        zinfo.external_attr = 0o600 << 16
+    with zipf._lock:
+        zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        zipf.fp.write(zinfo.FileHeader(False))
+        zipf.fp.write(comprimido)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+
+def nome_grupo(categoria):
+    """ 'NFE/ENTRADA' -> 'NFE_ENTRADA', usado no nome do ZIP de cada categoria. """
+    return re.sub(r"[^\w-]+", "_", categoria).strip("_") or "OUTROS"
+
+
+class ConstrutorZip:
+    """
+    Monta o ZIP de saída num arquivo temporário em disco (não em BytesIO), comprimindo os membros
+    em paralelo em threads (zlib libera o GIL). Com por_categoria=True gera um ZIP por categoria.
+    Com caminho_saida o ZIP é gravado nesse caminho (por categoria: <caminho>_<grupo>.zip).
+    """
+
+    def __init__(self, nivel_compressao=NIVEL_COMPRESSAO_PADRAO, por_categoria=False, workers=None, pasta=None,
+                 caminho_saida=None):
+        self.caminho_saida = caminho_saida
+        self.nivel_compressao = nivel_compressao
+        self.compressao = zipfile.ZIP_STORED if nivel_compressao == 0 else zipfile.ZIP_DEFLATED
+        self.por_categoria = por_categoria
+        self.pasta = pasta
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        self.pendentes = deque()
+        self.bytes_pendentes = 0
+        self.arquivos = {}
+        self.zips = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, rastreamento):
+        if tipo is not None:
+            self.executor.shutdown(cancel_futures=True)
+            for zipf in self.zips.values():
+                zipf.close()
+            for arquivo in self.arquivos.values():
+                arquivo.close()
+
+    def zip_do_grupo(self, categoria):
+        grupo = nome_grupo(categoria) if self.por_categoria else ""
+        if grupo not in self.zips:
+            if self.caminho_saida:
+                base = os.path.splitext(self.caminho_saida)[0]
+                self.arquivos[grupo] = open(f"{base}_{grupo}.zip" if grupo else self.caminho_saida, "w+b")
+            else:
+                self.arquivos[grupo] = tempfile.TemporaryFile(dir=self.pasta)
+            self.zips[grupo] = zipfile.ZipFile(self.arquivos[grupo], "w", self.compressao,
+                                               compresslevel=self.nivel_compressao or None)
+        return self.zips[grupo]
+
+    def adicionar(self, caminho, dados, categoria="", date_time=None):
+        """ Agenda a compressão de um membro; a gravação acontece em ordem, à medida que fica pronto. """
+        zinfo = zipfile.ZipInfo(caminho, date_time=date_time or time.localtime(time.time())[:6])
+        zinfo.compress_type = self.compressao
+        # Uma memoryview (getbuffer() de um upload) é copiada, pois a thread a lê depois; bytes vão como estão.
+        dados = dados if isinstance(dados, bytes) else bytes(dados)
+        futuro = self.executor.submit(comprimir, dados, self.nivel_compressao)
+        self.pendentes.append((self.zip_do_grupo(categoria), zinfo, len(dados), futuro))
+        self.bytes_pendentes += len(dados)
+        while self.pendentes and (len(self.pendentes) > self.workers * MEMBROS_POR_THREAD
+                                  or self.bytes_pendentes > LIMITE_BYTES_EM_ANDAMENTO):
+            self.gravar_proximo()
+
+    def adicionar_fluxo(self, caminho, origem, info, categoria=""):
+        """ Adiciona um membro lido de outro ZIP; os grandes são comprimidos em fluxo, sem passar pela memória. """
+        if info.file_size <= LIMITE_MEMBRO_EM_MEMORIA:
+            self.adicionar(caminho, origem.read(), categoria, info.date_time)
+            return
+        self.esvaziar()
+        copiar_para_zip(self.zip_do_grupo(categoria), caminho, origem, info)
+
+    def gravar_proximo(self):
+        zipf, zinfo, tamanho, futuro = self.pendentes.popleft()
+        comprimido, crc = futuro.result()
+        self.bytes_pendentes -= tamanho
+        gravar_comprimido(zipf, zinfo, comprimido, crc, tamanho)
+
+    def esvaziar(self):
+        while self.pendentes:
+            self.gravar_proximo()
+
+    def finalizar(self):
+        """ Grava o que falta e devolve {grupo: arquivo} com os ZIPs prontos, posicionados no início. """
+        self.esvaziar()
+        self.executor.shutdown()
+        if not self.zips and not self.por_categoria:
+            self.zip_do_grupo("")
+        for zipf in self.zips.values():
+            zipf.close()
+        for arquivo in self.arquivos.values():
+            arquivo.seek(0)
+        return self.arquivos
+
+
+class GravadorPasta:
+    """ Mesma interface do ConstrutorZip, mas grava a árvore de categorias diretamente numa pasta. """
+
+    def __init__(self, pasta):
+        self.pasta = pasta
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, rastreamento):
+        pass
+
+    def adicionar(self, caminho, dados, categoria=""):
+        destino = os.path.join(self.pasta, *caminho.split("/"))
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        with open(destino, "wb") as f:
+            f.write(dados)
+
+    def finalizar(self):
+        return {}
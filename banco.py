@@ -0,0 +1,4 @@
+def linhas_como_dicts(cursor):
+    """ Linhas de um cursor já executado como dicionários {coluna: valor}. """
+    colunas = [coluna[0] for coluna in cursor.description]
+    return [dict(zip(colunas, linha)) for linha in cursor.fetchall()]
@@ -0,0 +1,214 @@
+"""
+Benchmark das etapas do organizador sobre documentos sintéticos (benchmarks.gerador).
+
+    python -m benchmarks.executar --nfe 2000 --cte 500 --workers 4
+    python -m benchmarks.executar --comparar benchmarks/resultados/ANTERIOR.json
+
+Mede, por etapa, vazão (itens/s e MiB/s), latência por item (p50/p90/p99) e pico de memória
+(tracemalloc, só do processo principal), e grava tudo em JSON para comparar entre execuções.
+"""
+import argparse
+import datetime
+import io
+import json
+import os
+import platform
+import sqlite3
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+from arquivo_saida import NIVEL_COMPRESSAO_PADRAO, ConstrutorZip
+from benchmarks.gerador import gerar_documentos, montar_zip_aninhado
+from cache_classificacao import criar_tabela_cache
+from classificacao import identificar_documento
+from ingestao import iterar_zip
+from organizador import organizar_documentos
+from paralelo import workers_padrao
+from regras import classificar_arquivo, motor_padrao
+
+PASTA_RESULTADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resultados")
+CNPJ_EMPRESA = "40994024000128"
+
+
+def percentil(valores, p):
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+def cronometrar(iterador):
+    """ Consome o iterador e devolve (duração total, latências de cada item, itens). """
+    latencias = []
+    itens = []
+    inicio = anterior = time.perf_counter()
+    for item in iterador:
+        agora = time.perf_counter()
+        latencias.append(agora - anterior)
+        itens.append(item)
+        anterior = agora
+    return time.perf_counter() - inicio, latencias, itens
+
+def medir(nome, etapa, total_bytes, medir_memoria=True):
+    """ Executa a etapa (função que devolve um iterador) e calcula as métricas; a memória é medida numa segunda passada. """
+    duracao, latencias, itens = cronometrar(etapa())
+    resultado = {
+        "itens": len(itens),
+        "bytes": total_bytes,
+        "segundos": round(duracao, 4),
+        "itens_por_segundo": round(len(itens) / duracao, 1) if duracao else None,
+        "mb_por_segundo": round(total_bytes / duracao / 1024 / 1024, 2) if duracao else None,
+        "latencia_ms": {rotulo: round(percentil(latencias, p) * 1000, 3)
+                        for rotulo, p in (("p50", 50), ("p90", 90), ("p99", 99), ("max", 100))},
+    }
+    if medir_memoria:
+        tracemalloc.start()
+        for _ in etapa():
+            pass
+        resultado["pico_memoria_mb"] = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 2)
+        tracemalloc.stop()
+    print(f"{nome:<28} {resultado['itens']:>7} itens  {resultado['segundos']:>8.3f}s  "
+          f"{resultado['itens_por_segundo'] or 0:>10.1f} itens/s  {resultado['mb_por_segundo'] or 0:>8.2f} MiB/s  "
+          f"p99 {resultado['latencia_ms']['p99']:.3f} ms  mem {resultado.get('pico_memoria_mb', '-')} MiB")
+    return resultado
+
+def organizar(documentos, conn, workers, nivel_compressao=NIVEL_COMPRESSAO_PADRAO):
+    itens = ((nome_arquivo, dados) for nome_arquivo, dados, _ in documentos)
+    with ConstrutorZip(nivel_compressao, workers=workers) as construtor:
+        yield from organizar_documentos(conn, itens, construtor, CNPJ_EMPRESA, workers)
+        for arquivo in construtor.finalizar().values():
+            arquivo.close()
+
+def comprimir(documentos, nivel_compressao):
+    with ConstrutorZip(nivel_compressao) as construtor:
+        for nome_arquivo, dados, _ in documentos:
+            construtor.adicionar(nome_arquivo, dados)
+            yield nome_arquivo
+        for arquivo in construtor.finalizar().values():
+            arquivo.close()
+
+def executar(args):
+    documentos = list(gerar_documentos(args.nfe, args.nfce, args.cte, args.cancelamentos, args.sped, args.nfs,
+                                       args.itens, args.linhas_txt, CNPJ_EMPRESA, args.semente))
+    total_bytes = sum(len(dados) for _, dados, _ in documentos)
+    zip_aninhado = montar_zip_aninhado(documentos)
+    print(f"{len(documentos)} documentos sintéticos, {total_bytes / 1024 / 1024:.1f} MiB\n")
+
+    categorias = Counter()
+    def identificar():
+        categorias.clear()
+        for nome_arquivo, dados, tipo in documentos:
+            resultado = identificar_documento(nome_arquivo, io.BytesIO(dados), CNPJ_EMPRESA)
+            categorias[f"{tipo} -> {resultado['categoria']}"] += 1
+            yield resultado
+
+    etapas = {}
+    memoria = not args.sem_memoria
+    etapas["classificar_arquivo"] = medir("classificar_arquivo", lambda: (classificar_arquivo(nome) for nome, _, _ in documentos),
+                                          0, memoria)
+    motor = motor_padrao()
+    etapas["regras_nome_conteudo"] = medir("regras_nome_conteudo",
+                                           lambda: (motor.classificar(nome, lambda dados=dados: io.BytesIO(dados), CNPJ_EMPRESA)
+                                                    for nome, dados, _ in documentos),
+                                           total_bytes, memoria)
+    etapas["identificar_documento"] = medir("identificar_documento", identificar, total_bytes, memoria)
+    etapas["extracao_fiscal"] = medir("extracao_fiscal",
+                                      lambda: (identificar_documento(nome, io.BytesIO(dados), CNPJ_EMPRESA, True)
+                                               for nome, dados, _ in documentos),
+                                      total_bytes, memoria)
+    etapas["iterar_zip_aninhado"] = medir("iterar_zip_aninhado",
+                                          lambda: (abrir().read() for _, _, abrir in iterar_zip(io.BytesIO(zip_aninhado))),
+                                          total_bytes, memoria)
+    etapas["arquivo_saida"] = medir("arquivo_saida", lambda: comprimir(documentos, args.nivel_compressao), total_bytes, memoria)
+
+    for rotulo, workers in (("serie", 1), ("paralelo", args.workers)):
+        # Banco novo a cada passada, para que nenhum resultado venha do cache.
+        etapas[f"organizar_{rotulo}"] = medir(f"organizar_{rotulo}",
+                                              lambda: organizar(documentos, novo_banco(), workers, args.nivel_compressao),
+                                              total_bytes, memoria)
+    conn = novo_banco()
+    for _ in organizar(documentos, conn, args.workers, args.nivel_compressao):
+        pass
+    etapas["organizar_cache"] = medir("organizar_cache", lambda: organizar(documentos, conn, args.workers, args.nivel_compressao),
+                                      total_bytes, memoria)
+
+    return {
+        "data": datetime.datetime.now().isoformat(timespec="seconds"),
+        "ambiente": {"python": platform.python_version(), "plataforma": platform.platform(), "cpus": os.cpu_count()},
+        "parametros": {chave: valor for chave, valor in vars(args).items() if chave not in ("saida", "comparar")},
+        "documentos": len(documentos),
+        "bytes": total_bytes,
+        "categorias": dict(sorted(categorias.items())),
+        "etapas": etapas,
+    }
+
+def novo_banco():
+    conn = sqlite3.connect(":memory:")
+    criar_tabela_cache(conn)
+    return conn
+
+# Parâmetros que não mudam o trabalho medido; os demais precisam ser iguais para que a comparação faça sentido.
+PARAMETROS_NEUTROS = ("sem_memoria",)
+
+def diferencas_de_corpus(atual, anterior):
+    """ [(nome, anterior, atual)] dos parâmetros e contagens que diferem entre as duas execuções. """
+    parametros_atuais, parametros_anteriores = atual["parametros"], anterior.get("parametros", {})
+    diferencas = [(nome, parametros_anteriores.get(nome), parametros_atuais.get(nome))
+                  for nome in sorted(set(parametros_atuais) | set(parametros_anteriores))
+                  if nome not in PARAMETROS_NEUTROS and parametros_atuais.get(nome) != parametros_anteriores.get(nome)]
+    for nome in ("documentos", "bytes"):
+        if atual.get(nome) != anterior.get(nome):
+            diferencas.append((nome, anterior.get(nome), atual.get(nome)))
+    return diferencas
+
+def comparar(atual, anterior):
+    """
+    Imprime a variação de vazão e de p99 por etapa em relação a uma execução anterior. Recusa a comparação
+    se o corpus ou os parâmetros forem outros: a variação refletiria a mudança de entrada, não de código.
+    """
+    print(f"\nComparação com {anterior['data']}:")
+    diferencas = diferencas_de_corpus(atual, anterior)
+    if diferencas:
+        print("Comparação recusada: a execução anterior usou outros parâmetros ou outro corpus.")
+        for nome, antes, agora in diferencas:
+            print(f"  {nome}: {antes} -> {agora}")
+        return False
+    for nome, etapa in atual["etapas"].items():
+        antiga = anterior["etapas"].get(nome)
+        if not antiga or not antiga.get("itens_por_segundo") or not etapa.get("itens_por_segundo"):
+            continue
+        variacao = (etapa["itens_por_segundo"] / antiga["itens_por_segundo"] - 1) * 100
+        print(f"{nome:<28} {antiga['itens_por_segundo']:>10.1f} -> {etapa['itens_por_segundo']:>10.1f} itens/s ({variacao:+.1f}%)  "
+              f"p99 {antiga['latencia_ms']['p99']:.3f} -> {etapa['latencia_ms']['p99']:.3f} ms")
+    return True
+
+def criar_parser():
+    parser = argparse.ArgumentParser(description="Benchmark do organizador de arquivos fiscais.")
+    for tipo, padrao in (("nfe", 1000), ("nfce", 500), ("cte", 300), ("cancelamentos", 50), ("sped", 4), ("nfs", 50)):
+        parser.add_argument(f"--{tipo}", type=int, default=padrao)
+    parser.add_argument("--itens", type=int, default=30, help="itens (det) por NF-e")
+    parser.add_argument("--linhas-txt", type=int, default=20000, help="linhas por SPED")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=workers_padrao())
+    parser.add_argument("--nivel-compressao", type=int, default=NIVEL_COMPRESSAO_PADRAO, choices=range(10))
+    parser.add_argument("--sem-memoria", action="store_true", help="não faz a passada com tracemalloc")
+    parser.add_argument("--saida", help="arquivo JSON de resultados (padrão: benchmarks/resultados/<data>.json)")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior para comparar")
+    return parser
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    resultados = executar(args)
+    saida = args.saida or os.path.join(PASTA_RESULTADOS, datetime.datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, "w", encoding="utf-8") as f:
+        json.dump(resultados, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados: {saida}")
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            if not comparar(resultados, json.load(f)):
+                sys.exit(1)
+
+if __name__ == "__main__":
+    main()
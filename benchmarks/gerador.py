@@ -0,0 +1,161 @@
+"""
+Gerador de documentos fiscais sintéticos para os benchmarks: NF-e (55), NFC-e (65), CT-e (57),
+eventos de cancelamento de CT-e, SPED Fiscal/Contribuições e NFS em TXT, opcionalmente em ZIPs aninhados.
+
+    python -m benchmarks.gerador PASTA --nfe 1000 --cte 200 --itens 50 --zip
+"""
+import argparse
+import io
+import os
+import random
+import zipfile
+
+NS_NFE = "http://www.portalfiscal.inf.br/nfe"
+NS_CTE = "http://www.portalfiscal.inf.br/cte"
+CFOPS = ["5102", "5405", "6102", "1102", "2102", "5929"]
+UFS = {"31": "MG", "35": "SP", "33": "RJ"}
+
+
+def digito_chave(chave43):
+    """ Dígito verificador da chave de acesso (módulo 11, pesos 2 a 9). """
+    soma = sum(int(digito) * (2 + i % 8) for i, digito in enumerate(reversed(chave43)))
+    resto = soma % 11
+    return "0" if resto < 2 else str(11 - resto)
+
+def gerar_cnpj(aleatorio):
+    return "".join(str(aleatorio.randint(0, 9)) for _ in range(14))
+
+def gerar_chave(aleatorio, modelo, cnpj_emitente, numero, ano_mes):
+    cuf = aleatorio.choice(list(UFS))
+    chave43 = f"{cuf}{ano_mes}{cnpj_emitente}{modelo}001{numero:09d}1{aleatorio.randint(0, 99999999):08d}"
+    return chave43 + digito_chave(chave43)
+
+def gerar_nfe(aleatorio, modelo, cnpj_emitente, cnpj_destinatario, numero, itens):
+    """ NF-e (55) ou NFC-e (65) no leiaute 4.00, com nfeProc e itens (det) em quantidade configurável. """
+    ano_mes = f"24{aleatorio.randint(1, 12):02d}"
+    chave = gerar_chave(aleatorio, modelo, cnpj_emitente, numero, ano_mes)
+    dets = []
+    total = 0.0
+    for n in range(1, itens + 1):
+        valor = round(aleatorio.uniform(1, 5000), 2)
+        total += valor
+        dets.append(f'<det nItem="{n}"><prod><cProd>{n:06d}</cProd><xProd>PRODUTO {n}</xProd>'
+                    f'<CFOP>{aleatorio.choice(CFOPS)}</CFOP><qCom>1.0000</qCom><vProd>{valor:.2f}</vProd></prod>'
+                    f'<imposto><ICMS><ICMS00><orig>0</orig><CST>00</CST><modBC>3</modBC><vBC>{valor:.2f}</vBC>'
+                    f'<pICMS>18.00</pICMS><vICMS>{valor * 0.18:.2f}</vICMS></ICMS00></ICMS></imposto></det>')
+    dest = f"<dest><CNPJ>{cnpj_destinatario}</CNPJ><xNome>DESTINATARIO</xNome></dest>" if modelo == "55" else ""
+    return (f'<?xml version="1.0" encoding="UTF-8"?><nfeProc xmlns="{NS_NFE}" versao="4.00"><NFe>'
+            f'<infNFe Id="NFe{chave}" versao="4.00"><ide><cUF>{chave[:2]}</cUF><natOp>VENDA</natOp><mod>{modelo}</mod>'
+            f'<serie>1</serie><nNF>{numero}</nNF><dhEmi>20{ano_mes[:2]}-{ano_mes[2:]}-15T10:00:00-03:00</dhEmi></ide>'
+            f'<emit><CNPJ>{cnpj_emitente}</CNPJ><xNome>EMITENTE</xNome><enderEmit><UF>{UFS[chave[:2]]}</UF></enderEmit></emit>'
+            f'{dest}{"".join(dets)}<total><ICMSTot><vNF>{total:.2f}</vNF></ICMSTot></total>'
+            f'<transp><modFrete>9</modFrete></transp></infNFe></NFe>'
+            f'<protNFe versao="4.00"><infProt><chNFe>{chave}</chNFe><cStat>100</cStat></infProt></protNFe></nfeProc>')
+
+def gerar_cte(aleatorio, cnpj_emitente, cnpj_destinatario, numero):
+    ano_mes = f"24{aleatorio.randint(1, 12):02d}"
+    chave = gerar_chave(aleatorio, "57", cnpj_emitente, numero, ano_mes)
+    valor = round(aleatorio.uniform(100, 20000), 2)
+    return chave, (f'<?xml version="1.0" encoding="UTF-8"?><cteProc xmlns="{NS_CTE}" versao="4.00"><CTe>'
+                   f'<infCte Id="CTe{chave}" versao="4.00"><ide><cUF>{chave[:2]}</cUF><CFOP>5353</CFOP><mod>57</mod>'
+                   f'<serie>1</serie><nCT>{numero}</nCT><dhEmi>20{ano_mes[:2]}-{ano_mes[2:]}-10T08:00:00-03:00</dhEmi>'
+                   f'<toma3><toma>3</toma></toma3></ide><emit><CNPJ>{cnpj_emitente}</CNPJ><xNome>TRANSPORTADORA</xNome></emit>'
+                   f'<rem><CNPJ>{gerar_cnpj(aleatorio)}</CNPJ></rem><dest><CNPJ>{cnpj_destinatario}</CNPJ></dest>'
+                   f'<vPrest><vTPrest>{valor:.2f}</vTPrest><vRec>{valor:.2f}</vRec></vPrest>'
+                   f'<infCTeNorm><infCarga><vCarga>{valor * 10:.2f}</vCarga></infCarga></infCTeNorm></infCte></CTe></cteProc>')
+
+def gerar_cancelamento_cte(chave):
+    return (f'<?xml version="1.0" encoding="UTF-8"?><procEventoCTe xmlns="{NS_CTE}" versao="4.00"><eventoCTe versao="4.00">'
+            f'<infEvento Id="ID110111{chave}01"><cOrgao>{chave[:2]}</cOrgao><chCTe>{chave}</chCTe>'
+            f'<dhEvento>2024-06-01T10:00:00-03:00</dhEvento><tpEvento>110111</tpEvento><nSeqEvento>1</nSeqEvento>'
+            f'<detEvento versaoEvento="4.00"><evCancCTe><descEvento>Cancelamento</descEvento></evCancCTe></detEvento>'
+            f'</infEvento></eventoCTe></procEventoCTe>')
+
+def gerar_sped(aleatorio, cnpj, linhas, contribuicoes=False):
+    """ EFD ICMS/IPI ou EFD-Contribuições com o registro |0000| e linhas de C100/C170 até o tamanho pedido. """
+    mes = aleatorio.randint(1, 12)
+    dt_ini, dt_fim = f"01{mes:02d}2024", f"28{mes:02d}2024"
+    if contribuicoes:
+        cabecalho = f"|0000|006|0|||{dt_ini}|{dt_fim}|EMPRESA TESTE|{cnpj}|MG|3106200||00|1|"
+    else:
+        cabecalho = f"|0000|017|0|{dt_ini}|{dt_fim}|EMPRESA TESTE|{cnpj}||MG|0012345670011|3106200|||A|1|"
+    corpo = [cabecalho, "|0001|0|"]
+    for n in range(linhas):
+        corpo.append(f"|C100|0|1|PART{n}|55|00|1|{n}|{'0' * 44}|{dt_ini}|{dt_ini}|100,00|0|0,00|0,00|100,00|9|0,00|0,00|0,00|100,00|18,00|0,00|0,00|0,00|0,00|0,00|0,00|0,00|")
+    corpo.append(f"|9999|{len(corpo) + 1}|")
+    return "\r\n".join(corpo) + "\r\n"
+
+def gerar_nfs(aleatorio, cnpj, tomado, linhas):
+    tipo = "NFS TOMADO" if tomado else "NFS PRESTADO"
+    corpo = [f"{tipo};{cnpj};{aleatorio.randint(1, 12):02d}/2024"]
+    for n in range(linhas):
+        corpo.append(f"{n};{gerar_cnpj(aleatorio)};SERVICO {n};{aleatorio.uniform(10, 9000):.2f}")
+    return "\r\n".join(corpo) + "\r\n"
+
+def gerar_documentos(nfe=100, nfce=50, cte=50, cancelamentos=10, sped=2, nfs=10, itens=20, linhas_txt=1000,
+                     cnpj_empresa="40994024000128", semente=42):
+    """ Gera (nome_arquivo, dados, tipo) de forma reproduzível: a mesma semente produz os mesmos arquivos. """
+    aleatorio = random.Random(semente)
+    for n in range(nfe):
+        entrada = n % 2 == 0
+        emitente, destinatario = (gerar_cnpj(aleatorio), cnpj_empresa) if entrada else (cnpj_empresa, gerar_cnpj(aleatorio))
+        yield f"NFe_{n:06d}.xml", gerar_nfe(aleatorio, "55", emitente, destinatario, n, itens).encode(), "NFE"
+    for n in range(nfce):
+        yield f"NFCe_{n:06d}.xml", gerar_nfe(aleatorio, "65", cnpj_empresa, None, n, max(1, itens // 4)).encode(), "NFCE"
+    chaves_cte = []
+    for n in range(cte):
+        chave, xml = gerar_cte(aleatorio, gerar_cnpj(aleatorio), cnpj_empresa, n)
+        chaves_cte.append(chave)
+        yield f"CTe_{n:06d}.xml", xml.encode(), "CTE"
+    for n, chave in enumerate(chaves_cte[:cancelamentos]):
+        yield f"CTe_canc_{n:06d}.xml", gerar_cancelamento_cte(chave).encode(), "CTE_CANCELADA"
+    for n in range(sped):
+        yield f"SPED_{n:03d}.txt", gerar_sped(aleatorio, cnpj_empresa, linhas_txt, contribuicoes=n % 2 == 1).encode("latin-1"), "SPED"
+    for n in range(nfs):
+        yield f"NFS_{n:04d}.txt", gerar_nfs(aleatorio, cnpj_empresa, n % 2 == 0, max(1, linhas_txt // 10)).encode(), "NFS"
+
+def montar_zip_aninhado(documentos, por_zip=500):
+    """ Agrupa os documentos em ZIPs de até por_zip arquivos, todos dentro de um ZIP externo (bytes). """
+    externo = io.BytesIO()
+    with zipfile.ZipFile(externo, "w", zipfile.ZIP_DEFLATED) as zip_externo:
+        interno, zip_interno, contador = None, None, 0
+        for indice, (nome_arquivo, dados, _) in enumerate(documentos):
+            if indice % por_zip == 0:
+                if zip_interno:
+                    zip_interno.close()
+                    zip_externo.writestr(f"lote_{contador:03d}.zip", interno.getvalue())
+                    contador += 1
+                interno = io.BytesIO()
+                zip_interno = zipfile.ZipFile(interno, "w", zipfile.ZIP_DEFLATED)
+            zip_interno.writestr(f"docs/{nome_arquivo}", dados)
+        if zip_interno:
+            zip_interno.close()
+            zip_externo.writestr(f"lote_{contador:03d}.zip", interno.getvalue())
+    return externo.getvalue()
+
+def criar_parser():
+    parser = argparse.ArgumentParser(description="Gera documentos fiscais sintéticos para benchmarks.")
+    parser.add_argument("pasta")
+    for tipo, padrao in (("nfe", 100), ("nfce", 50), ("cte", 50), ("cancelamentos", 10), ("sped", 2), ("nfs", 10)):
+        parser.add_argument(f"--{tipo}", type=int, default=padrao)
+    parser.add_argument("--itens", type=int, default=20, help="itens (det) por NF-e")
+    parser.add_argument("--linhas-txt", type=int, default=1000, help="linhas por SPED")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--zip", action="store_true", help="grava tudo num único ZIP com ZIPs aninhados")
+    return parser
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    os.makedirs(args.pasta, exist_ok=True)
+    documentos = gerar_documentos(args.nfe, args.nfce, args.cte, args.cancelamentos, args.sped, args.nfs,
+                                  args.itens, args.linhas_txt, semente=args.semente)
+    if args.zip:
+        with open(os.path.join(args.pasta, "documentos.zip"), "wb") as f:
+            f.write(montar_zip_aninhado(documentos))
+        return
+    for nome_arquivo, dados, _ in documentos:
+        with open(os.path.join(args.pasta, nome_arquivo), "wb") as f:
+            f.write(dados)
+
+if __name__ == "__main__":
+    main()
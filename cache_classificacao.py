@@ -0,0 +1,109 @@
+import hashlib
+import json
+import time
+from collections import deque
+
+from classificacao import VERSAO_CLASSIFICACAO, classificar_conteudo
+from paralelo import processar_em_paralelo
+
+# Espaço máximo ocupado pelos resultados guardados (tamanho de cada entrada: hash, CNPJ e resultado em JSON);
+# acima disso os menos usados são descartados.
+LIMITE_BYTES_CACHE = 128 * 1024 * 1024
+LOTE_GRAVACAO_CACHE = 500
+
+
+def criar_tabela_cache(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS cache_classificacao (
+                        hash TEXT,
+                        cnpj TEXT,
+                        versao INTEGER,
+                        resultado TEXT,
+                        tamanho INTEGER,
+                        usado_em REAL,
+                        PRIMARY KEY (hash, cnpj)) WITHOUT ROWID''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_classificacao_usado_em ON cache_classificacao (usado_em)")
+    conn.commit()
+
+def hash_conteudo(dados):
+    return hashlib.blake2b(dados, digest_size=20).hexdigest()
+
+def buscar_cache(conn, hash_, cnpj_empresa):
+    linha = conn.execute("SELECT resultado FROM cache_classificacao WHERE hash = ? AND cnpj = ? AND versao = ?",
+                         (hash_, cnpj_empresa, VERSAO_CLASSIFICACAO)).fetchone()
+    return json.loads(linha[0]) if linha else None
+
+def gravar_cache(conn, entradas, cnpj_empresa):
+    """ Grava resultados de classificação novos (ou refeitos); entradas = [(hash, resultado)]. """
+    agora = time.time()
+    linhas = []
+    for hash_, resultado in entradas:
+        texto = json.dumps(resultado)
+        linhas.append((hash_, cnpj_empresa, VERSAO_CLASSIFICACAO, texto, len(hash_) + len(cnpj_empresa) + len(texto), agora))
+    conn.executemany("INSERT OR REPLACE INTO cache_classificacao (hash, cnpj, versao, resultado, tamanho, usado_em) VALUES (?, ?, ?, ?, ?, ?)",
+                     linhas)
+    conn.commit()
+
+def renovar_cache(conn, hashes, cnpj_empresa):
+    """ Marca como usados agora os resultados já guardados de hashes (um UPDATE por lote, sem regravar o JSON). """
+    if not hashes:
+        return
+    conn.execute(f"UPDATE cache_classificacao SET usado_em = ? WHERE cnpj = ? AND hash IN ({', '.join('?' * len(hashes))})",
+                 [time.time(), cnpj_empresa, *hashes])
+    conn.commit()
+
+def podar_cache(conn, limite=LIMITE_BYTES_CACHE):
+    """ Remove as entradas usadas há mais tempo até o tamanho total do cache voltar ao limite. """
+    total = conn.execute("SELECT coalesce(SUM(tamanho), 0) FROM cache_classificacao").fetchone()[0]
+    if total > limite:
+        # Fica o que cabe no limite, das entradas usadas mais recentemente para as mais antigas.
+        conn.execute("""DELETE FROM cache_classificacao WHERE (hash, cnpj) IN (
+                            SELECT hash, cnpj FROM (
+                                SELECT hash, cnpj, SUM(tamanho) OVER (ORDER BY usado_em DESC, hash, cnpj
+                                                                      ROWS UNBOUNDED PRECEDING) AS acumulado
+                                FROM cache_classificacao)
+                            WHERE acumulado > ?)""", (limite,))
+        conn.commit()
+
+def classificar_sem_cache(item):
+    """ Função do pool: item = (nome_arquivo, dados, cnpj_empresa, extrair, resultado_em_cache), sem resultado em cache. """
+    return classificar_conteudo(item[:4])
+
+def resultado_em_cache(item):
+    return item[4]
+
+def classificar_com_cache(conn, itens, cnpj_empresa, workers=None, extrair=False):
+    """
+    Classifica itens (nome_arquivo, dados) consultando antes o cache; os acertos saem direto e só os
+    conteúdos ainda não vistos vão ao pool. Gera (nome_arquivo, dados, resultado) na ordem de entrada.
+    Com extrair, um resultado guardado sem os campos fiscais é lido de novo (e regravado com eles).
+    """
+    originais = deque()
+    acertos = []
+    entradas = []
+
+    def preparar():
+        for nome_arquivo, dados in itens:
+            hash_ = hash_conteudo(dados)
+            resultado = buscar_cache(conn, hash_, cnpj_empresa)
+            if extrair and resultado is not None and "fiscal" not in resultado:
+                resultado = None
+            originais.append((nome_arquivo, dados, hash_, resultado is not None))
+            yield nome_arquivo, None if resultado is not None else dados, cnpj_empresa, extrair, resultado
+
+    for _, resultado in processar_em_paralelo(preparar(), classificar_sem_cache, workers, pronto=resultado_em_cache):
+        nome_arquivo, dados, hash_, acerto = originais.popleft()
+        # Os acertos só renovam usado_em, que orienta o descarte; os novos resultados são gravados.
+        if acerto:
+            acertos.append(hash_)
+        else:
+            entradas.append((hash_, resultado))
+        if len(acertos) + len(entradas) >= LOTE_GRAVACAO_CACHE:
+            renovar_cache(conn, acertos, cnpj_empresa)
+            gravar_cache(conn, entradas, cnpj_empresa)
+            acertos.clear()
+            entradas.clear()
+        yield nome_arquivo, dados, resultado
+
+    renovar_cache(conn, acertos, cnpj_empresa)
+    gravar_cache(conn, entradas, cnpj_empresa)
+    podar_cache(conn)
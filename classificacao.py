@@ -0,0 +1,267 @@
+import codecs
+import io
+import re
+import xml.etree.ElementTree as ET
+
+
+def extrair_cnpj(texto):
+    """ Extrai CNPJ de um texto usando regex. """
+    match = re.search(r'\d{14}', texto)
+    return match.group(0) if match else None
+
+# Elementos que, no leiaute da NF-e/CT-e, vêm depois de ide/emit/dest: ao chegar neles não há mais o que ler.
+MARCADORES_FIM = {"det", "total", "vPrest", "imp", "infCTeNorm", "infCteComp", "infCteAnu"}
+TIPO_EVENTO_CANCELAMENTO = "110111"
+# Elementos cujo atributo Id identifica o documento (chave de acesso) ou o evento.
+ELEMENTOS_ID = {"infNFe", "infCte", "infEvento"}
+# Modelos cujos campos fiscais (valores, datas, CFOP) são extraídos: NF-e, NFC-e e CT-e.
+MODELOS_FISCAIS = {"55", "65", "57"}
+# Incrementar sempre que a classificação mudar, para invalidar os resultados guardados em cache.
+VERSAO_CLASSIFICACAO = 3
+# Um TXT é identificado pelas primeiras linhas: o registro |0000| do SPED ou o marcador da NFS.
+LIMITE_LINHAS_TXT = 50
+TAMANHO_MAXIMO_LINHA_TXT = 64 * 1024
+REGISTRO_ABERTURA_SPED = "|0000|"
+MARCADORES_NFS = {"NFS TOMADO": "NFS/TOMADO", "NFS PRESTADO": "NFS/PRESTADO"}
+
+def nome_local(tag):
+    """ Remove o namespace de uma tag ('{http://...}mod' -> 'mod'). """
+    return tag.rpartition("}")[2]
+
+def apenas_digitos(cnpj):
+    return re.sub(r"\D", "", cnpj or "")
+
+def cabecalho_completo(dados):
+    if dados["tipo_evento"] and dados["chave"] and dados["identificador"]:
+        return True
+    if not dados["modelo"] or not dados["cnpj_emitente"]:
+        return False
+    return dados["modelo"] == "65" or dados["cnpj_destinatario"] is not None
+
+def ler_cabecalho_xml(fonte, extrair=False):
+    """
+    Lê o XML em fluxo (iterparse) e para assim que tiver a raiz, ide/mod, emit/CNPJ e dest/CNPJ
+    (ou o tipo e a chave, no caso de eventos). Os elementos já lidos são descartados.
+    Com extrair, lê o documento até o fim na mesma passada e devolve também os campos fiscais (ver campos_fiscais).
+    """
+    dados = {"raiz": None, "modelo": None, "cnpj_emitente": None, "cnpj_destinatario": None,
+             "tipo_evento": None, "chave": None, "identificador": None}
+    fiscal = {"serie": None, "numero": None, "data_emissao": None, "valor": None, "cfops": {}}
+    item = {"CFOP": None, "vProd": 0.0}
+    caminho = []
+    pilha = []
+    # Com extrair, o que vem depois do cabeçalho só alimenta os campos fiscais: um erro ali (XML truncado,
+    # valor fora do formato) descarta esses campos, mas não a identificação do documento.
+    cabecalho_lido = False
+    try:
+        for evento, elem in ET.iterparse(fonte, events=("start", "end")):
+            tag = nome_local(elem.tag)
+            if evento == "start":
+                if dados["raiz"] is None:
+                    dados["raiz"] = tag
+                if tag in MARCADORES_FIM:
+                    if not extrair:
+                        break
+                    cabecalho_lido = True
+                if tag in ELEMENTOS_ID and dados["identificador"] is None:
+                    dados["identificador"] = elem.get("Id")
+                    if tag != "infEvento":
+                        dados["chave"] = apenas_digitos(dados["identificador"]) or None
+                caminho.append(tag)
+                pilha.append(elem)
+                continue
+            
+            caminho.pop()
+            pilha.pop()
+            pai = caminho[-1] if caminho else None
+            texto = (elem.text or "").strip()
+            if tag == "mod" and pai == "ide":
+                dados["modelo"] = texto
+            elif tag == "CNPJ" and pai == "emit":
+                dados["cnpj_emitente"] = texto
+            elif tag == "CNPJ" and pai == "dest":
+                dados["cnpj_destinatario"] = texto
+            elif tag == "tpEvento":
+                dados["tipo_evento"] = texto
+            elif tag in ("chNFe", "chCTe") and (pai == "infEvento" or dados["chave"] is None):
+                # Lendo até o fim (extrair), aparecem chaves de outros documentos (docAnt, infCteComp...).
+                dados["chave"] = texto
+            elif extrair:
+                ler_campo_fiscal(fiscal, item, tag, pai, texto)
+            
+            if pilha:
+                pilha[-1].remove(elem)
+            elem.clear()
+            if not cabecalho_lido and cabecalho_completo(dados):
+                if not extrair:
+                    break
+                cabecalho_lido = True
+    except (ET.ParseError, ValueError):
+        if not (extrair and cabecalho_lido):
+            raise
+        fiscal = None
+    
+    # Eventos não têm ide/mod: o modelo está nas posições 21-22 da chave de acesso.
+    if dados["modelo"] is None and dados["chave"] and len(dados["chave"]) == 44:
+        dados["modelo"] = dados["chave"][20:22]
+    if extrair:
+        dados["fiscal"] = campos_fiscais(dados, fiscal, item) if fiscal is not None else None
+    return dados
+
+def ler_campo_fiscal(fiscal, item, tag, pai, texto):
+    """ Acumula um elemento já lido nos campos fiscais; item guarda o CFOP e o vProd do det corrente. """
+    if pai == "ide":
+        if tag == "serie":
+            fiscal["serie"] = texto
+        elif tag in ("nNF", "nCT"):
+            fiscal["numero"] = texto
+        elif tag in ("dhEmi", "dEmi"):
+            fiscal["data_emissao"] = texto[:10]
+        elif tag == "CFOP":
+            # CT-e: um único CFOP, no ide, para o valor da prestação.
+            item["CFOP"] = texto
+    elif pai == "prod" and tag in ("CFOP", "vProd"):
+        item[tag] = texto if tag == "CFOP" else float(texto or 0)
+    elif tag == "det":
+        cfops = fiscal["cfops"]
+        cfops[item["CFOP"]] = round(cfops.get(item["CFOP"], 0.0) + item["vProd"], 2)
+        item["CFOP"], item["vProd"] = None, 0.0
+    elif (tag == "vNF" and pai == "ICMSTot") or (tag == "vTPrest" and pai == "vPrest"):
+        fiscal["valor"] = float(texto or 0)
+
+def campos_fiscais(dados, fiscal, item):
+    """
+    Campos fiscais de uma NF-e, NFC-e ou CT-e (None para eventos e outros XML): série, número,
+    data de emissão (aaaa-mm-dd), valor total (vNF ou vTPrest) e valor por CFOP.
+    """
+    if dados["tipo_evento"] or dados["modelo"] not in MODELOS_FISCAIS or not dados["chave"]:
+        return None
+    if dados["modelo"] == "57" and item["CFOP"]:
+        fiscal["cfops"] = {item["CFOP"]: fiscal["valor"] or 0.0}
+    return fiscal
+
+def categoria_xml(dados, cnpj_empresa):
+    """ Decide a categoria de um XML já lido por ler_cabecalho_xml. """
+    cnpj_empresa = apenas_digitos(cnpj_empresa)
+    cancelamento = "canc" in (dados["raiz"] or "").lower() or dados["tipo_evento"] == TIPO_EVENTO_CANCELAMENTO
+    if dados["modelo"] == "55" and not dados["tipo_evento"]:
+        return "NFE/ENTRADA" if dados["cnpj_destinatario"] == cnpj_empresa else "NFE/SAIDA"
+    elif dados["modelo"] == "65" and not dados["tipo_evento"]:
+        return "NFCE/SAIDA"
+    elif dados["modelo"] == "57":
+        if cancelamento:
+            return "CTE/CANCELADA"
+        if not dados["tipo_evento"]:
+            return "CTE/ENTRADA" if dados["cnpj_destinatario"] == cnpj_empresa else "CTE/SAIDA"
+    return "OUTROS"
+
+def competencia(data):
+    """ Data ddmmaaaa do SPED -> competência aaaa-mm. """
+    if re.fullmatch(r"\d{8}", data or ""):
+        return f"{data[4:]}-{data[2:4]}"
+    return None
+
+def ler_registro_0000(linha):
+    """
+    Variante, CNPJ e competência do registro 0000. Na EFD ICMS/IPI, DT_INI é o 4º campo e o CNPJ o 7º;
+    na EFD-Contribuições, TIPO_ESCRIT, IND_SIT_ESP e NUM_REC_ANTERIOR vêm antes: DT_INI é o 6º e o CNPJ o 9º.
+    """
+    campos = linha.strip().split("|")
+    # campos[0] é vazio (a linha começa com '|') e campos[1] é '0000'.
+    if len(campos) > 7 and re.fullmatch(r"\d{8}", campos[4]):
+        variante, data_inicial, cnpj = "ICMS_IPI", campos[4], campos[7]
+    elif len(campos) > 9 and re.fullmatch(r"\d{8}", campos[6]):
+        variante, data_inicial, cnpj = "CONTRIBUICOES", campos[6], campos[9]
+    else:
+        return {}
+    return {"variante": variante, "cnpj": apenas_digitos(cnpj) or None, "competencia": competencia(data_inicial)}
+
+def ler_cabecalho_txt(fonte):
+    """
+    Lê o TXT linha a linha e para no registro |0000| do SPED ou no marcador da NFS, sem passar de
+    LIMITE_LINHAS_TXT linhas: um SPED de centenas de MB é identificado pela primeira linha.
+    """
+    dados = {"tipo": None, "variante": None, "cnpj": None, "competencia": None}
+    for numero in range(LIMITE_LINHAS_TXT):
+        linha = fonte.readline(TAMANHO_MAXIMO_LINHA_TXT)
+        if not linha:
+            break
+        if numero == 0 and linha.startswith(codecs.BOM_UTF8):
+            linha = linha[len(codecs.BOM_UTF8):]
+        # Os marcadores são ASCII; latin-1 decodifica qualquer byte, seja o arquivo UTF-8 ou ANSI.
+        linha = linha.decode("latin-1")
+        if linha.startswith(REGISTRO_ABERTURA_SPED):
+            dados["tipo"] = "SPED"
+            dados.update(ler_registro_0000(linha))
+            break
+        marcador = next((marcador for marcador in MARCADORES_NFS if marcador in linha), None)
+        if marcador:
+            dados["tipo"] = MARCADORES_NFS[marcador]
+            dados["cnpj"] = extrair_cnpj(linha) or dados["cnpj"]
+            periodo = re.search(r"\b(\d{2})/(\d{4})\b", linha)
+            if periodo:
+                dados["competencia"] = f"{periodo.group(2)}-{periodo.group(1)}"
+            break
+        if "SPED" in linha:
+            dados["tipo"] = "SPED"
+            break
+        dados["cnpj"] = dados["cnpj"] or extrair_cnpj(linha)
+    return dados
+
+def categoria_txt(dados):
+    """ Decide a categoria de um TXT já lido por ler_cabecalho_txt. """
+    if dados["tipo"] == "SPED":
+        return f"SPED/{dados['variante']}" if dados["variante"] else "SPED"
+    return dados["tipo"] or "OUTROS"
+
+def identificar_documento(nome_arquivo, fluxo, cnpj_empresa, extrair=False):
+    """
+    Identifica o documento a partir de um fluxo binário já aberto (arquivo, membro de ZIP ou BytesIO).
+    Devolve um dicionário com a categoria, a chave de acesso, o identificador (Id) do documento ou evento
+    e os campos do cabeçalho (modelo, CNPJs do emitente e do destinatário, competência do SPED/NFS...).
+    Com extrair, os XML trazem também "fiscal" (ver campos_fiscais), lido na mesma passada.
+    """
+    resultado = {"categoria": "OUTROS", "chave": None, "identificador": None,
+                 "cnpj_emitente": None, "cnpj_destinatario": None, "competencia": None}
+    if extrair:
+        resultado["fiscal"] = None
+    try:
+        if nome_arquivo.endswith(".xml"):
+            resultado.update(ler_cabecalho_xml(fluxo, extrair))
+            resultado["categoria"] = categoria_xml(resultado, cnpj_empresa)
+
+        elif nome_arquivo.endswith(".txt"):
+            dados = ler_cabecalho_txt(fluxo)
+            resultado["categoria"] = categoria_txt(dados)
+            resultado["cnpj_emitente"] = dados["cnpj"]
+            resultado["competencia"] = dados["competencia"]
+        
+        elif nome_arquivo.endswith(".xls") or nome_arquivo.endswith(".xlsx"):
+            resultado["categoria"] = "PLANILHA"
+
+    except Exception as e:
+        print(f"Erro ao identificar tipo de nota: {e}")
+        resultado["erro"] = str(e)
+    
+    return resultado
+
+def recategorizar(resultado, cnpj_empresa):
+    """ Categoria de um resultado de identificar_documento vista por outra empresa (só a do XML depende do CNPJ). """
+    if resultado.get("raiz"):
+        return categoria_xml(resultado, cnpj_empresa)
+    return resultado["categoria"]
+
+def identificar_tipo_conteudo(nome_arquivo, fluxo, cnpj_empresa):
+    return identificar_documento(nome_arquivo, fluxo, cnpj_empresa)["categoria"]
+
+def identificar_tipo_nota(caminho_arquivo, cnpj_empresa):
+    """
+    Identifica o tipo do documento com base na estrutura do XML/TXT e no CNPJ.
+    """
+    with open(caminho_arquivo, "rb") as f:
+        return identificar_tipo_conteudo(caminho_arquivo, f, cnpj_empresa)
+
+def classificar_conteudo(item):
+    """ Versão de identificar_documento para o pool de processos: item = (nome_arquivo, dados, cnpj_empresa, extrair). """
+    nome_arquivo, dados, cnpj_empresa, extrair = item
+    return identificar_documento(nome_arquivo, io.BytesIO(dados), cnpj_empresa, extrair)
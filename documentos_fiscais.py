@@ -0,0 +1,125 @@
+import datetime
+import json
+
+from banco import linhas_como_dicts
+from empresas import EMPRESA_NAO_IDENTIFICADA
+
+# Documentos acumulados antes de cada gravação no banco (um executemany e um commit por lote).
+LOTE_DOCUMENTOS_FISCAIS = 500
+
+
+def criar_tabela_documentos_fiscais(conn):
+    # A chave primária agrupa as linhas por empresa e competência (aaaa-mm) dentro da tabela WITHOUT ROWID:
+    # as consultas de uma empresa ou de um mês leem um trecho contíguo, como uma partição.
+    conn.execute('''CREATE TABLE IF NOT EXISTS documentos_fiscais (
+                        empresa TEXT,
+                        competencia TEXT,
+                        chave TEXT,
+                        modelo TEXT,
+                        serie TEXT,
+                        numero TEXT,
+                        data_emissao TEXT,
+                        valor REAL,
+                        cnpj_emitente TEXT,
+                        cnpj_destinatario TEXT,
+                        categoria TEXT,
+                        cfops TEXT,
+                        arquivo TEXT,
+                        gravado_em TEXT,
+                        PRIMARY KEY (empresa, competencia, chave)) WITHOUT ROWID''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_documentos_fiscais_competencia ON documentos_fiscais (competencia, modelo, valor)")
+    conn.execute("CREATE TABLE IF NOT EXISTS versao_documentos_fiscais (id INTEGER PRIMARY KEY CHECK (id = 1), versao INTEGER)")
+    conn.execute("INSERT OR IGNORE INTO versao_documentos_fiscais (id, versao) VALUES (1, 0)")
+    conn.commit()
+
+class GravadorDocumentosFiscais:
+    """
+    Recebe os campos fiscais extraídos pelo organizador e os grava em lotes em documentos_fiscais.
+    Um documento já gravado (mesma empresa, competência e chave) é substituído, o que torna segura a
+    retomada de uma tarefa interrompida. Documentos sem empresa roteada ficam com a empresa padrão.
+    """
+    def __init__(self, conn, empresa=None, lote=LOTE_DOCUMENTOS_FISCAIS):
+        self.conn = conn
+        self.empresa = empresa or EMPRESA_NAO_IDENTIFICADA
+        self.lote = lote
+        self.pendentes = []
+        self.gravados = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, *excecao):
+        if tipo is None:
+            self.gravar()
+
+    def adicionar(self, registro, resultado):
+        """ Acumula o documento de um registro do organizador; ignora os que não têm campos fiscais. """
+        fiscal = resultado.get("fiscal")
+        if not fiscal:
+            return
+        data_emissao = fiscal["data_emissao"]
+        self.pendentes.append((registro["empresa"] or self.empresa, data_emissao[:7] if data_emissao else "",
+                               resultado["chave"], resultado["modelo"], fiscal["serie"], fiscal["numero"], data_emissao,
+                               fiscal["valor"], resultado["cnpj_emitente"], resultado["cnpj_destinatario"],
+                               registro["categoria"], json.dumps(fiscal["cfops"]), registro["arquivo"]))
+        if len(self.pendentes) >= self.lote:
+            self.gravar()
+
+    def gravar(self, confirmar=True):
+        """ Grava os documentos acumulados; com confirmar=False, o commit fica com quem chama (mesma transação). """
+        if not self.pendentes:
+            return
+        gravado_em = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.conn.executemany('''INSERT INTO documentos_fiscais (empresa, competencia, chave, modelo, serie, numero,
+                                     data_emissao, valor, cnpj_emitente, cnpj_destinatario, categoria, cfops, arquivo, gravado_em)
+                                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                                 ON CONFLICT (empresa, competencia, chave) DO UPDATE SET
+                                     modelo = excluded.modelo, serie = excluded.serie, numero = excluded.numero,
+                                     data_emissao = excluded.data_emissao, valor = excluded.valor,
+                                     cnpj_emitente = excluded.cnpj_emitente, cnpj_destinatario = excluded.cnpj_destinatario,
+                                     categoria = excluded.categoria, cfops = excluded.cfops, arquivo = excluded.arquivo,
+                                     gravado_em = excluded.gravado_em''',
+                              [pendente + (gravado_em,) for pendente in self.pendentes])
+        self.conn.execute("UPDATE versao_documentos_fiscais SET versao = versao + 1")
+        if confirmar:
+            self.conn.commit()
+        self.gravados += len(self.pendentes)
+        self.pendentes.clear()
+
+def versao_documentos(conn):
+    """ Muda a cada lote gravado; serve de chave para o cache dos indicadores fiscais. """
+    return conn.execute("SELECT versao FROM versao_documentos_fiscais").fetchone()[0]
+
+def filtro_empresa(empresa):
+    return ("WHERE empresa = ?", (empresa,)) if empresa else ("", ())
+
+def volume_por_mes(conn, empresa=None):
+    """ [{competencia, documento, documentos, valor}] por mês e modelo, do mês mais antigo ao mais recente. """
+    where, parametros = filtro_empresa(empresa)
+    cursor = conn.execute(f'''SELECT competencia,
+                                     CASE modelo WHEN '55' THEN 'NF-e' WHEN '65' THEN 'NFC-e' WHEN '57' THEN 'CT-e'
+                                                 ELSE modelo END AS documento,
+                                     COUNT(*) AS documentos, round(SUM(valor), 2) AS valor
+                              FROM documentos_fiscais {where}
+                              GROUP BY competencia, modelo ORDER BY competencia, modelo''', parametros)
+    return linhas_como_dicts(cursor)
+
+def valor_por_empresa(conn, competencia=None, limite=15):
+    """ As limite empresas de maior valor (na competência aaaa-mm, se dada), com documentos e ticket médio. """
+    where, parametros = ("WHERE competencia = ?", (competencia,)) if competencia else ("", ())
+    cursor = conn.execute(f'''SELECT empresa, COUNT(*) AS documentos, round(SUM(valor), 2) AS valor,
+                                     round(AVG(valor), 2) AS valor_medio
+                              FROM documentos_fiscais {where}
+                              GROUP BY empresa ORDER BY valor DESC LIMIT ?''', parametros + (limite,))
+    return linhas_como_dicts(cursor)
+
+def valor_por_cfop(conn, empresa=None, limite=15):
+    """ [{cfop, documentos, valor}] somando o valor dos itens de cada CFOP (vProd na NF-e, vTPrest no CT-e). """
+    where, parametros = filtro_empresa(empresa)
+    cursor = conn.execute(f'''SELECT cfop.key AS cfop, COUNT(*) AS documentos, round(SUM(cfop.value), 2) AS valor
+                              FROM documentos_fiscais, json_each(documentos_fiscais.cfops) AS cfop {where}
+                              GROUP BY cfop.key ORDER BY valor DESC LIMIT ?''', parametros + (limite,))
+    return linhas_como_dicts(cursor)
+
+def empresas_com_documentos(conn):
+    return [linha[0] for linha in conn.execute("SELECT DISTINCT empresa FROM documentos_fiscais ORDER BY empresa")]
@@ -0,0 +1,25 @@
+import os
+
+import streamlit as st
+
+
+def oferecer_download(arquivos, chave):
+    """
+    Download de um dos ZIPs em arquivos [(rótulo, caminho)]. O st.download_button lê o arquivo inteiro para a
+    memória a cada rerun em que aparece: por isso ele só é desenhado para o ZIP escolhido, depois de
+    "Preparar download", e deixa de ser desenhado assim que o download é feito.
+    """
+    arquivos = [(rotulo, caminho) for rotulo, caminho in arquivos if os.path.exists(caminho)]
+    if not arquivos:
+        return
+    preparado = f"{chave}_preparado"
+    rotulo, caminho = st.selectbox("Arquivo para download", arquivos, key=f"{chave}_arquivo",
+                                   format_func=lambda arquivo: f"{arquivo[0]} ({os.path.getsize(arquivo[1]) / 1024 / 1024:.1f} MiB)")
+    if st.session_state.get(preparado) != caminho:
+        if st.button("Preparar download", key=f"{chave}_preparar"):
+            st.session_state[preparado] = caminho
+            st.rerun()
+        return
+    with open(caminho, "rb") as arquivo_zip:
+        st.download_button(f"Baixar {rotulo}", arquivo_zip, os.path.basename(caminho), "application/zip",
+                           key=f"{chave}_baixar", on_click=lambda: st.session_state.pop(preparado, None))
@@ -0,0 +1,68 @@
+import csv
+import os
+
+from classificacao import apenas_digitos
+
+ARQUIVO_EMPRESAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "empresas.csv")
+# Pasta dos documentos cujo emitente/destinatário não está no cadastro.
+EMPRESA_NAO_IDENTIFICADA = "NAO_IDENTIFICADA"
+
+
+def criar_tabela_empresas(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS empresas (
+                        nome TEXT PRIMARY KEY,
+                        cnpj TEXT,
+                        cnpj_digitos TEXT)''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_empresas_cnpj ON empresas (cnpj_digitos)")
+    conn.commit()
+
+def importar_empresas(conn, caminho=ARQUIVO_EMPRESAS):
+    """ Sincroniza a tabela empresas com o CSV (nome;cnpj); um CNPJ vazio no CSV não apaga o já cadastrado. """
+    with open(caminho, newline="", encoding="utf-8") as f:
+        linhas = [(linha["nome"].strip(), linha["cnpj"].strip() or None) for linha in csv.DictReader(f, delimiter=";")]
+    conn.executemany('''INSERT INTO empresas (nome, cnpj, cnpj_digitos) VALUES (?, ?, ?)
+                        ON CONFLICT (nome) DO UPDATE SET cnpj = coalesce(excluded.cnpj, cnpj),
+                                                         cnpj_digitos = coalesce(excluded.cnpj_digitos, cnpj_digitos)''',
+                     [(nome, cnpj, apenas_digitos(cnpj) or None) for nome, cnpj in linhas if nome])
+    conn.commit()
+
+def carregar_empresas(conn):
+    """ {nome: cnpj formatado (ou None)}, em ordem alfabética. """
+    return dict(conn.execute("SELECT nome, cnpj FROM empresas ORDER BY nome").fetchall())
+
+def indice_por_cnpj(empresas):
+    """ Índice CNPJ (só dígitos) -> nome da empresa. """
+    return {apenas_digitos(cnpj): nome for nome, cnpj in empresas.items() if cnpj}
+
+def cadastro_empresas(conn):
+    """ Cria, sincroniza e carrega o cadastro; devolve (empresas, indice_por_cnpj). """
+    criar_tabela_empresas(conn)
+    importar_empresas(conn)
+    empresas = carregar_empresas(conn)
+    return empresas, indice_por_cnpj(empresas)
+
+def pasta_empresa(nome):
+    """ Nome da empresa como pasta do ZIP ('AML HOLDING S/A' não pode virar duas pastas). """
+    return nome.replace("/", "-").strip()
+
+def rotear_documento(resultado, indice, empresas_por_chave=None):
+    """
+    Decide as empresas de um documento pelo CNPJ: o destinatário cadastrado recebe o documento como entrada
+    e o emitente cadastrado, como saída; uma nota entre duas empresas do cadastro vai para as duas.
+    Eventos (cancelamento...) não trazem emit/dest: vão para as empresas já decididas para o documento da
+    chave (empresas_por_chave, chave de acesso -> nomes) e, sem ele, para o emitente da chave (posições 7 a 20).
+    Devolve [(nome da empresa, CNPJ usado)] ou [(EMPRESA_NAO_IDENTIFICADA, None)].
+    """
+    rotas = []
+    for campo in ("cnpj_destinatario", "cnpj_emitente"):
+        cnpj = apenas_digitos(resultado.get(campo))
+        if cnpj in indice and all(indice[cnpj] != nome for nome, _ in rotas):
+            rotas.append((indice[cnpj], cnpj))
+    if rotas:
+        return rotas
+    chave_acesso = apenas_digitos(resultado.get("chave"))
+    if empresas_por_chave and chave_acesso in empresas_por_chave:
+        return [(nome, None) for nome in empresas_por_chave[chave_acesso]]
+    if len(chave_acesso) == 44 and chave_acesso[6:20] in indice:
+        return [(indice[chave_acesso[6:20]], chave_acesso[6:20])]
+    return [(EMPRESA_NAO_IDENTIFICADA, None)]
@@ -3,34 +3,54 @@ import sqlite3
 import pandas as pd
 import datetime
 import os
-import plotly.express as px
 import shutil
-import zipfile
-import tempfile
-from io import BytesIO
+import time
+import uuid
+import plotly.express as px
+from collections import Counter, deque
+from arquivo_saida import LIMITE_MEMBRO_EM_MEMORIA, NIVEL_COMPRESSAO_PADRAO, ConstrutorZip
+from documentos_fiscais import (criar_tabela_documentos_fiscais, empresas_com_documentos, valor_por_cfop, valor_por_empresa,
+                                versao_documentos, volume_por_mes)
+from downloads import oferecer_download
+from empresas import cadastro_empresas, pasta_empresa
+from imagens_erro import criar_tabela_imagens, guardar_imagem, miniatura
+from ingestao import eh_zip, iterar_zip, nome_disponivel
+from metricas import (Medidor, criar_tabela_metricas, execucoes_mais_lentas, execucoes_recentes, gravar_execucao,
+                      tempo_por_etapa, ultima_execucao)
+from paralelo import processar_em_paralelo
+from regras import carregar_regras, explicar, ler_cabecalho
+from registros import buscar_registros, contagens, criar_tabela_registros, registros_do_dia, total_registros, versao_registros
 
 conn = sqlite3.connect("importa_register.db", check_same_thread=False)
 cursor = conn.cursor()
-cursor.execute('''CREATE TABLE IF NOT EXISTS registros (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    data TEXT,
-                    empresa TEXT,
-                    tipo_nota TEXT,
-                    erro TEXT,
-                    arquivo_erro TEXT,
-                    status TEXT DEFAULT 'Pendente')''')
-conn.commit()
+criar_tabela_registros(conn)
+criar_tabela_metricas(conn)
+criar_tabela_documentos_fiscais(conn)
+criar_tabela_imagens(conn)
+
+@st.cache_resource
+def carregar_cadastro():
+    """ Cadastro de empresas carregado uma vez por servidor e compartilhado entre as sessões. """
+    return cadastro_empresas(conn)
+
+empresas_cnpjs, _ = carregar_cadastro()
+nomes_empresas = list(empresas_cnpjs)
+
+@st.cache_resource
+def carregar_motor_regras():
+    """ Regras de classificação (regras_classificacao.json) compiladas uma vez por servidor. """
+    return carregar_regras()
+
+motor_regras = carregar_motor_regras()
+
+# ZIPs gerados em "Organizar Arquivos Fiscais", numa pasta por sessão: os botões de download são recriados
+# a cada rerun a partir daqui. Pastas de sessões mais antigas que RETENCAO_RESULTADOS segundos são apagadas.
+PASTA_RESULTADOS = "resultados_organizador"
+RETENCAO_RESULTADOS = 24 * 3600
+
+TIPOS_NOTA = ["NFE entrada", "NFE saída", "CTE entrada", "CTE saída", "CTE cancelado", "SPED", "NFS tomado", "NFS prestado", "Planilha", "NFCE saída"]
 
 #Organizador de Arquivos Fiscais
-def salvar_arquivo(arquivo, pasta_destino):
-    os.makedirs(pasta_destino, exist_ok=True)
-    caminho_completo = os.path.join(pasta_destino, arquivo.name)
-    with open(caminho_completo, "wb") as f:
-        f.write(arquivo.getbuffer())
-def extrair_zip(arquivo_zip, pasta_destino):
-    os.makedirs(pasta_destino, exist_ok=True)
-    with zipfile.ZipFile(arquivo_zip, 'r') as zip_ref:
-        zip_ref.extractall(pasta_destino)
 def verificar_arquivo(arquivo):
     try:
         if arquivo.name.endswith(".xml") or arquivo.name.endswith(".txt"):
@@ -40,93 +60,178 @@ def verificar_arquivo(arquivo):
         return True
     except Exception as e:
         return False
-def classificar_arquivo(nome_arquivo):
-    categorias = {
-        "NFE_ENTRADA": ["NFe", "entrada"],
-        "NFE_SAIDA": ["NFe", "saida"],
-        "CTE_ENTRADA": ["CTe", "entrada"],
-        "CTE_SAIDA": ["CTe", "saida"],
-        "CTE_CANCELADA": ["CTe", "cancelada"],
-        "NFCE_SAIDA": ["NFCe"],
-        "SPED": ["SPED"],
-        "NFS_TOMADOS": ["tomado" , "nfse"],
-        "NFS_PRESTADO": ["prestado"],
-        "PLANILHA": [".xls", ".xlsx"],
-        "TXT": [".txt"]
-    }
-    nome_arquivo_lower = nome_arquivo.lower()
-    for categoria, palavras_chave in categorias.items():
-        if any(palavra.lower() in nome_arquivo_lower for palavra in palavras_chave):
-            return categoria
-    return "OUTROS"
-def processar_arquivos(uploaded_files, nome_empresa):
+def pasta_resultado_sessao():
+    """ Pasta dos ZIPs desta sessão, recriada vazia; aproveita para apagar as de sessões antigas. """
+    if "pasta_resultado" not in st.session_state:
+        st.session_state["pasta_resultado"] = os.path.join(PASTA_RESULTADOS, uuid.uuid4().hex)
+    pasta = st.session_state["pasta_resultado"]
+    if os.path.isdir(PASTA_RESULTADOS):
+        limite = time.time() - RETENCAO_RESULTADOS
+        for nome in os.listdir(PASTA_RESULTADOS):
+            antiga = os.path.join(PASTA_RESULTADOS, nome)
+            if antiga != pasta and os.path.getmtime(antiga) < limite:
+                shutil.rmtree(antiga, ignore_errors=True)
+    shutil.rmtree(pasta, ignore_errors=True)
+    os.makedirs(pasta)
+    return pasta
+
+def processar_arquivos(uploaded_files, nome_empresa, nivel_compressao=NIVEL_COMPRESSAO_PADRAO, por_categoria=False):
     if not nome_empresa:
         st.error("Por favor, digite o nome da empresa antes de processar os arquivos.")
         return
     
-    with tempfile.TemporaryDirectory() as pasta_temp:
-        pasta_empresa = os.path.join(pasta_temp, nome_empresa)
-        os.makedirs(pasta_empresa, exist_ok=True)
-        arquivos_corrompidos = []
-        
-        for arquivo in uploaded_files:
-            if not verificar_arquivo(arquivo):
-                arquivos_corrompidos.append(arquivo.name)
-                continue
-            
-            if arquivo.name.endswith(".zip"):
-                pasta_extracao = os.path.join(pasta_empresa, "TEMP_ZIP")
-                os.makedirs(pasta_extracao, exist_ok=True)
-                
-                with open(os.path.join(pasta_extracao, arquivo.name), "wb") as f:
-                    f.write(arquivo.getbuffer())
-                
-                extrair_zip(os.path.join(pasta_extracao, arquivo.name), pasta_extracao)
-                
-                for raiz, _, arquivos in os.walk(pasta_extracao):
-                    for nome_arquivo in arquivos:
-                        caminho_arquivo = os.path.join(raiz, nome_arquivo)
-                        categoria = classificar_arquivo(nome_arquivo)
-                        pasta_destino = os.path.join(pasta_empresa, categoria)
-                        os.makedirs(pasta_destino, exist_ok=True)
-                        shutil.move(caminho_arquivo, os.path.join(pasta_destino, nome_arquivo))
-                
-                shutil.rmtree(pasta_extracao)
-            else:
-                categoria = classificar_arquivo(arquivo.name)
-                pasta_destino = os.path.join(pasta_empresa, categoria)
-                salvar_arquivo(arquivo, pasta_destino)
-        
-        if arquivos_corrompidos:
-            st.warning(f"Os seguintes arquivos estão corrompidos e não foram processados: {', '.join(arquivos_corrompidos)}")
-        
-        zip_buffer = BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for raiz, _, arquivos in os.walk(pasta_empresa):
-                for arquivo in arquivos:
-                    caminho_completo = os.path.join(raiz, arquivo)
-                    zipf.write(caminho_completo, os.path.relpath(caminho_completo, pasta_empresa))
-        zip_buffer.seek(0)
-        
-        st.success("Arquivos processados com sucesso! Faça o download abaixo.")
-        st.download_button("Baixar Arquivos Processados", zip_buffer, f"{nome_empresa}.zip", "application/zip")
+    st.session_state.pop("resultado_organizador", None)
+    caminho_saida = os.path.join(pasta_resultado_sessao(), f"{pasta_empresa(nome_empresa)}.zip")
+    arquivos_corrompidos = []
+    caminhos_usados = set()
+    regras_aplicadas = Counter()
+    cnpj_empresa = empresas_cnpjs.get(nome_empresa) or ""
+    total = 0
+    
+    # Membros já lidos, na ordem em que os cabeçalhos voltam do pool: (nome_arquivo, dados, date_time).
+    lidos = deque()
+
+    with Medidor() as medidor, ConstrutorZip(nivel_compressao, por_categoria, caminho_saida=caminho_saida) as construtor:
+        def destino(nome_arquivo, classificacao):
+            regras_aplicadas[classificacao] += 1
+            return nome_disponivel(f"{classificacao.categoria}/{nome_arquivo}", caminhos_usados)
+
+        def preparar():
+            """
+            Lê os arquivos enviados e gera (nome_arquivo, dados, cnpj_empresa) para ler_cabecalho no pool.
+            Membros acima de LIMITE_MEMBRO_EM_MEMORIA não passam pela memória: são classificados e copiados
+            em fluxo aqui mesmo, enquanto o ZIP enviado está aberto.
+            """
+            nonlocal total
+            for arquivo in uploaded_files:
+                with medidor.etapa("leitura"):
+                    valido = verificar_arquivo(arquivo)
+                if not valido:
+                    arquivos_corrompidos.append(arquivo.name)
+                    medidor.contar("leitura", erros=1)
+                    continue
+
+                if eh_zip(arquivo.name):
+                    arquivo.seek(0)
+                    for nome_arquivo, info, abrir in medidor.iterar("leitura", iterar_zip(arquivo), lambda membro: membro[1].file_size):
+                        if info.file_size == 0 and nome_arquivo.endswith((".xml", ".txt")):
+                            arquivos_corrompidos.append(nome_arquivo)
+                            medidor.contar("leitura", erros=1)
+                            continue
+                        if info.file_size > LIMITE_MEMBRO_EM_MEMORIA:
+                            with medidor.etapa("classificacao"):
+                                classificacao = motor_regras.classificar(nome_arquivo, abrir, cnpj_empresa)
+                            medidor.contar("classificacao", 1)
+                            caminho_destino = destino(nome_arquivo, classificacao)
+                            with medidor.etapa("gravacao"), abrir() as origem:
+                                construtor.adicionar_fluxo(caminho_destino, origem, info, classificacao.categoria)
+                            medidor.contar("gravacao", 1, info.file_size)
+                            total += 1
+                            continue
+                        with medidor.etapa("leitura"), abrir() as origem:
+                            dados = origem.read()
+                        lidos.append((nome_arquivo, dados, info.date_time))
+                        yield nome_arquivo, dados, cnpj_empresa
+                else:
+                    medidor.contar("leitura", 1, arquivo.size)
+                    dados = arquivo.getvalue()
+                    lidos.append((arquivo.name, dados, None))
+                    yield arquivo.name, dados, cnpj_empresa
+
+        # Só vão ao pool os arquivos cujo nome não basta (ex.: <chave>-nfe.xml); os demais saem com fatos vazios.
+        def decidido_pelo_nome(item):
+            return None if motor_regras.precisa_conteudo(item[0], cnpj_empresa) else {}
+
+        cabecalhos = processar_em_paralelo(preparar(), ler_cabecalho, pronto=decidido_pelo_nome)
+        for _, fatos in medidor.iterar("classificacao", cabecalhos, lambda par: len(par[0][1])):
+            nome_arquivo, dados, date_time = lidos.popleft()
+            classificacao = motor_regras.classificar(nome_arquivo, cnpj_empresa=cnpj_empresa, fatos=fatos or None)
+            caminho_destino = destino(nome_arquivo, classificacao)
+            with medidor.etapa("gravacao"):
+                construtor.adicionar(caminho_destino, dados, classificacao.categoria, date_time)
+            medidor.contar("gravacao", 1, len(dados))
+            total += 1
+        with medidor.etapa("finalizacao"):
+            arquivos_saida = construtor.finalizar()
+    gravar_execucao(conn, medidor, "fsc", nome_empresa)
+    for arquivo_zip in arquivos_saida.values():
+        arquivo_zip.close()
+    
+    duracao = medidor.segundos
+    st.session_state["resultado_organizador"] = {
+        "corrompidos": arquivos_corrompidos,
+        "resumo": f"{total} arquivos em {duracao:.2f}s ({total / duracao if duracao else 0:.1f} arquivos/s) — {medidor.resumo()}",
+        "regras": [{"Regra": explicar(classificacao), "Arquivos": quantidade}
+                   for classificacao, quantidade in regras_aplicadas.most_common()],
+        "arquivos": [(grupo, arquivo_zip.name) for grupo, arquivo_zip in arquivos_saida.items()],
+    }
+
+def mostrar_resultado():
+    """ Resumo e downloads do último processamento da sessão; sobrevive aos reruns causados pelos próprios downloads. """
+    resultado = st.session_state.get("resultado_organizador")
+    if not resultado:
+        return
+    if resultado["corrompidos"]:
+        st.warning(f"Os seguintes arquivos estão corrompidos e não foram processados: {', '.join(resultado['corrompidos'])}")
+    
+    st.success("Arquivos processados com sucesso! Faça o download abaixo.")
+    st.caption(resultado["resumo"])
+    with st.expander("Regras de classificação aplicadas"):
+        st.dataframe(pd.DataFrame(resultado["regras"]), hide_index=True)
+    oferecer_download([(grupo or "Arquivos Processados", caminho) for grupo, caminho in resultado["arquivos"]],
+                      "download_organizador")
+
+# As chaves de versão só crescem: uma entrada antiga nunca mais é lida e o max_entries a descarta.
+@st.cache_data(max_entries=1)
+def carregar_indicadores(versao):
+    """ Lê as contagens já agregadas; a versão muda a cada alteração em registros e invalida o cache. """
+    return {
+        "total": total_registros(conn),
+        "empresa": contagens(conn, "empresa"),
+        "tipo_nota": contagens(conn, "tipo_nota"),
+        "erro": contagens(conn, "erro", limite=5),
+    }
+
+@st.cache_data(max_entries=1)
+def carregar_desempenho(ultima):
+    """ Métricas das execuções do organizador; o id da última execução invalida o cache. """
+    return {
+        "execucoes": execucoes_recentes(conn),
+        "etapas": tempo_por_etapa(conn),
+        "lentas": execucoes_mais_lentas(conn),
+    }
+
+# Uma entrada por empresa filtrada (mais a de todas), na versão atual.
+@st.cache_data(max_entries=20)
+def carregar_documentos_fiscais(versao, empresa):
+    """ Agregados de documentos_fiscais; a versão muda a cada lote gravado e invalida o cache. """
+    return {
+        "mensal": volume_por_mes(conn, empresa),
+        "por_empresa": valor_por_empresa(conn),
+        "cfop": valor_por_cfop(conn, empresa),
+    }
 
 # Menu
 menu = st.sidebar.selectbox("Escolha a funcionalidade", ["Organizar Arquivos Fiscais", "Controle Importação","Registros Importação", "Indicadores"])
 
 if menu == "Organizar Arquivos Fiscais":
     st.title("Organizador de Arquivos Fiscais")
-    nome_empresa = st.selectbox("Nome da Empresa" , ["2B COMBUSTIVEL LTDA", "A REDE GESTAO PATRIMONIAL LTDA", "A.M CHEQUER IMOVEIS LTDA", "A.R. PARTICIPACOES LTDA", "ABEL CONSTRUTORA LTDA", "ABEL SEMINOVOS LTDA", "ACOLOG LOGISTICA LTDA", "ACOS SERVICOS DE PROMOCAO LTDA", "ACR GESTAO PATRIMONIAL LTDA", "ADCAR SERVICO DE ESCRITORIO E APOIO ADMINISTRATIVO LTDA", "ADR MOBILIDADE E SERVICOS LTDA", "ADS COMERCIO E IMPORTACAO E EXPORTACAO EIRELI", "AESA PARTICIPAÇÕES LTDA", "AGM ESQUADRIAS LTDA", "AGP03 EMPREENDIMENTOS IMOBILIARIOS SPE LTDA", "AGP03 EMPREENDIMENTOS IMOBILIARIOS SPE LTDA FILIAL 02-82", "AGP03 EMPREENDIMENTOS IMOBILIARIOS SPE LTDA SCP RESIDENCIAL CAPARAO", "AGP05 ARGON EMPREENDIMENTOS IMOBILIARIOS SPE LTDA", "AGROPECUARIA BONANZA LTDA", "AGT01 MORADA NOVA DE MINAS SPE LTDA", "AGT01 MORADA NOVA DE MINAS SPE LTDA FILIAL 02-52", "AGUIA 8 COMERCIO DE COMBUSTIVEIS LTDA", "AGUIA IV COMERCIO DE COMBUSTIVEIS LTDA", "AGUIA IX COMERCIO DE COMBUSTIVEIS LTDA", "AGUIA V COMERCIO DE COMBUSTIVEIS LTDA", "ALLOTECH CONSULTORIA EM PRODUCAO INDUSTRIAL LTDA", "ALVES E SANTOS PARTICIPACOES LTDA", "AMH COMERCIO E SERVICOS LTDA", "AML HOLDING S/A", "AMMC PARTICIPACOES LTDA", "AMPLUS PARTICIPACOES SA", "AMX GESTÃO PATRIMONIAL LTDA", "ANF EMPREENDIMENTOS E PARTICIPACOES LTDA", "ANITA CHEQUER PARTICIPACOES LTDA", "ANITA CHEQUER PATRIMONIAL LTDA", "APL ADMINISTRACAO E PARTICIPACOES LTDA", "APMG PARTICIPACOES S/A", "ARCI PARTICIPACOES LTDA", "ARCI PATRIMONIAL LTDA", "ARGON ENGENHARIA LTDA", "ARNDT PATRIMONIAL LTDA", "ARNDT REFORMAS E MANUTENCOES LTDA", "ARNDT, TRAVASSOS E MORRISON SPE LTDA", "ARTMIX HOLDING LTDA", "AUMAR PRESTACAO DE SERVICOS ADMINISTRATIVOS LTDA", "AUTO POSTO ALELUIA LTDA", "AUTO POSTO ALELUIA LTDA FILIAL 02-46", "AUTO POSTO CENTENARIO LTDA", "AUTO POSTO DAS LAJES LTDA", "AUTO POSTO DOM BOSCO LTDA", "AUTO POSTO MAQUINE LTDA", "AUTO POSTO MARIO CAMPOS COMERCIO DE COMBUSTIVEIS LTDA", "AUTO POSTO PORTAL DO NORTE LTDA", "AUTO POSTO VERONA LTDA", "AUTOREDE LOCADORA DE VEICULOS LTDA", "AUTOREDE PARTICIPACOES LTDA", "AXJ PARTICIPACOES EIRELI", "AXP GESTAO PATRIMONIAL LTDA", "AZEVEDO & CIA", "BARAO VPP CONVENIENCIAS LTDA", "BARTELS DERMATOLOGIA ESTETICA E LASER LTDA", "BEL DISTRIBUIDOR DE LUBRIFICANTES LTDA", "BEL DISTRIBUIDOR DE LUBRIFICANTES LTDA FILIAL 02-79", "BEL LUBRIFICANTES ESPECIAIS LTDA", "BELTMORE PARTICIPACOES LTDA", "BEMX - PARTICIPACOES E EMPREENDIMENTOS LTDA", "BIOCLINTECH CIENTIFICA LTDA", "BIOCLINTECH LTDA", "BIOCLINTECH MANUTENCAO LTDA", "BLUE SKY PARTICIPACOES LTDA", "BMC EDITORA LTDA", "BMGL PARTICIPACOES E EMPREENDIMENTOS IMOBILIARIOS LTDA", "BOA VISTA ASSESSORIA LTDA", "BOA VISTA BOCAIUVA HOTEL LTDA", "BORA EMBALAGENS LTDA", "BRANT EMPREENDIMENTOS LTDA", "BRASIL CONCRETO LTDA", "BRAZIL MANIA LTDA", "BRB TRANSPORTES LTDA", "BRM COMERCIO DE VEICULOS LTDA", "BRM COMERCIO DE VEICULOS LTDA FILIAL 02-24", "BROMELIAS GESTAO PATRIMONIAL LTDA", "BURITIS CONVENIENCIA LTDA", "BV DISTRIBUIDORA LTDA", "CAD COMERCIAL DE MAQUINAS LTDA", "CAMPO ALEGRE PARTICIPACOES LTDA", "CAPITAO COMERCIO DE COMBUSTIVEIS LTDA", "CASA NOVA SPE LTDA", "CASA SEMPRE VIVA COMERCIO DE MATERIAIS DE CONSTRUCAO LTDA", "CASCALHO PARTICIPACOES LTDA", "CATIRA INTERMEDIACOES DE NEGOCIOS LTDA", "CCA COMERCIAL DE COMBUSTIVEIS AUTOMOTIVOS LTDA", "CDI NUCLEAR LTDA", "CDVM LTDA", "CELT -COMERCIO DE COMBUSTIVEIS E LUBRIFICANTES LTDA", "CENTER POSTO LTDA", "CENTER POSTO LTDA FILIAL 02-12", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 02-49", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 04-00", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 05-91", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 07-53", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 09-15", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 10-59", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 11-30", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 14-82", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 17-25", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 19-97", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 20-20", "CGA SERVICOS MEDICOS LTDA", "CGI - EMPREENDIMENTOS COMERCIAL LTDA", "CHAVE DE OURO EMPREENDIMENTOS IMOBILIARIOS EIRELI", "CHEL LTDA", "CHEQUER & COELHO LTDA", "CIA ITABIRITO INDUSTRIAL FIACAO E TECELAGEM DE ALGODAO", "CIAZA CONSTRUTORA LTDA", "CLAM CONSULTORIA LTDA", "CLAM ENGENHARIA LTDA", "CLAM ENGENHARIA LTDA FILIAL 03-00", "CLAM ESG LTDA", "CLAM MEIO AMBIENTE LTDA", "CLAM MEIO AMBIENTE LTDA FILIAL 02-49", "CLAM MONITORAMENTO AMBIENTAL LTDA", "CLAM MONITORAMENTO AMBIENTAL LTDA", "CLAM PARTICIPACOES E INVESTIMENTOS S/A", "CLINICA LEV SAVASSI LTDA", "CLINICA RADIOLOGICA ELDORADO LTDA", "CLINICA UNIAO SERVICOS MEDICOS LTDA", "COELHO CONVENIENCIA LTDA", "COELHO E PEREIRA EIRELI", "COLISEU SERVICOS ADMINISTRATIVOS LTDA", "COMERCIAL AVIAMENTOS LTDA", "COMERCIAL FOCCUS LTDA", "COMERCIAL GIULIANO LIMITADA", "COMERCIAL OLIVEIRA & BRANT LTDA", "COMERCIAL OLIVEIRA & BRANT LTDA", "COMERCIO LANCHE KARRAO LTDA", "CONSORCIO ENGEBRAS ILCON SES 0620240094", "CONSORCIO GERASUN SOLAR", "CONSTANTINO MATIAS NOGUEIRA - IMOVEIS", "CONSTANTINO MATIAS NOGUEIRA - PATRIMONIAL LTDA", "CONSTRUTORA AGMAR LTDA", "CONSTRUTORA AGMAR LTDA", "CONSTRUTORA AGMAR LTDA FILIAL 02-10", "CONSTRUTORA E INCORPORADORA SPLIT LTDA", "CONTABILIDADE LTDA", "CONVENIENCIA DOIS IRMAOS - EIRELI", "CONVENIENCIA DOIS IRMAOS LTDA", "CORRETORA DE SEGUROS BELO HORIZONTE LTDA", "CRISTAL VALLE ADMINISTRACAO LTDA", "CRISTAL VALLE INDUSTRIA E COMERCIO DE VIDROS LTDA", "CSV GESTAO PATRIMONIAL LTDA", "CVQ I SPE LTDA", "CVQ II SPE LTDA", "D.L.A. SERVICOS ADMINISTRATIVOS LTDA", "DEBURR COMERCIO DE COSMETICOS LTDA", "DEL PAPEIS LTDA", "DEL PAPEIS LTDA FILIAL 03-84", "DELMA - COMERCIO DE COMBUSTIVEIS LTDA", "DH ORIGINAL IMPORTACAO E EXPORTACAO LTDA", "DISTRIBUIDORA BIOCLIN DIAGNOSTICA LTDA", "DJB PARTICIPACOES LTDA", "DOBRAFLEX CORTE E DOBRA DE METAIS LTDA", "DVS PARTICIPACOES LTDA", "E.D. TECNOLOGIA DIGITAL BH LTDA", "EAGLE ADMINISTRACAO LTDA", "EDIFICIO REDE OFFICE I", "ELETROFERRAGENS RM EIRELI", "EMAG CONSTRUTORA LTDA", "EMAG CONSTRUTORA LTDA", "EMIS MINAS DISTRIBUIDORA DE PRODUTOS FARMACEUTICOS LTDA", "EMP - AVALIACAO EM RECURSOS HUMANOS LTDA", "EMPIRE DJB PATRIMONIAL LTDA", "ENERGY TRANSPORTES LTDA", "ENGEBRAS CONSTRUTORA LTDA", "ESMIG INDUSTRIA DE ESCADAS LTDA", "ESMIG INDUSTRIA DE ESCADAS LTDA FILIAL 03-89", "ESTACIONAMENTO AGMAR LTDA", "ESTACIONAMENTO AGMAR LTDA FILIAL 02-06", "ESTACIONAMENTO AGMAR LTDA FILIAL 03-89", "ESTACIONAMENTO AGMAR LTDA FILIAL 04-60", "ESTIVA PARTICIPACOES LTDA", "EVELINE DE PAULA BARTELS", "EVERYBODY - CENTRO DE PERFORMANCE E FISIOTERAPIA LTDA", "EVOLUTION CONSULTORIA E GESTAO EMPRESARIAL S/A", "EXPRESSO FERRENSE LTDA", "FAST GESTAO DE RECURSOS LTDA", "FAST TEAM SERVICOS DE ESTETICA AUTOMOTIVA LTDA", "FASTPLOT SERVICOS DE ESTETICA AUTOMOTIVA LTDA", "FATIMA ADMINISTRACAO LTDA", "FCF CONSULTORIA LTDA", "FCK PREMOLDADOS LTDA FILIAL 02", "FCK PREMOLDADOS LTDA FILIAL 03", "FCK PREMOLDADOS LTDA", "FCK TRANSPORTES LTDA", "FEAG - FERRAGENS AGMAR PARA FACHADA EIRELI", "FERREIRA ADMINISTRACAO LTDA", "FERRO E ACO TAKONO LTDA", "FERRO E ACO TAKONO LTDA FILIAL 0028-03", "FERRO E ACO TAKONO LTDA FILIAL 06-06", "FERRO E ACO TAKONO LTDA FILIAL 07-89", "FERRO E ACO TAKONO LTDA FILIAL 08-60", "FERRO E ACO TAKONO LTDA FILIAL 10-84", "FERRO E ACO TAKONO LTDA FILIAL 11-65", "FERRO E ACO TAKONO LTDA FILIAL 12-46", "FERRO E ACO TAKONO LTDA FILIAL 13-27", "FERRO E ACO TAKONO LTDA FILIAL 14-08", "FERRO E ACO TAKONO LTDA FILIAL 15-99", "FERRO E ACO TAKONO LTDA FILIAL 16-70", "FERRO E ACO TAKONO LTDA FILIAL 18-31", "FERRO E ACO TAKONO LTDA FILIAL 19-12", "FERRO E ACO TAKONO LTDA FILIAL 20-56", "FERRO E ACO TAKONO LTDA FILIAL 21-37", "FERRO E ACO TAKONO LTDA FILIAL 22-18", "FERRO E ACO TAKONO LTDA FILIAL 23-07", "FERRO E ACO TAKONO LTDA FILIAL 24-80", "FERRO E ACO TAKONO LTDA FILIAL 25-60", "FERRO E ACO TAKONO LTDA FILIAL 26-41", "FERRO E ACO TAKONO LTDA FILIAL 27-22", "FIX MANUTENCAO PREDIAL LTDA", "FIX MANUTENCOES LTDA", "FLARA GESTAO PATRIMONIAL LTDA", "FMPL PARTICIPACOES LTDA", "FORTRESS GESTAO PARTICIPACOES LTDA", "FRADE PARTICIPACOES LTDA", "FS PROCESSAMENTO DE DADOS LTDA", "GAMA SERV LTDA", "GECORP GESTAO DE BENEFICIOS E CORRETORA DE SEGUROS LTDA", "GENETICENTER - CENTRO DE GENETICA LTDA", "GERTH CONSULTORIA E PROMOCOES DE VENDAS LTDA", "GFF ENGENHARIA LTDA", "GIBRALTAR HOLDING LTDA", "GIOVANNI CARLECH GUIMARAES MARQUEZANI", "GMAC ESTACIONAMENTOS LTDA", "GMB ASSESSORIA LTDA", "GNV SETE BELO LTDA", "GPK PARTICIPACOES LTDA", "GR COMBUSTIVEIS LTDA", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA FILIAL 03-50", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA FILIAL 04-31", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA FILIAL 05-12", "GROUND GESTAO PATRIMONIAL LTDA", "GSC GESTAO PATRIMONIAL LTDA", "GUIMARAES & VIEIRA DE MELLO SOCIEDADE DE ADVOGADOS", "GUIMARAES E VIEIRA DE MELLO ADVOGADOS", "GVM ADMINISTRACAO E CONSULTORIA LTDA", "GVM CONSORCIO", "GVM CORRETORA DE SEGUROS LTDA", "GWS ENGENHARIA LTDA", "GWS TECH LTDA", "H.C.-COMERCIO DE ALIMENTOS LTDA", "H.C.-COMERCIO DE ALIMENTOS LTDA", "HAND SHOP SUPRIMENTOS MEDICOS E TERAPEUTICOS LTDA", "HC COMERCIO DE ALIMENTOS LTDA", "HC COMERCIO DE ALIMENTOS LTDA FILIAL 03-63", "HOLDING MAIS MABC LTDA", "HOTEL SAO BENTO LTDA", "HPX PARTICIPACOES LTDA", "HSP GESTAO PATRIMONIAL LTDA", "HVAR INCORPORACOES LTDA", "I9 GESTAO E PARTICIPACOES LTDA", "IB COMBUSTIVEL LTDA", "IB TRANSPORTES & EMPREENDIMENTOS LTDA", "INCONFIDENTES PARTICIPACOES LTDA", "INCORPORADORA MONTE VERDE SPE LTDA", "INDUSTRIA DE TRANSFORMADORES KING LIMITADA", "INFLUXO SOCIEDADE DE PROFISSIONAIS", "INSTITUTO PERSONA INTELIGENCIA EMOCIONAL LTDA", "INTERWEG ADM E CORRETORA DE SEGUROS LTDA", "INTERWEG CORRETORA DE SEGUROS E BENEFICIOS LTDA", "J.V.V. GESTAO PATRIMONIAL LTDA", "JACL PARTICIPACOES LTDA", "JARDINO MALL LTDA", "JCA SERVICOS DE RADIOLOGIA LTDA", "JCM PARTICIPACOES LTDA", "JHCL GESTAO PATRIMONIAL LTDA", "JJA LOCACOES LTDA", "JKV GESTAO PATRIMONIAL LTDA", "JPAMACEDO E PARTICIPACOES LTDA", "JR LAVA JATO EIRELI", "JVC PARTICIPACOES LTDA", "JVP GESTAO PATRIMONIAL LTDA", "K10 PARTICIPACOES LTDA", "KALAB LOPES GESTAO PATRIMONIAL LTDA", "KALAB NEGOCIOS IMOBILIARIOS LTDA", "L.O. IMPORT EXPORT LTDA", "LABORATORIO DE PATOLOGIA CIRURGICA E CITOPATOLOGIA LTDA", "LABORATORIO DE PATOLOGIA CIRURGICA E CITOPATOLOGIA LTDA FILIAL 03-44", "LETOM EMPREENDIMENTOS LTDA", "LGX - PARTICIPACOES E ADMINISTRACAO LTDA", "LINK INDUSTRIA E COMERCIO DE MAQUINAS PARA MINERACAO LTDA", "LINK INDUSTRIA E COMERCIO DE MAQUINAS PARA MINERACAO LTDA FILIAL 03-05", "LOCS LOCADORA DE VEICULOS LTDA", "LS ENTERPRISE SOLLUTIONS LTDA", "M A B COSTA LTDA", "M L SILVEIRA SERVICOS CORPORATIVOS EIRELI", "MADA CLINICA ODONTOLOGICA LTDA", "MAIS CONSTRUCOES LTDA", "MAIS NEGOCIOS E REPRESENTACOES LTDA", "MAQUINAS RABELLO ITABAYANA LIMITADA", "MAR UP CONSULTORIA GESTAO E REPRESENTACAO COMERCIAL LTDA", "MAR9 TRATAMENTO DE DADOS LTDA", "MARCHALENTA AUTO SERVICOS LTDA", "MARCHALIVRE SERVICOS E PECAS LTDA", "MARCO GRILLI COMERCIO DE OBJETOS DE ARTE LTDA", "MARIA CHEQUER PARTICIPACOES LTDA", "MARIA CHEQUER PATRIMONIAL LTDA", "MARIANA CARLECH GUIMARAES MARQUEZANI", "MARICABI GESTAO PATRIMONIAL LTDA", "MASSIME DISTRIBUIDORA DE MEDICAMENTOS LTDA", "MASTER AUTO POSTO LTDA", "MASTER EMPREENDIMENTOS E PARTICIPACOES LTDA", "MASTER PISOS MATERIAL DE CONSTRUCAO EIRELI", "MATTA NUNES REPRESENTACOES COMERCIAIS E GESTAO DE NEGOCIOS LTDA", "MAX GESTAO PATRIMONIAL LTDA", "MD EMPREENDIMENTOS S.A", "MEDWAY SOLUCOES PARA A SAUDE LTDA", "MENDONCA E FERREIRA PARTICIPACOES LTDA", "MENDONCA E FERREIRA PATRIMONIAL LTDA", "MENDONCA E FILHOS GESTAO PATRIMONIAL LTDA", "MENDONCA PARTICIPACOES LTDA", "MEROS GESTAO PATRIMONIAL LTDA", "MG CONVENIENCIA LTDA", "MG CONVENIENCIA LTDA FILIAL 02-57", "MICRONIC COMERCIO E INDUSTRIA LTDA", "MILENE GUIMARAES MARQUEZANI", "MINAS GERAIS ADMINISTRADORA DE IMOVEIS LTDA", "MINEIRAO POSTO DE SERVICOS LTDA", "MLM HOLDING EIRELI", "MM COMERCIO DE DERIVADOS DE PETROLEO LTDA", "MMORAES PARTICIPACOES LTDA", "MONTE VERDE EDIFICACOES I SPE LTDA", "MONTE VERDE URBANIZACOES SPE LTDA", "MP INCORPORACOES LTDA", "MRI MOVIMENTACAO E RECUPERACAO INDUSTRIAL LTDA", "MRLIZ CONSULTORIA LTDA", "MTL PARTICIPACOES LTDA", "MULT SERVICOS ADMINISTRATIVOS LTDA", "MWA PARTICIPACOES LTDA", "MWA PATRIMONIAL LTDA", "NACIONAL RENOVAVEIS LTDA", "NATUREZA X COMERCIO LTDA", "NOSSA OBRA VAREJO DIGITAL LTDA", "NRSM REFORMAS LTDA", "NVB SERVICOS LTDA", "OLE PARTICIPACOES LTDA", "OLIVEIRA SANTOS ADVOGADOS", "OPEN-5 LTDA", "OPEN-5 LTDA", "OPX PARTICIPACOES LTDA", "ORGANIZACAO COMERCIAL MARINHO LTDA", "ORGANIZACOES SOUKI EIRELI", "ORGANIZACOES SOUKI EIRELI FILIAL 03-32", "ORIENT AUTOMOVEIS PECAS E SERVICOS LTDA", "ORIENT AUTOMOVEIS PECAS E SERVICOS LTDA FILIAL 03-43", "ORIENT AUTOMOVEIS PECAS E SERVICOS LTDA FILIAL 04-24", "ORIENTE FARMACEUTICA COMERCIO IMPORTACAO E EXPORTACAO LTDA", "PADUA COMERCIO E INDUSTRIA LTDA", "PAIVA BRANT LTDA", "PAIVA EMPREENDIMENTOS E GESTAO DE IMOVEIS PROPRIOS LTDA", "PCFORYOU LTDA", "PEMAX INTERMEDIACAO E NEGOCIOS LTDA", "PERFORMANCE GESTAO EMPRESARIAL LTDA", "PETRODATA PROCESSAMENTO DE DADOS LTDA", "PLATAFORMA AM3 LTDA", "PNEUS JUA COMERCIO DE PNEUS LTDA", "PONTUAUTO CENTRO AUTOMOTIVO LTDA", "POP EMPREENDIMENTOS E PARTICIPACOES S/A", "POSTO AEROPORTO LTDA", "POSTO AGUIA COMERCIO DE COMBUSTIVEIS LTDA", "POSTO ALAMO LTDA", "POSTO ALLGAS LTDA", "POSTO AVENIDA BRASIL COMERCIO DE COMBUSTIVEIS LTDA", "POSTO BALNEARIO AGUA LIMPA LTDA", "POSTO BARAO VPP LTDA", "POSTO BERIMBAU LTDA", "POSTO BURITIS LTDA", "POSTO CATEDRAL LTDA", "POSTO CENTER NORTE LTDA", "POSTO COELHO LTDA", "POSTO DANUBIO LTDA", "POSTO DE COMBUSTIVEIS CENTER SUL LTDA", "POSTO DE COMBUSTIVEIS SANTO AGOSTINHO LTDA", "POSTO DE COMBUSTIVEL PETROLANDIA LTDA", "POSTO DE COMBUSTIVEL VILA CRUZEIRO LIMITADA", "POSTO ESTORIL LTDA", "POSTO FORMULA BR LTDA", "POSTO HUGO WERNECK LTDA", "POSTO IPE COMERCIO DE COMBUSTIVEIS LTDA", "POSTO IRMAOS AULER LTDA", "POSTO JUPITER LTDA", "POSTO LESTE LTDA", "POSTO MARIO WERNECK LIMITADA", "POSTO MAURITANIA LTDA", "POSTO MINAS SHOPPING LTDA", "POSTO MINASLANDIA LTDA", "POSTO MONTE VERDE LTDA", "POSTO MUSTANG LTDA", "POSTO NOGUEIRINHA LTDA", "POSTO OCEANO AZUL LTDA", "POSTO OCEANO LTDA", "POSTO PANAMERA LTDA", "POSTO PARQUE BURITIS LTDA", "POSTO PARQUE JARDIM LTDA", "POSTO PICA PAU LTDA", "POSTO POETA LTDA", "POSTO PORTAL DE BETIM LTDA", "POSTO PORTAL DE CONTAGEM LTDA", "POSTO PORTAL DOS CAICARAS LTDA", "POSTO SIGMA LTDA", "POSTO SOBERANO AUTORAMA LTDA", "POSTO SOBERANO KARRAO LTDA", "POSTO SOBERANO SETE DE SETEMBRO LTDA", "POSTO TATIANA LTDA", "POSTO TROVAO LTDA", "POSTO VIA FERNAO DIAS LTDA", "POSTO VILA CHALE LTDA", "POSTO VILA DA SERRA LTDA", "POSTO VILA PICA PAU LTDA", "POSTO ZEPPE GRAND PRIX LTDA", "POSTO ZEPPE MG LTDA", "POSTO ZEPPE OASIS LTDA", "POSTO ZEPPE SAO JOSE LTDA", "POSTO ZEPPELIN LTDA", "PPML INDUSTRIA E COMERCIO DE ROUPAS EIRELI", "PRESERVAR PARTICIPACOES LTDA", "PRIMA LINEA AUTOMOVEIS LTDA", "PRIMOLA FRAGRANCIAS LTDA FILIAL 04-30", "PROFIT FOODS LTDA", "PROJETOUM COMERCIO E REPRESENTACOES LTDA", "PROJETOUM COMERCIO E REPRESENTACOES LTDA FILIAL 0002-27", "PROPELLER LTDA", "PROSERVICE LTDA", "PROSPECTIVA SOCIEDADE DE PROFISSIONAIS", "PURA SAUDE ALIMENTOS LTDA", "PURA SAUDE ALIMENTOS LTDA FILIAL 02-88", "QUADRIJET ALPHAVILLE COMERCIO LTDA", "QUEOPZ GESTAO PATRIMONIAL LTDA", "QUIBASA QUIMICA BASICA LTDA", "QUIBASA QUIMICA BASICA LTDA FILIAL 02-98", "QUIBASA QUIMICA BASICA LTDA FILIAL 03-79", "QUICK CONVENIENCIAS LTDA", "QUICK LUBE COMERCIO DE PRODUTOS E FRANQUIAS LTDA", "RACCO EQUIPAMENTOS E SERVICOS EIRELI", "RACCO SERVICOS DE PUBLICIDADE E COMUNICACAO LTDA", "RC INVEST PARTICIPACOES LTDA", "RECICLAGEM PASSARELA LTDA", "REDE A PUBLICIDADE E PROPAGANDA LTDA", "REDE OFFICE INCORPORACOES LTDA", "RESIDENCIAL ANDORINHAS SPE LTDA", "RESIDENCIAL PACIFICO RIBEIRAO DAS NEVES SPE LTDA", "RESIDENCIAL PACIFICO RIBEIRAO DAS NEVES SPE LTDA FILIAL 02-72", "RESIDENCIAL VILA AMAZONAS SPE LTDA","RESIDENCIAL VILA AMAZONAS SPE LTDA FILIAL 02-91", "RESIDENCIAL VILA ATLANTICO SABARA SPE LTDA", "RESIDENCIAL VILA ATLANTICO SABARA SPE LTDA", "RESIDENCIAL VILA CONCEICAO SPE LTDA", "RESIDENCIAL VILA CONCEICAO SPE LTDA FILIAL 02-01", "RESIDENCIAL VILA MORGANTI I SCP", "RESIDENCIAL VILA MORGANTI I SPE LTDA", "RESIDENCIAL VILA MORGANTI I SPE LTDA FILIAL 02-05", "RESIDENCIAL VILA SAO JOSE I SPE LTDA", "RESIDENCIAL VILA SAO JOSE I SPE LTDA FILIAL 02-64", "RESIDENCIAL VILA SAO JOSE II SPE LTDA", "RESIDENCIAL VILA SAO JOSE II SPE LTDA FILIAL 0002-01", "RESIDENCIAL VILA SAO JOSE SCP", "RETES IMAGENS SERVICOS E CONSULTORIA LTDA", "RFX ADMINISTRACAO DE RECURSOS LTDA", "RFX CONSULTORIA E GESTAO DE NEGOCIOS LTDA", "RFX DISTRIBUIDORA DE PRODUTOS AUTOMOTIVOS LTDA", "RFX GESTAO PATRIMONIAL LTDA", "RFX LOGISTICA E TRANSPORTES DE COMBUSTIVEIS LTDA", "RFX TREINAMENTO PROFISSIONAL LTDA", "RGGC EMPREENDIMENTOS LTDA", "RH CENTRO DE SAUDE LTDA", "RICARDO SANTOS BRANT", "ROCKET GESTAO PATRIMONIAL LTDA", "ROL COMERCIO DE DERIVADOS DE PETROLEO LTDA", "RPB COMERCIO DE COMBUSTIVEL LTDA", "RSM COMERCIO E GERENCIAMENTO DE RESIDUOS GUAXUPE EIRELI", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SANTA CLARA AGROPECUARIA LTDA", "SANTA MARIA ECOLOGIC EQUIPAMENTOS LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC RESIDUOS LTDA", "SANTORINI POSTO DE SERVICOS LTDA", "SARAMENHA ENGENHARIA LTDA", "SCP AUDITORIA DE IMPOSTOS E CONTRIBUICOES", "SCP CLAM ENGENHARIA LTDA", "SCP CLINICA RADIOLOGICA ELDORADO LTDA", "SCP DIAGNOSTICO BETIMBARREIRO LTDA", "SCP RESIDENCIAL VILA CONCEICAO", "SCP VILA PACIFICO SANCRUZA", "SE LOTEAMENTOS LTDA", "SETEC- CONSULTORIA EMPRESARIAL LTDA", "SICAL INDUSTRIAL LTDA", "SIMEX ENTREGAS E MOVIMENTACAO DE CARGAS LTDA", "SIX TRACKS LTDA", "SOBERANO LOJAS DE CONVENIENCIA LTDA", "SOBERANO LUBRIFICANTES LTDA", "SOBERANO SERVICOS LTDA", "SOBERANO TRANSPORTES LTDA", "SOLAR VOLT SOLUCOES COMERCIO E INSTALACAO PARA ENERGIA LTDA", "SOLUCAO CORTE E DOBRA DE METAIS LTDA", "SOLVE OPERACAO, MANUTENCAO E COMISSIONAMENTO DE SISTEMAS FOTOVOLTAICOS LTDA", "SOLVIA SOLUCOES VIARIAS LTDA", "SP IMPORTS LTDA", "SP IMPORTS LTDA FILIAL 02-70", "SP IMPORTS LTDA FILIAL 03-50", "SPE JARDINS DOS BURITIS LTDA", "SPE JARDINS DOS BURITIS LTDA FILIAL 02-60", "SPE LA BRESSE LTDA", "SPE MARIA FAUSTINA LTDA", "SPE MIRANTE DO LAGO SETE LAGOAS LTDA", "SSME EMPREENDIMENTOS IMOBILIARIOS LTDA FILIAL 02-76", "SSME EMPREENDIMENTOS IMOBILIARIOS LTDA", "SSME FLORESTAL LTDA", "SSME FLORESTAL LTDA FILIAL 0002-43", "SSME FLORESTAL LTDA FILIAL 0003-24", "SSME FLORESTAL LTDA FILIAL 0005-96", "SSME FLORESTAL LTDA FILIAL 0006-77", "SSME FLORESTAL LTDA FILIAL 0007-58", "SSME FLORESTAL LTDA FILIAL 0008-39", "SSME FLORESTAL LTDA FILIAL 0009-10", "SSME FLORESTAL LTDA FILIAL 0010-53", "SSME FLORESTAL LTDA FILIAL 0011-34", "SSME FLORESTAL LTDA FILIAL 0012-15", "SSME FLORESTAL LTDA FILIAL 0013-04", "SSME FLORESTAL LTDA FILIAL 0014-87", "SUDESTE ADMINISTRADORA DE SERVICOS LTDA", "SUDESTE ENGENHARIA E COMERCIO LTDA", "SUDESTE ENGENHARIA E COMERCIO LTDA FILIAL 02-39", "SUDESTE ENGENHARIA E COMERCIO LTDA FILIAL 03-10", "SUDESTE PARTICIPACOES LTDA", "SV LOGISTICA LTDA", "SV RANCHO VELHO GERACAO DE ENERGIA SPE LTDA", "SWA PARTICIPACOES LTDA", "SWA PATRIMONIAL LTDA", "TAKONO DISTRIBUICAO LTDA", "TASK SOFTWARE LTDA", "TAX CLOUD SOLUCOES LTDA", "TCX COMERCIO E INDUSTRIA DE EQUIPAMENTOS PECAS E SERVICOS LTDA", "TEBAS ADMINISTRACAO LTDA", "TECHNEACO ENGENHARIA LTDA", "TECHNEACO ENGENHARIA LTDA FILIAL 02-58", "TECNOCAP RECAPAGEM E PNEUS LTDA", "THAISSA CALAB CURSOS LTDA", "THAISSA CALAB ODONTOLOGIA LTDA", "TIMBIRAS PARTICIPACOES LTDA", "TK LOCACAO DE EQUIPAMENTOS LTDA", "TK PATRIMONIAL LTDA", "TLUANER PARTICIPACOES S/A", "TMJ MARCA E PATENTE LTDA", "TOP RAJA CAR LOCADORA DE VEICULOS LTDA", "TOPAZIO IMPERIAL MINERACAO COMERCIO E INDUSTRIA LTDA", "TRANSPORTADORA DONIZETE LTDA", "TRANSPORTES BOA VISTA LOGISTICA LTDA", "TRIACO ESTRUTURAS METALICAS LTDA", "TURMALINA INCORPORACOES SPE LTDA", "USA DIAGNOSTICA LTDA", "VALADAO E SANTOS PARTICIPACOES LTDA", "VALUMA COBRANCA E NEGOCIOS LTDA", "VCA COMERCIO LTDA", "VCS COMERCIO LTDA", "VEIGA ESTRUTURAS METALICAS LTDA", "VENETO EMPREENDIMENTO COMERCIAL LTDA", "VEREDAS DA SERRA COMBUSTIVEL LTDA", "VERO LATTE COMERCIO DE ALIMENTOS LTDA", "VERO LATTE COMERCIO DE ALIMENTOS LTDA", "VERO LATTE COMERCIO DE ALIMENTOS LTDA", "VIA MONDO APS LTDA", "VIA MONDO APS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA - FILIAL 08-80", "VIA MONDO AUTOMOVEIS E PECAS LTDA - FILIAL 09-61", "VIA MONDO DISTRIBUIDORA DE PECAS E ACESSORIOS AUTOMOTIVOS LTDA",  "VIA MONDO DISTRIBUIDORA DE PECAS E ACESSORIOS AUTOMOTIVOS LTDA", "VIA MONDO FANDI LTDA", "VIA MONDO LOCADORA LTDA", "VIA MONDO LOCADORA LTDA FILIAL 02-94", "VIA MONDO LOCADORA LTDA FILIAL 03-75", "VIA MONDO MULTIMARCAS LTDA", "VIA MONDO TRANSPORTES LTDA", "VIEIRA ADMINISTRACAO LTDA", "VILA CLARA VITORIA LTDA", "VJ PARTICIPACOES LTDA", "VJ PATRIMONIAL LTDA", "VN EMPREENDIMENTOS LTDA", "VSX VALVULAS E EQUIPAMENTOS LTDA", "WOLF PARTICIPACOES S/A", "WRN PARTICIPACOES LTDA", "ZOX GESTAO PATRIMONIAL LTDA"])
+    nome_empresa = st.selectbox("Nome da Empresa" , nomes_empresas)
     uploaded_files = st.file_uploader("Envie seus arquivos XML, TXT, ZIP ou Excel", accept_multiple_files=True)
 
+    nivel_compressao = st.slider("Nível de compressão", 0, 9, NIVEL_COMPRESSAO_PADRAO,
+                                 help="0 grava sem compressão (ZIP_STORED), mais rápido para arquivos já compactos.")
+    por_categoria = st.checkbox("Gerar um ZIP por categoria")
 
-
+    if st.button("Processar Arquivos"):
+        processar_arquivos(uploaded_files, nome_empresa, nivel_compressao, por_categoria)
+    mostrar_resultado()
 
 elif menu == "Controle Importação":
     st.title("📑 Importação")
     with st.form("registro_form"):
-        empresa = st.selectbox("Nome da Empresa", ["2B COMBUSTIVEL LTDA", "A REDE GESTAO PATRIMONIAL LTDA", "A.M CHEQUER IMOVEIS LTDA", "A.R. PARTICIPACOES LTDA", "ABEL CONSTRUTORA LTDA", "ABEL SEMINOVOS LTDA", "ACOLOG LOGISTICA LTDA", "ACOS SERVICOS DE PROMOCAO LTDA", "ACR GESTAO PATRIMONIAL LTDA", "ADCAR SERVICO DE ESCRITORIO E APOIO ADMINISTRATIVO LTDA", "ADR MOBILIDADE E SERVICOS LTDA", "ADS COMERCIO E IMPORTACAO E EXPORTACAO EIRELI", "AESA PARTICIPAÇÕES LTDA", "AGM ESQUADRIAS LTDA", "AGP03 EMPREENDIMENTOS IMOBILIARIOS SPE LTDA", "AGP03 EMPREENDIMENTOS IMOBILIARIOS SPE LTDA FILIAL 02-82", "AGP03 EMPREENDIMENTOS IMOBILIARIOS SPE LTDA SCP RESIDENCIAL CAPARAO", "AGP05 ARGON EMPREENDIMENTOS IMOBILIARIOS SPE LTDA", "AGROPECUARIA BONANZA LTDA", "AGT01 MORADA NOVA DE MINAS SPE LTDA", "AGT01 MORADA NOVA DE MINAS SPE LTDA FILIAL 02-52", "AGUIA 8 COMERCIO DE COMBUSTIVEIS LTDA", "AGUIA IV COMERCIO DE COMBUSTIVEIS LTDA", "AGUIA IX COMERCIO DE COMBUSTIVEIS LTDA", "AGUIA V COMERCIO DE COMBUSTIVEIS LTDA", "ALLOTECH CONSULTORIA EM PRODUCAO INDUSTRIAL LTDA", "ALVES E SANTOS PARTICIPACOES LTDA", "AMH COMERCIO E SERVICOS LTDA", "AML HOLDING S/A", "AMMC PARTICIPACOES LTDA", "AMPLUS PARTICIPACOES SA", "AMX GESTÃO PATRIMONIAL LTDA", "ANF EMPREENDIMENTOS E PARTICIPACOES LTDA", "ANITA CHEQUER PARTICIPACOES LTDA", "ANITA CHEQUER PATRIMONIAL LTDA", "APL ADMINISTRACAO E PARTICIPACOES LTDA", "APMG PARTICIPACOES S/A", "ARCI PARTICIPACOES LTDA", "ARCI PATRIMONIAL LTDA", "ARGON ENGENHARIA LTDA", "ARNDT PATRIMONIAL LTDA", "ARNDT REFORMAS E MANUTENCOES LTDA", "ARNDT, TRAVASSOS E MORRISON SPE LTDA", "ARTMIX HOLDING LTDA", "AUMAR PRESTACAO DE SERVICOS ADMINISTRATIVOS LTDA", "AUTO POSTO ALELUIA LTDA", "AUTO POSTO ALELUIA LTDA FILIAL 02-46", "AUTO POSTO CENTENARIO LTDA", "AUTO POSTO DAS LAJES LTDA", "AUTO POSTO DOM BOSCO LTDA", "AUTO POSTO MAQUINE LTDA", "AUTO POSTO MARIO CAMPOS COMERCIO DE COMBUSTIVEIS LTDA", "AUTO POSTO PORTAL DO NORTE LTDA", "AUTO POSTO VERONA LTDA", "AUTOREDE LOCADORA DE VEICULOS LTDA", "AUTOREDE PARTICIPACOES LTDA", "AXJ PARTICIPACOES EIRELI", "AXP GESTAO PATRIMONIAL LTDA", "AZEVEDO & CIA", "BARAO VPP CONVENIENCIAS LTDA", "BARTELS DERMATOLOGIA ESTETICA E LASER LTDA", "BEL DISTRIBUIDOR DE LUBRIFICANTES LTDA", "BEL DISTRIBUIDOR DE LUBRIFICANTES LTDA FILIAL 02-79", "BEL LUBRIFICANTES ESPECIAIS LTDA", "BELTMORE PARTICIPACOES LTDA", "BEMX - PARTICIPACOES E EMPREENDIMENTOS LTDA", "BIOCLINTECH CIENTIFICA LTDA", "BIOCLINTECH LTDA", "BIOCLINTECH MANUTENCAO LTDA", "BLUE SKY PARTICIPACOES LTDA", "BMC EDITORA LTDA", "BMGL PARTICIPACOES E EMPREENDIMENTOS IMOBILIARIOS LTDA", "BOA VISTA ASSESSORIA LTDA", "BOA VISTA BOCAIUVA HOTEL LTDA", "BORA EMBALAGENS LTDA", "BRANT EMPREENDIMENTOS LTDA", "BRASIL CONCRETO LTDA", "BRAZIL MANIA LTDA", "BRB TRANSPORTES LTDA", "BRM COMERCIO DE VEICULOS LTDA", "BRM COMERCIO DE VEICULOS LTDA FILIAL 02-24", "BROMELIAS GESTAO PATRIMONIAL LTDA", "BURITIS CONVENIENCIA LTDA", "BV DISTRIBUIDORA LTDA", "CAD COMERCIAL DE MAQUINAS LTDA", "CAMPO ALEGRE PARTICIPACOES LTDA", "CAPITAO COMERCIO DE COMBUSTIVEIS LTDA", "CASA NOVA SPE LTDA", "CASA SEMPRE VIVA COMERCIO DE MATERIAIS DE CONSTRUCAO LTDA", "CASCALHO PARTICIPACOES LTDA", "CATIRA INTERMEDIACOES DE NEGOCIOS LTDA", "CCA COMERCIAL DE COMBUSTIVEIS AUTOMOTIVOS LTDA", "CDI NUCLEAR LTDA", "CDVM LTDA", "CELT -COMERCIO DE COMBUSTIVEIS E LUBRIFICANTES LTDA", "CENTER POSTO LTDA", "CENTER POSTO LTDA FILIAL 02-12", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 02-49", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 04-00", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 05-91", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 07-53", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 09-15", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 10-59", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 11-30", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 14-82", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 17-25", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 19-97", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 20-20", "CGA SERVICOS MEDICOS LTDA", "CGI - EMPREENDIMENTOS COMERCIAL LTDA", "CHAVE DE OURO EMPREENDIMENTOS IMOBILIARIOS EIRELI", "CHEL LTDA", "CHEQUER & COELHO LTDA", "CIA ITABIRITO INDUSTRIAL FIACAO E TECELAGEM DE ALGODAO", "CIAZA CONSTRUTORA LTDA", "CLAM CONSULTORIA LTDA", "CLAM ENGENHARIA LTDA", "CLAM ENGENHARIA LTDA FILIAL 03-00", "CLAM ESG LTDA", "CLAM MEIO AMBIENTE LTDA", "CLAM MEIO AMBIENTE LTDA FILIAL 02-49", "CLAM MONITORAMENTO AMBIENTAL LTDA", "CLAM MONITORAMENTO AMBIENTAL LTDA", "CLAM PARTICIPACOES E INVESTIMENTOS S/A", "CLINICA LEV SAVASSI LTDA", "CLINICA RADIOLOGICA ELDORADO LTDA", "CLINICA UNIAO SERVICOS MEDICOS LTDA", "COELHO CONVENIENCIA LTDA", "COELHO E PEREIRA EIRELI", "COLISEU SERVICOS ADMINISTRATIVOS LTDA", "COMERCIAL AVIAMENTOS LTDA", "COMERCIAL FOCCUS LTDA", "COMERCIAL GIULIANO LIMITADA", "COMERCIAL OLIVEIRA & BRANT LTDA", "COMERCIAL OLIVEIRA & BRANT LTDA", "COMERCIO LANCHE KARRAO LTDA", "CONSORCIO ENGEBRAS ILCON SES 0620240094", "CONSORCIO GERASUN SOLAR", "CONSTANTINO MATIAS NOGUEIRA - IMOVEIS", "CONSTANTINO MATIAS NOGUEIRA - PATRIMONIAL LTDA", "CONSTRUTORA AGMAR LTDA", "CONSTRUTORA AGMAR LTDA", "CONSTRUTORA AGMAR LTDA FILIAL 02-10", "CONSTRUTORA E INCORPORADORA SPLIT LTDA", "CONTABILIDADE LTDA", "CONVENIENCIA DOIS IRMAOS - EIRELI", "CONVENIENCIA DOIS IRMAOS LTDA", "CORRETORA DE SEGUROS BELO HORIZONTE LTDA", "CRISTAL VALLE ADMINISTRACAO LTDA", "CRISTAL VALLE INDUSTRIA E COMERCIO DE VIDROS LTDA", "CSV GESTAO PATRIMONIAL LTDA", "CVQ I SPE LTDA", "CVQ II SPE LTDA", "D.L.A. SERVICOS ADMINISTRATIVOS LTDA", "DEBURR COMERCIO DE COSMETICOS LTDA", "DEL PAPEIS LTDA", "DEL PAPEIS LTDA FILIAL 03-84", "DELMA - COMERCIO DE COMBUSTIVEIS LTDA", "DH ORIGINAL IMPORTACAO E EXPORTACAO LTDA", "DISTRIBUIDORA BIOCLIN DIAGNOSTICA LTDA", "DJB PARTICIPACOES LTDA", "DOBRAFLEX CORTE E DOBRA DE METAIS LTDA", "DVS PARTICIPACOES LTDA", "E.D. TECNOLOGIA DIGITAL BH LTDA", "EAGLE ADMINISTRACAO LTDA", "EDIFICIO REDE OFFICE I", "ELETROFERRAGENS RM EIRELI", "EMAG CONSTRUTORA LTDA", "EMAG CONSTRUTORA LTDA", "EMIS MINAS DISTRIBUIDORA DE PRODUTOS FARMACEUTICOS LTDA", "EMP - AVALIACAO EM RECURSOS HUMANOS LTDA", "EMPIRE DJB PATRIMONIAL LTDA", "ENERGY TRANSPORTES LTDA", "ENGEBRAS CONSTRUTORA LTDA", "ESMIG INDUSTRIA DE ESCADAS LTDA", "ESMIG INDUSTRIA DE ESCADAS LTDA FILIAL 03-89", "ESTACIONAMENTO AGMAR LTDA", "ESTACIONAMENTO AGMAR LTDA FILIAL 02-06", "ESTACIONAMENTO AGMAR LTDA FILIAL 03-89", "ESTACIONAMENTO AGMAR LTDA FILIAL 04-60", "ESTIVA PARTICIPACOES LTDA", "EVELINE DE PAULA BARTELS", "EVERYBODY - CENTRO DE PERFORMANCE E FISIOTERAPIA LTDA", "EVOLUTION CONSULTORIA E GESTAO EMPRESARIAL S/A", "EXPRESSO FERRENSE LTDA", "FAST GESTAO DE RECURSOS LTDA", "FAST TEAM SERVICOS DE ESTETICA AUTOMOTIVA LTDA", "FASTPLOT SERVICOS DE ESTETICA AUTOMOTIVA LTDA", "FATIMA ADMINISTRACAO LTDA", "FCF CONSULTORIA LTDA", "FCK PREMOLDADOS LTDA FILIAL 02", "FCK PREMOLDADOS LTDA FILIAL 03", "FCK PREMOLDADOS LTDA", "FCK TRANSPORTES LTDA", "FEAG - FERRAGENS AGMAR PARA FACHADA EIRELI", "FERREIRA ADMINISTRACAO LTDA", "FERRO E ACO TAKONO LTDA", "FERRO E ACO TAKONO LTDA FILIAL 0028-03", "FERRO E ACO TAKONO LTDA FILIAL 06-06", "FERRO E ACO TAKONO LTDA FILIAL 07-89", "FERRO E ACO TAKONO LTDA FILIAL 08-60", "FERRO E ACO TAKONO LTDA FILIAL 10-84", "FERRO E ACO TAKONO LTDA FILIAL 11-65", "FERRO E ACO TAKONO LTDA FILIAL 12-46", "FERRO E ACO TAKONO LTDA FILIAL 13-27", "FERRO E ACO TAKONO LTDA FILIAL 14-08", "FERRO E ACO TAKONO LTDA FILIAL 15-99", "FERRO E ACO TAKONO LTDA FILIAL 16-70", "FERRO E ACO TAKONO LTDA FILIAL 18-31", "FERRO E ACO TAKONO LTDA FILIAL 19-12", "FERRO E ACO TAKONO LTDA FILIAL 20-56", "FERRO E ACO TAKONO LTDA FILIAL 21-37", "FERRO E ACO TAKONO LTDA FILIAL 22-18", "FERRO E ACO TAKONO LTDA FILIAL 23-07", "FERRO E ACO TAKONO LTDA FILIAL 24-80", "FERRO E ACO TAKONO LTDA FILIAL 25-60", "FERRO E ACO TAKONO LTDA FILIAL 26-41", "FERRO E ACO TAKONO LTDA FILIAL 27-22", "FIX MANUTENCAO PREDIAL LTDA", "FIX MANUTENCOES LTDA", "FLARA GESTAO PATRIMONIAL LTDA", "FMPL PARTICIPACOES LTDA", "FORTRESS GESTAO PARTICIPACOES LTDA", "FRADE PARTICIPACOES LTDA", "FS PROCESSAMENTO DE DADOS LTDA", "GAMA SERV LTDA", "GECORP GESTAO DE BENEFICIOS E CORRETORA DE SEGUROS LTDA", "GENETICENTER - CENTRO DE GENETICA LTDA", "GERTH CONSULTORIA E PROMOCOES DE VENDAS LTDA", "GFF ENGENHARIA LTDA", "GIBRALTAR HOLDING LTDA", "GIOVANNI CARLECH GUIMARAES MARQUEZANI", "GMAC ESTACIONAMENTOS LTDA", "GMB ASSESSORIA LTDA", "GNV SETE BELO LTDA", "GPK PARTICIPACOES LTDA", "GR COMBUSTIVEIS LTDA", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA FILIAL 03-50", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA FILIAL 04-31", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA FILIAL 05-12", "GROUND GESTAO PATRIMONIAL LTDA", "GSC GESTAO PATRIMONIAL LTDA", "GUIMARAES & VIEIRA DE MELLO SOCIEDADE DE ADVOGADOS", "GUIMARAES E VIEIRA DE MELLO ADVOGADOS", "GVM ADMINISTRACAO E CONSULTORIA LTDA", "GVM CONSORCIO", "GVM CORRETORA DE SEGUROS LTDA", "GWS ENGENHARIA LTDA", "GWS TECH LTDA", "H.C.-COMERCIO DE ALIMENTOS LTDA", "H.C.-COMERCIO DE ALIMENTOS LTDA", "HAND SHOP SUPRIMENTOS MEDICOS E TERAPEUTICOS LTDA", "HC COMERCIO DE ALIMENTOS LTDA", "HC COMERCIO DE ALIMENTOS LTDA FILIAL 03-63", "HOLDING MAIS MABC LTDA", "HOTEL SAO BENTO LTDA", "HPX PARTICIPACOES LTDA", "HSP GESTAO PATRIMONIAL LTDA", "HVAR INCORPORACOES LTDA", "I9 GESTAO E PARTICIPACOES LTDA", "IB COMBUSTIVEL LTDA", "IB TRANSPORTES & EMPREENDIMENTOS LTDA", "INCONFIDENTES PARTICIPACOES LTDA", "INCORPORADORA MONTE VERDE SPE LTDA", "INDUSTRIA DE TRANSFORMADORES KING LIMITADA", "INFLUXO SOCIEDADE DE PROFISSIONAIS", "INSTITUTO PERSONA INTELIGENCIA EMOCIONAL LTDA", "INTERWEG ADM E CORRETORA DE SEGUROS LTDA", "INTERWEG CORRETORA DE SEGUROS E BENEFICIOS LTDA", "J.V.V. GESTAO PATRIMONIAL LTDA", "JACL PARTICIPACOES LTDA", "JARDINO MALL LTDA", "JCA SERVICOS DE RADIOLOGIA LTDA", "JCM PARTICIPACOES LTDA", "JHCL GESTAO PATRIMONIAL LTDA", "JJA LOCACOES LTDA", "JKV GESTAO PATRIMONIAL LTDA", "JPAMACEDO E PARTICIPACOES LTDA", "JR LAVA JATO EIRELI", "JVC PARTICIPACOES LTDA", "JVP GESTAO PATRIMONIAL LTDA", "K10 PARTICIPACOES LTDA", "KALAB LOPES GESTAO PATRIMONIAL LTDA", "KALAB NEGOCIOS IMOBILIARIOS LTDA", "L.O. IMPORT EXPORT LTDA", "LABORATORIO DE PATOLOGIA CIRURGICA E CITOPATOLOGIA LTDA", "LABORATORIO DE PATOLOGIA CIRURGICA E CITOPATOLOGIA LTDA FILIAL 03-44", "LETOM EMPREENDIMENTOS LTDA", "LGX - PARTICIPACOES E ADMINISTRACAO LTDA", "LINK INDUSTRIA E COMERCIO DE MAQUINAS PARA MINERACAO LTDA", "LINK INDUSTRIA E COMERCIO DE MAQUINAS PARA MINERACAO LTDA FILIAL 03-05", "LOCS LOCADORA DE VEICULOS LTDA", "LS ENTERPRISE SOLLUTIONS LTDA", "M A B COSTA LTDA", "M L SILVEIRA SERVICOS CORPORATIVOS EIRELI", "MADA CLINICA ODONTOLOGICA LTDA", "MAIS CONSTRUCOES LTDA", "MAIS NEGOCIOS E REPRESENTACOES LTDA", "MAQUINAS RABELLO ITABAYANA LIMITADA", "MAR UP CONSULTORIA GESTAO E REPRESENTACAO COMERCIAL LTDA", "MAR9 TRATAMENTO DE DADOS LTDA", "MARCHALENTA AUTO SERVICOS LTDA", "MARCHALIVRE SERVICOS E PECAS LTDA", "MARCO GRILLI COMERCIO DE OBJETOS DE ARTE LTDA", "MARIA CHEQUER PARTICIPACOES LTDA", "MARIA CHEQUER PATRIMONIAL LTDA", "MARIANA CARLECH GUIMARAES MARQUEZANI", "MARICABI GESTAO PATRIMONIAL LTDA", "MASSIME DISTRIBUIDORA DE MEDICAMENTOS LTDA", "MASTER AUTO POSTO LTDA", "MASTER EMPREENDIMENTOS E PARTICIPACOES LTDA", "MASTER PISOS MATERIAL DE CONSTRUCAO EIRELI", "MATTA NUNES REPRESENTACOES COMERCIAIS E GESTAO DE NEGOCIOS LTDA", "MAX GESTAO PATRIMONIAL LTDA", "MD EMPREENDIMENTOS S.A", "MEDWAY SOLUCOES PARA A SAUDE LTDA", "MENDONCA E FERREIRA PARTICIPACOES LTDA", "MENDONCA E FERREIRA PATRIMONIAL LTDA", "MENDONCA E FILHOS GESTAO PATRIMONIAL LTDA", "MENDONCA PARTICIPACOES LTDA", "MEROS GESTAO PATRIMONIAL LTDA", "MG CONVENIENCIA LTDA", "MG CONVENIENCIA LTDA FILIAL 02-57", "MICRONIC COMERCIO E INDUSTRIA LTDA", "MILENE GUIMARAES MARQUEZANI", "MINAS GERAIS ADMINISTRADORA DE IMOVEIS LTDA", "MINEIRAO POSTO DE SERVICOS LTDA", "MLM HOLDING EIRELI", "MM COMERCIO DE DERIVADOS DE PETROLEO LTDA", "MMORAES PARTICIPACOES LTDA", "MONTE VERDE EDIFICACOES I SPE LTDA", "MONTE VERDE URBANIZACOES SPE LTDA", "MP INCORPORACOES LTDA", "MRI MOVIMENTACAO E RECUPERACAO INDUSTRIAL LTDA", "MRLIZ CONSULTORIA LTDA", "MTL PARTICIPACOES LTDA", "MULT SERVICOS ADMINISTRATIVOS LTDA", "MWA PARTICIPACOES LTDA", "MWA PATRIMONIAL LTDA", "NACIONAL RENOVAVEIS LTDA", "NATUREZA X COMERCIO LTDA", "NOSSA OBRA VAREJO DIGITAL LTDA", "NRSM REFORMAS LTDA", "NVB SERVICOS LTDA", "OLE PARTICIPACOES LTDA", "OLIVEIRA SANTOS ADVOGADOS", "OPEN-5 LTDA", "OPEN-5 LTDA", "OPX PARTICIPACOES LTDA", "ORGANIZACAO COMERCIAL MARINHO LTDA", "ORGANIZACOES SOUKI EIRELI", "ORGANIZACOES SOUKI EIRELI FILIAL 03-32", "ORIENT AUTOMOVEIS PECAS E SERVICOS LTDA", "ORIENT AUTOMOVEIS PECAS E SERVICOS LTDA FILIAL 03-43", "ORIENT AUTOMOVEIS PECAS E SERVICOS LTDA FILIAL 04-24", "ORIENTE FARMACEUTICA COMERCIO IMPORTACAO E EXPORTACAO LTDA", "PADUA COMERCIO E INDUSTRIA LTDA", "PAIVA BRANT LTDA", "PAIVA EMPREENDIMENTOS E GESTAO DE IMOVEIS PROPRIOS LTDA", "PCFORYOU LTDA", "PEMAX INTERMEDIACAO E NEGOCIOS LTDA", "PERFORMANCE GESTAO EMPRESARIAL LTDA", "PETRODATA PROCESSAMENTO DE DADOS LTDA", "PLATAFORMA AM3 LTDA", "PNEUS JUA COMERCIO DE PNEUS LTDA", "PONTUAUTO CENTRO AUTOMOTIVO LTDA", "POP EMPREENDIMENTOS E PARTICIPACOES S/A", "POSTO AEROPORTO LTDA", "POSTO AGUIA COMERCIO DE COMBUSTIVEIS LTDA", "POSTO ALAMO LTDA", "POSTO ALLGAS LTDA", "POSTO AVENIDA BRASIL COMERCIO DE COMBUSTIVEIS LTDA", "POSTO BALNEARIO AGUA LIMPA LTDA", "POSTO BARAO VPP LTDA", "POSTO BERIMBAU LTDA", "POSTO BURITIS LTDA", "POSTO CATEDRAL LTDA", "POSTO CENTER NORTE LTDA", "POSTO COELHO LTDA", "POSTO DANUBIO LTDA", "POSTO DE COMBUSTIVEIS CENTER SUL LTDA", "POSTO DE COMBUSTIVEIS SANTO AGOSTINHO LTDA", "POSTO DE COMBUSTIVEL PETROLANDIA LTDA", "POSTO DE COMBUSTIVEL VILA CRUZEIRO LIMITADA", "POSTO ESTORIL LTDA", "POSTO FORMULA BR LTDA", "POSTO HUGO WERNECK LTDA", "POSTO IPE COMERCIO DE COMBUSTIVEIS LTDA", "POSTO IRMAOS AULER LTDA", "POSTO JUPITER LTDA", "POSTO LESTE LTDA", "POSTO MARIO WERNECK LIMITADA", "POSTO MAURITANIA LTDA", "POSTO MINAS SHOPPING LTDA", "POSTO MINASLANDIA LTDA", "POSTO MONTE VERDE LTDA", "POSTO MUSTANG LTDA", "POSTO NOGUEIRINHA LTDA", "POSTO OCEANO AZUL LTDA", "POSTO OCEANO LTDA", "POSTO PANAMERA LTDA", "POSTO PARQUE BURITIS LTDA", "POSTO PARQUE JARDIM LTDA", "POSTO PICA PAU LTDA", "POSTO POETA LTDA", "POSTO PORTAL DE BETIM LTDA", "POSTO PORTAL DE CONTAGEM LTDA", "POSTO PORTAL DOS CAICARAS LTDA", "POSTO SIGMA LTDA", "POSTO SOBERANO AUTORAMA LTDA", "POSTO SOBERANO KARRAO LTDA", "POSTO SOBERANO SETE DE SETEMBRO LTDA", "POSTO TATIANA LTDA", "POSTO TROVAO LTDA", "POSTO VIA FERNAO DIAS LTDA", "POSTO VILA CHALE LTDA", "POSTO VILA DA SERRA LTDA", "POSTO VILA PICA PAU LTDA", "POSTO ZEPPE GRAND PRIX LTDA", "POSTO ZEPPE MG LTDA", "POSTO ZEPPE OASIS LTDA", "POSTO ZEPPE SAO JOSE LTDA", "POSTO ZEPPELIN LTDA", "PPML INDUSTRIA E COMERCIO DE ROUPAS EIRELI", "PRESERVAR PARTICIPACOES LTDA", "PRIMA LINEA AUTOMOVEIS LTDA", "PRIMOLA FRAGRANCIAS LTDA FILIAL 04-30", "PROFIT FOODS LTDA", "PROJETOUM COMERCIO E REPRESENTACOES LTDA", "PROJETOUM COMERCIO E REPRESENTACOES LTDA FILIAL 0002-27", "PROPELLER LTDA", "PROSERVICE LTDA", "PROSPECTIVA SOCIEDADE DE PROFISSIONAIS", "PURA SAUDE ALIMENTOS LTDA", "PURA SAUDE ALIMENTOS LTDA FILIAL 02-88", "QUADRIJET ALPHAVILLE COMERCIO LTDA", "QUEOPZ GESTAO PATRIMONIAL LTDA", "QUIBASA QUIMICA BASICA LTDA", "QUIBASA QUIMICA BASICA LTDA FILIAL 02-98", "QUIBASA QUIMICA BASICA LTDA FILIAL 03-79", "QUICK CONVENIENCIAS LTDA", "QUICK LUBE COMERCIO DE PRODUTOS E FRANQUIAS LTDA", "RACCO EQUIPAMENTOS E SERVICOS EIRELI", "RACCO SERVICOS DE PUBLICIDADE E COMUNICACAO LTDA", "RC INVEST PARTICIPACOES LTDA", "RECICLAGEM PASSARELA LTDA", "REDE A PUBLICIDADE E PROPAGANDA LTDA", "REDE OFFICE INCORPORACOES LTDA", "RESIDENCIAL ANDORINHAS SPE LTDA", "RESIDENCIAL PACIFICO RIBEIRAO DAS NEVES SPE LTDA", "RESIDENCIAL PACIFICO RIBEIRAO DAS NEVES SPE LTDA FILIAL 02-72", "RESIDENCIAL VILA AMAZONAS SPE LTDA","RESIDENCIAL VILA AMAZONAS SPE LTDA FILIAL 02-91", "RESIDENCIAL VILA ATLANTICO SABARA SPE LTDA", "RESIDENCIAL VILA ATLANTICO SABARA SPE LTDA", "RESIDENCIAL VILA CONCEICAO SPE LTDA", "RESIDENCIAL VILA CONCEICAO SPE LTDA FILIAL 02-01", "RESIDENCIAL VILA MORGANTI I SCP", "RESIDENCIAL VILA MORGANTI I SPE LTDA", "RESIDENCIAL VILA MORGANTI I SPE LTDA FILIAL 02-05", "RESIDENCIAL VILA SAO JOSE I SPE LTDA", "RESIDENCIAL VILA SAO JOSE I SPE LTDA FILIAL 02-64", "RESIDENCIAL VILA SAO JOSE II SPE LTDA", "RESIDENCIAL VILA SAO JOSE II SPE LTDA FILIAL 0002-01", "RESIDENCIAL VILA SAO JOSE SCP", "RETES IMAGENS SERVICOS E CONSULTORIA LTDA", "RFX ADMINISTRACAO DE RECURSOS LTDA", "RFX CONSULTORIA E GESTAO DE NEGOCIOS LTDA", "RFX DISTRIBUIDORA DE PRODUTOS AUTOMOTIVOS LTDA", "RFX GESTAO PATRIMONIAL LTDA", "RFX LOGISTICA E TRANSPORTES DE COMBUSTIVEIS LTDA", "RFX TREINAMENTO PROFISSIONAL LTDA", "RGGC EMPREENDIMENTOS LTDA", "RH CENTRO DE SAUDE LTDA", "RICARDO SANTOS BRANT", "ROCKET GESTAO PATRIMONIAL LTDA", "ROL COMERCIO DE DERIVADOS DE PETROLEO LTDA", "RPB COMERCIO DE COMBUSTIVEL LTDA", "RSM COMERCIO E GERENCIAMENTO DE RESIDUOS GUAXUPE EIRELI", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SANTA CLARA AGROPECUARIA LTDA", "SANTA MARIA ECOLOGIC EQUIPAMENTOS LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC RESIDUOS LTDA", "SANTORINI POSTO DE SERVICOS LTDA", "SARAMENHA ENGENHARIA LTDA", "SCP AUDITORIA DE IMPOSTOS E CONTRIBUICOES", "SCP CLAM ENGENHARIA LTDA", "SCP CLINICA RADIOLOGICA ELDORADO LTDA", "SCP DIAGNOSTICO BETIMBARREIRO LTDA", "SCP RESIDENCIAL VILA CONCEICAO", "SCP VILA PACIFICO SANCRUZA", "SE LOTEAMENTOS LTDA", "SETEC- CONSULTORIA EMPRESARIAL LTDA", "SICAL INDUSTRIAL LTDA", "SIMEX ENTREGAS E MOVIMENTACAO DE CARGAS LTDA", "SIX TRACKS LTDA", "SOBERANO LOJAS DE CONVENIENCIA LTDA", "SOBERANO LUBRIFICANTES LTDA", "SOBERANO SERVICOS LTDA", "SOBERANO TRANSPORTES LTDA", "SOLAR VOLT SOLUCOES COMERCIO E INSTALACAO PARA ENERGIA LTDA", "SOLUCAO CORTE E DOBRA DE METAIS LTDA", "SOLVE OPERACAO, MANUTENCAO E COMISSIONAMENTO DE SISTEMAS FOTOVOLTAICOS LTDA", "SOLVIA SOLUCOES VIARIAS LTDA", "SP IMPORTS LTDA", "SP IMPORTS LTDA FILIAL 02-70", "SP IMPORTS LTDA FILIAL 03-50", "SPE JARDINS DOS BURITIS LTDA", "SPE JARDINS DOS BURITIS LTDA FILIAL 02-60", "SPE LA BRESSE LTDA", "SPE MARIA FAUSTINA LTDA", "SPE MIRANTE DO LAGO SETE LAGOAS LTDA", "SSME EMPREENDIMENTOS IMOBILIARIOS LTDA FILIAL 02-76", "SSME EMPREENDIMENTOS IMOBILIARIOS LTDA", "SSME FLORESTAL LTDA", "SSME FLORESTAL LTDA FILIAL 0002-43", "SSME FLORESTAL LTDA FILIAL 0003-24", "SSME FLORESTAL LTDA FILIAL 0005-96", "SSME FLORESTAL LTDA FILIAL 0006-77", "SSME FLORESTAL LTDA FILIAL 0007-58", "SSME FLORESTAL LTDA FILIAL 0008-39", "SSME FLORESTAL LTDA FILIAL 0009-10", "SSME FLORESTAL LTDA FILIAL 0010-53", "SSME FLORESTAL LTDA FILIAL 0011-34", "SSME FLORESTAL LTDA FILIAL 0012-15", "SSME FLORESTAL LTDA FILIAL 0013-04", "SSME FLORESTAL LTDA FILIAL 0014-87", "SUDESTE ADMINISTRADORA DE SERVICOS LTDA", "SUDESTE ENGENHARIA E COMERCIO LTDA", "SUDESTE ENGENHARIA E COMERCIO LTDA FILIAL 02-39", "SUDESTE ENGENHARIA E COMERCIO LTDA FILIAL 03-10", "SUDESTE PARTICIPACOES LTDA", "SV LOGISTICA LTDA", "SV RANCHO VELHO GERACAO DE ENERGIA SPE LTDA", "SWA PARTICIPACOES LTDA", "SWA PATRIMONIAL LTDA", "TAKONO DISTRIBUICAO LTDA", "TASK SOFTWARE LTDA", "TAX CLOUD SOLUCOES LTDA", "TCX COMERCIO E INDUSTRIA DE EQUIPAMENTOS PECAS E SERVICOS LTDA", "TEBAS ADMINISTRACAO LTDA", "TECHNEACO ENGENHARIA LTDA", "TECHNEACO ENGENHARIA LTDA FILIAL 02-58", "TECNOCAP RECAPAGEM E PNEUS LTDA", "THAISSA CALAB CURSOS LTDA", "THAISSA CALAB ODONTOLOGIA LTDA", "TIMBIRAS PARTICIPACOES LTDA", "TK LOCACAO DE EQUIPAMENTOS LTDA", "TK PATRIMONIAL LTDA", "TLUANER PARTICIPACOES S/A", "TMJ MARCA E PATENTE LTDA", "TOP RAJA CAR LOCADORA DE VEICULOS LTDA", "TOPAZIO IMPERIAL MINERACAO COMERCIO E INDUSTRIA LTDA", "TRANSPORTADORA DONIZETE LTDA", "TRANSPORTES BOA VISTA LOGISTICA LTDA", "TRIACO ESTRUTURAS METALICAS LTDA", "TURMALINA INCORPORACOES SPE LTDA", "USA DIAGNOSTICA LTDA", "VALADAO E SANTOS PARTICIPACOES LTDA", "VALUMA COBRANCA E NEGOCIOS LTDA", "VCA COMERCIO LTDA", "VCS COMERCIO LTDA", "VEIGA ESTRUTURAS METALICAS LTDA", "VENETO EMPREENDIMENTO COMERCIAL LTDA", "VEREDAS DA SERRA COMBUSTIVEL LTDA", "VERO LATTE COMERCIO DE ALIMENTOS LTDA", "VERO LATTE COMERCIO DE ALIMENTOS LTDA", "VERO LATTE COMERCIO DE ALIMENTOS LTDA", "VIA MONDO APS LTDA", "VIA MONDO APS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA - FILIAL 08-80", "VIA MONDO AUTOMOVEIS E PECAS LTDA - FILIAL 09-61", "VIA MONDO DISTRIBUIDORA DE PECAS E ACESSORIOS AUTOMOTIVOS LTDA",  "VIA MONDO DISTRIBUIDORA DE PECAS E ACESSORIOS AUTOMOTIVOS LTDA", "VIA MONDO FANDI LTDA", "VIA MONDO LOCADORA LTDA", "VIA MONDO LOCADORA LTDA FILIAL 02-94", "VIA MONDO LOCADORA LTDA FILIAL 03-75", "VIA MONDO MULTIMARCAS LTDA", "VIA MONDO TRANSPORTES LTDA", "VIEIRA ADMINISTRACAO LTDA", "VILA CLARA VITORIA LTDA", "VJ PARTICIPACOES LTDA", "VJ PATRIMONIAL LTDA", "VN EMPREENDIMENTOS LTDA", "VSX VALVULAS E EQUIPAMENTOS LTDA", "WOLF PARTICIPACOES S/A", "WRN PARTICIPACOES LTDA", "ZOX GESTAO PATRIMONIAL LTDA"])
-        tipo_nota = st.selectbox("Tipo de Nota", ["NFE entrada", "NFE saída", "CTE entrada", "CTE saída", "CTE cancelado", "SPED", "NFS tomado", "NFS prestado", "Planilha", "NFCE saída"])
+        empresa = st.selectbox("Nome da Empresa", nomes_empresas)
+        tipo_nota = st.selectbox("Tipo de Nota", TIPOS_NOTA)
         erro = st.text_area("Erro (se houver)")
         arquivo = st.file_uploader("Anexar imagem do erro", type=["png", "jpeg", "jpg"])
         submit = st.form_submit_button("Registrar")
@@ -135,11 +240,7 @@ elif menu == "Controle Importação":
             arquivo_path = ""
             
             if arquivo:
-                pasta_arquivos = "arquivos_erros"
-                os.makedirs(pasta_arquivos, exist_ok=True)
-                arquivo_path = os.path.join(pasta_arquivos, f"{data_atual}_{arquivo.name}")
-                with open(arquivo_path, "wb") as f:
-                    f.write(arquivo.read())
+                arquivo_path = guardar_imagem(conn, arquivo.getvalue(), arquivo.name)
             
             status = 'OK' if not erro else 'Pendente'
             
@@ -150,68 +251,127 @@ elif menu == "Controle Importação":
 
 elif menu == "Registros Importação":
     st.title("🔍 Buscar Registros")
-    empresa_filtro = st.selectbox("Nome da empresa" , ["2B COMBUSTIVEL LTDA", "A REDE GESTAO PATRIMONIAL LTDA", "A.M CHEQUER IMOVEIS LTDA", "A.R. PARTICIPACOES LTDA", "ABEL CONSTRUTORA LTDA", "ABEL SEMINOVOS LTDA", "ACOLOG LOGISTICA LTDA", "ACOS SERVICOS DE PROMOCAO LTDA", "ACR GESTAO PATRIMONIAL LTDA", "ADCAR SERVICO DE ESCRITORIO E APOIO ADMINISTRATIVO LTDA", "ADR MOBILIDADE E SERVICOS LTDA", "ADS COMERCIO E IMPORTACAO E EXPORTACAO EIRELI", "AESA PARTICIPAÇÕES LTDA", "AGM ESQUADRIAS LTDA", "AGP03 EMPREENDIMENTOS IMOBILIARIOS SPE LTDA", "AGP03 EMPREENDIMENTOS IMOBILIARIOS SPE LTDA FILIAL 02-82", "AGP03 EMPREENDIMENTOS IMOBILIARIOS SPE LTDA SCP RESIDENCIAL CAPARAO", "AGP05 ARGON EMPREENDIMENTOS IMOBILIARIOS SPE LTDA", "AGROPECUARIA BONANZA LTDA", "AGT01 MORADA NOVA DE MINAS SPE LTDA", "AGT01 MORADA NOVA DE MINAS SPE LTDA FILIAL 02-52", "AGUIA 8 COMERCIO DE COMBUSTIVEIS LTDA", "AGUIA IV COMERCIO DE COMBUSTIVEIS LTDA", "AGUIA IX COMERCIO DE COMBUSTIVEIS LTDA", "AGUIA V COMERCIO DE COMBUSTIVEIS LTDA", "ALLOTECH CONSULTORIA EM PRODUCAO INDUSTRIAL LTDA", "ALVES E SANTOS PARTICIPACOES LTDA", "AMH COMERCIO E SERVICOS LTDA", "AML HOLDING S/A", "AMMC PARTICIPACOES LTDA", "AMPLUS PARTICIPACOES SA", "AMX GESTÃO PATRIMONIAL LTDA", "ANF EMPREENDIMENTOS E PARTICIPACOES LTDA", "ANITA CHEQUER PARTICIPACOES LTDA", "ANITA CHEQUER PATRIMONIAL LTDA", "APL ADMINISTRACAO E PARTICIPACOES LTDA", "APMG PARTICIPACOES S/A", "ARCI PARTICIPACOES LTDA", "ARCI PATRIMONIAL LTDA", "ARGON ENGENHARIA LTDA", "ARNDT PATRIMONIAL LTDA", "ARNDT REFORMAS E MANUTENCOES LTDA", "ARNDT, TRAVASSOS E MORRISON SPE LTDA", "ARTMIX HOLDING LTDA", "AUMAR PRESTACAO DE SERVICOS ADMINISTRATIVOS LTDA", "AUTO POSTO ALELUIA LTDA", "AUTO POSTO ALELUIA LTDA FILIAL 02-46", "AUTO POSTO CENTENARIO LTDA", "AUTO POSTO DAS LAJES LTDA", "AUTO POSTO DOM BOSCO LTDA", "AUTO POSTO MAQUINE LTDA", "AUTO POSTO MARIO CAMPOS COMERCIO DE COMBUSTIVEIS LTDA", "AUTO POSTO PORTAL DO NORTE LTDA", "AUTO POSTO VERONA LTDA", "AUTOREDE LOCADORA DE VEICULOS LTDA", "AUTOREDE PARTICIPACOES LTDA", "AXJ PARTICIPACOES EIRELI", "AXP GESTAO PATRIMONIAL LTDA", "AZEVEDO & CIA", "BARAO VPP CONVENIENCIAS LTDA", "BARTELS DERMATOLOGIA ESTETICA E LASER LTDA", "BEL DISTRIBUIDOR DE LUBRIFICANTES LTDA", "BEL DISTRIBUIDOR DE LUBRIFICANTES LTDA FILIAL 02-79", "BEL LUBRIFICANTES ESPECIAIS LTDA", "BELTMORE PARTICIPACOES LTDA", "BEMX - PARTICIPACOES E EMPREENDIMENTOS LTDA", "BIOCLINTECH CIENTIFICA LTDA", "BIOCLINTECH LTDA", "BIOCLINTECH MANUTENCAO LTDA", "BLUE SKY PARTICIPACOES LTDA", "BMC EDITORA LTDA", "BMGL PARTICIPACOES E EMPREENDIMENTOS IMOBILIARIOS LTDA", "BOA VISTA ASSESSORIA LTDA", "BOA VISTA BOCAIUVA HOTEL LTDA", "BORA EMBALAGENS LTDA", "BRANT EMPREENDIMENTOS LTDA", "BRASIL CONCRETO LTDA", "BRAZIL MANIA LTDA", "BRB TRANSPORTES LTDA", "BRM COMERCIO DE VEICULOS LTDA", "BRM COMERCIO DE VEICULOS LTDA FILIAL 02-24", "BROMELIAS GESTAO PATRIMONIAL LTDA", "BURITIS CONVENIENCIA LTDA", "BV DISTRIBUIDORA LTDA", "CAD COMERCIAL DE MAQUINAS LTDA", "CAMPO ALEGRE PARTICIPACOES LTDA", "CAPITAO COMERCIO DE COMBUSTIVEIS LTDA", "CASA NOVA SPE LTDA", "CASA SEMPRE VIVA COMERCIO DE MATERIAIS DE CONSTRUCAO LTDA", "CASCALHO PARTICIPACOES LTDA", "CATIRA INTERMEDIACOES DE NEGOCIOS LTDA", "CCA COMERCIAL DE COMBUSTIVEIS AUTOMOTIVOS LTDA", "CDI NUCLEAR LTDA", "CDVM LTDA", "CELT -COMERCIO DE COMBUSTIVEIS E LUBRIFICANTES LTDA", "CENTER POSTO LTDA", "CENTER POSTO LTDA FILIAL 02-12", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 02-49", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 04-00", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 05-91", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 07-53", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 09-15", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 10-59", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 11-30", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 14-82", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 17-25", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 19-97", "CENTRO DE DIAGNOSTICO POR IMAGEM LTDA FILIAL 20-20", "CGA SERVICOS MEDICOS LTDA", "CGI - EMPREENDIMENTOS COMERCIAL LTDA", "CHAVE DE OURO EMPREENDIMENTOS IMOBILIARIOS EIRELI", "CHEL LTDA", "CHEQUER & COELHO LTDA", "CIA ITABIRITO INDUSTRIAL FIACAO E TECELAGEM DE ALGODAO", "CIAZA CONSTRUTORA LTDA", "CLAM CONSULTORIA LTDA", "CLAM ENGENHARIA LTDA", "CLAM ENGENHARIA LTDA FILIAL 03-00", "CLAM ESG LTDA", "CLAM MEIO AMBIENTE LTDA", "CLAM MEIO AMBIENTE LTDA FILIAL 02-49", "CLAM MONITORAMENTO AMBIENTAL LTDA", "CLAM MONITORAMENTO AMBIENTAL LTDA", "CLAM PARTICIPACOES E INVESTIMENTOS S/A", "CLINICA LEV SAVASSI LTDA", "CLINICA RADIOLOGICA ELDORADO LTDA", "CLINICA UNIAO SERVICOS MEDICOS LTDA", "COELHO CONVENIENCIA LTDA", "COELHO E PEREIRA EIRELI", "COLISEU SERVICOS ADMINISTRATIVOS LTDA", "COMERCIAL AVIAMENTOS LTDA", "COMERCIAL FOCCUS LTDA", "COMERCIAL GIULIANO LIMITADA", "COMERCIAL OLIVEIRA & BRANT LTDA", "COMERCIAL OLIVEIRA & BRANT LTDA", "COMERCIO LANCHE KARRAO LTDA", "CONSORCIO ENGEBRAS ILCON SES 0620240094", "CONSORCIO GERASUN SOLAR", "CONSTANTINO MATIAS NOGUEIRA - IMOVEIS", "CONSTANTINO MATIAS NOGUEIRA - PATRIMONIAL LTDA", "CONSTRUTORA AGMAR LTDA", "CONSTRUTORA AGMAR LTDA", "CONSTRUTORA AGMAR LTDA FILIAL 02-10", "CONSTRUTORA E INCORPORADORA SPLIT LTDA", "CONTABILIDADE LTDA", "CONVENIENCIA DOIS IRMAOS - EIRELI", "CONVENIENCIA DOIS IRMAOS LTDA", "CORRETORA DE SEGUROS BELO HORIZONTE LTDA", "CRISTAL VALLE ADMINISTRACAO LTDA", "CRISTAL VALLE INDUSTRIA E COMERCIO DE VIDROS LTDA", "CSV GESTAO PATRIMONIAL LTDA", "CVQ I SPE LTDA", "CVQ II SPE LTDA", "D.L.A. SERVICOS ADMINISTRATIVOS LTDA", "DEBURR COMERCIO DE COSMETICOS LTDA", "DEL PAPEIS LTDA", "DEL PAPEIS LTDA FILIAL 03-84", "DELMA - COMERCIO DE COMBUSTIVEIS LTDA", "DH ORIGINAL IMPORTACAO E EXPORTACAO LTDA", "DISTRIBUIDORA BIOCLIN DIAGNOSTICA LTDA", "DJB PARTICIPACOES LTDA", "DOBRAFLEX CORTE E DOBRA DE METAIS LTDA", "DVS PARTICIPACOES LTDA", "E.D. TECNOLOGIA DIGITAL BH LTDA", "EAGLE ADMINISTRACAO LTDA", "EDIFICIO REDE OFFICE I", "ELETROFERRAGENS RM EIRELI", "EMAG CONSTRUTORA LTDA", "EMAG CONSTRUTORA LTDA", "EMIS MINAS DISTRIBUIDORA DE PRODUTOS FARMACEUTICOS LTDA", "EMP - AVALIACAO EM RECURSOS HUMANOS LTDA", "EMPIRE DJB PATRIMONIAL LTDA", "ENERGY TRANSPORTES LTDA", "ENGEBRAS CONSTRUTORA LTDA", "ESMIG INDUSTRIA DE ESCADAS LTDA", "ESMIG INDUSTRIA DE ESCADAS LTDA FILIAL 03-89", "ESTACIONAMENTO AGMAR LTDA", "ESTACIONAMENTO AGMAR LTDA FILIAL 02-06", "ESTACIONAMENTO AGMAR LTDA FILIAL 03-89", "ESTACIONAMENTO AGMAR LTDA FILIAL 04-60", "ESTIVA PARTICIPACOES LTDA", "EVELINE DE PAULA BARTELS", "EVERYBODY - CENTRO DE PERFORMANCE E FISIOTERAPIA LTDA", "EVOLUTION CONSULTORIA E GESTAO EMPRESARIAL S/A", "EXPRESSO FERRENSE LTDA", "FAST GESTAO DE RECURSOS LTDA", "FAST TEAM SERVICOS DE ESTETICA AUTOMOTIVA LTDA", "FASTPLOT SERVICOS DE ESTETICA AUTOMOTIVA LTDA", "FATIMA ADMINISTRACAO LTDA", "FCF CONSULTORIA LTDA", "FCK PREMOLDADOS LTDA FILIAL 02", "FCK PREMOLDADOS LTDA FILIAL 03", "FCK PREMOLDADOS LTDA", "FCK TRANSPORTES LTDA", "FEAG - FERRAGENS AGMAR PARA FACHADA EIRELI", "FERREIRA ADMINISTRACAO LTDA", "FERRO E ACO TAKONO LTDA", "FERRO E ACO TAKONO LTDA FILIAL 0028-03", "FERRO E ACO TAKONO LTDA FILIAL 06-06", "FERRO E ACO TAKONO LTDA FILIAL 07-89", "FERRO E ACO TAKONO LTDA FILIAL 08-60", "FERRO E ACO TAKONO LTDA FILIAL 10-84", "FERRO E ACO TAKONO LTDA FILIAL 11-65", "FERRO E ACO TAKONO LTDA FILIAL 12-46", "FERRO E ACO TAKONO LTDA FILIAL 13-27", "FERRO E ACO TAKONO LTDA FILIAL 14-08", "FERRO E ACO TAKONO LTDA FILIAL 15-99", "FERRO E ACO TAKONO LTDA FILIAL 16-70", "FERRO E ACO TAKONO LTDA FILIAL 18-31", "FERRO E ACO TAKONO LTDA FILIAL 19-12", "FERRO E ACO TAKONO LTDA FILIAL 20-56", "FERRO E ACO TAKONO LTDA FILIAL 21-37", "FERRO E ACO TAKONO LTDA FILIAL 22-18", "FERRO E ACO TAKONO LTDA FILIAL 23-07", "FERRO E ACO TAKONO LTDA FILIAL 24-80", "FERRO E ACO TAKONO LTDA FILIAL 25-60", "FERRO E ACO TAKONO LTDA FILIAL 26-41", "FERRO E ACO TAKONO LTDA FILIAL 27-22", "FIX MANUTENCAO PREDIAL LTDA", "FIX MANUTENCOES LTDA", "FLARA GESTAO PATRIMONIAL LTDA", "FMPL PARTICIPACOES LTDA", "FORTRESS GESTAO PARTICIPACOES LTDA", "FRADE PARTICIPACOES LTDA", "FS PROCESSAMENTO DE DADOS LTDA", "GAMA SERV LTDA", "GECORP GESTAO DE BENEFICIOS E CORRETORA DE SEGUROS LTDA", "GENETICENTER - CENTRO DE GENETICA LTDA", "GERTH CONSULTORIA E PROMOCOES DE VENDAS LTDA", "GFF ENGENHARIA LTDA", "GIBRALTAR HOLDING LTDA", "GIOVANNI CARLECH GUIMARAES MARQUEZANI", "GMAC ESTACIONAMENTOS LTDA", "GMB ASSESSORIA LTDA", "GNV SETE BELO LTDA", "GPK PARTICIPACOES LTDA", "GR COMBUSTIVEIS LTDA", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA FILIAL 03-50", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA FILIAL 04-31", "GRB INDUSTRIA E COMERCIO DE EQUIPAMENTOS LTDA FILIAL 05-12", "GROUND GESTAO PATRIMONIAL LTDA", "GSC GESTAO PATRIMONIAL LTDA", "GUIMARAES & VIEIRA DE MELLO SOCIEDADE DE ADVOGADOS", "GUIMARAES E VIEIRA DE MELLO ADVOGADOS", "GVM ADMINISTRACAO E CONSULTORIA LTDA", "GVM CONSORCIO", "GVM CORRETORA DE SEGUROS LTDA", "GWS ENGENHARIA LTDA", "GWS TECH LTDA", "H.C.-COMERCIO DE ALIMENTOS LTDA", "H.C.-COMERCIO DE ALIMENTOS LTDA", "HAND SHOP SUPRIMENTOS MEDICOS E TERAPEUTICOS LTDA", "HC COMERCIO DE ALIMENTOS LTDA", "HC COMERCIO DE ALIMENTOS LTDA FILIAL 03-63", "HOLDING MAIS MABC LTDA", "HOTEL SAO BENTO LTDA", "HPX PARTICIPACOES LTDA", "HSP GESTAO PATRIMONIAL LTDA", "HVAR INCORPORACOES LTDA", "I9 GESTAO E PARTICIPACOES LTDA", "IB COMBUSTIVEL LTDA", "IB TRANSPORTES & EMPREENDIMENTOS LTDA", "INCONFIDENTES PARTICIPACOES LTDA", "INCORPORADORA MONTE VERDE SPE LTDA", "INDUSTRIA DE TRANSFORMADORES KING LIMITADA", "INFLUXO SOCIEDADE DE PROFISSIONAIS", "INSTITUTO PERSONA INTELIGENCIA EMOCIONAL LTDA", "INTERWEG ADM E CORRETORA DE SEGUROS LTDA", "INTERWEG CORRETORA DE SEGUROS E BENEFICIOS LTDA", "J.V.V. GESTAO PATRIMONIAL LTDA", "JACL PARTICIPACOES LTDA", "JARDINO MALL LTDA", "JCA SERVICOS DE RADIOLOGIA LTDA", "JCM PARTICIPACOES LTDA", "JHCL GESTAO PATRIMONIAL LTDA", "JJA LOCACOES LTDA", "JKV GESTAO PATRIMONIAL LTDA", "JPAMACEDO E PARTICIPACOES LTDA", "JR LAVA JATO EIRELI", "JVC PARTICIPACOES LTDA", "JVP GESTAO PATRIMONIAL LTDA", "K10 PARTICIPACOES LTDA", "KALAB LOPES GESTAO PATRIMONIAL LTDA", "KALAB NEGOCIOS IMOBILIARIOS LTDA", "L.O. IMPORT EXPORT LTDA", "LABORATORIO DE PATOLOGIA CIRURGICA E CITOPATOLOGIA LTDA", "LABORATORIO DE PATOLOGIA CIRURGICA E CITOPATOLOGIA LTDA FILIAL 03-44", "LETOM EMPREENDIMENTOS LTDA", "LGX - PARTICIPACOES E ADMINISTRACAO LTDA", "LINK INDUSTRIA E COMERCIO DE MAQUINAS PARA MINERACAO LTDA", "LINK INDUSTRIA E COMERCIO DE MAQUINAS PARA MINERACAO LTDA FILIAL 03-05", "LOCS LOCADORA DE VEICULOS LTDA", "LS ENTERPRISE SOLLUTIONS LTDA", "M A B COSTA LTDA", "M L SILVEIRA SERVICOS CORPORATIVOS EIRELI", "MADA CLINICA ODONTOLOGICA LTDA", "MAIS CONSTRUCOES LTDA", "MAIS NEGOCIOS E REPRESENTACOES LTDA", "MAQUINAS RABELLO ITABAYANA LIMITADA", "MAR UP CONSULTORIA GESTAO E REPRESENTACAO COMERCIAL LTDA", "MAR9 TRATAMENTO DE DADOS LTDA", "MARCHALENTA AUTO SERVICOS LTDA", "MARCHALIVRE SERVICOS E PECAS LTDA", "MARCO GRILLI COMERCIO DE OBJETOS DE ARTE LTDA", "MARIA CHEQUER PARTICIPACOES LTDA", "MARIA CHEQUER PATRIMONIAL LTDA", "MARIANA CARLECH GUIMARAES MARQUEZANI", "MARICABI GESTAO PATRIMONIAL LTDA", "MASSIME DISTRIBUIDORA DE MEDICAMENTOS LTDA", "MASTER AUTO POSTO LTDA", "MASTER EMPREENDIMENTOS E PARTICIPACOES LTDA", "MASTER PISOS MATERIAL DE CONSTRUCAO EIRELI", "MATTA NUNES REPRESENTACOES COMERCIAIS E GESTAO DE NEGOCIOS LTDA", "MAX GESTAO PATRIMONIAL LTDA", "MD EMPREENDIMENTOS S.A", "MEDWAY SOLUCOES PARA A SAUDE LTDA", "MENDONCA E FERREIRA PARTICIPACOES LTDA", "MENDONCA E FERREIRA PATRIMONIAL LTDA", "MENDONCA E FILHOS GESTAO PATRIMONIAL LTDA", "MENDONCA PARTICIPACOES LTDA", "MEROS GESTAO PATRIMONIAL LTDA", "MG CONVENIENCIA LTDA", "MG CONVENIENCIA LTDA FILIAL 02-57", "MICRONIC COMERCIO E INDUSTRIA LTDA", "MILENE GUIMARAES MARQUEZANI", "MINAS GERAIS ADMINISTRADORA DE IMOVEIS LTDA", "MINEIRAO POSTO DE SERVICOS LTDA", "MLM HOLDING EIRELI", "MM COMERCIO DE DERIVADOS DE PETROLEO LTDA", "MMORAES PARTICIPACOES LTDA", "MONTE VERDE EDIFICACOES I SPE LTDA", "MONTE VERDE URBANIZACOES SPE LTDA", "MP INCORPORACOES LTDA", "MRI MOVIMENTACAO E RECUPERACAO INDUSTRIAL LTDA", "MRLIZ CONSULTORIA LTDA", "MTL PARTICIPACOES LTDA", "MULT SERVICOS ADMINISTRATIVOS LTDA", "MWA PARTICIPACOES LTDA", "MWA PATRIMONIAL LTDA", "NACIONAL RENOVAVEIS LTDA", "NATUREZA X COMERCIO LTDA", "NOSSA OBRA VAREJO DIGITAL LTDA", "NRSM REFORMAS LTDA", "NVB SERVICOS LTDA", "OLE PARTICIPACOES LTDA", "OLIVEIRA SANTOS ADVOGADOS", "OPEN-5 LTDA", "OPEN-5 LTDA", "OPX PARTICIPACOES LTDA", "ORGANIZACAO COMERCIAL MARINHO LTDA", "ORGANIZACOES SOUKI EIRELI", "ORGANIZACOES SOUKI EIRELI FILIAL 03-32", "ORIENT AUTOMOVEIS PECAS E SERVICOS LTDA", "ORIENT AUTOMOVEIS PECAS E SERVICOS LTDA FILIAL 03-43", "ORIENT AUTOMOVEIS PECAS E SERVICOS LTDA FILIAL 04-24", "ORIENTE FARMACEUTICA COMERCIO IMPORTACAO E EXPORTACAO LTDA", "PADUA COMERCIO E INDUSTRIA LTDA", "PAIVA BRANT LTDA", "PAIVA EMPREENDIMENTOS E GESTAO DE IMOVEIS PROPRIOS LTDA", "PCFORYOU LTDA", "PEMAX INTERMEDIACAO E NEGOCIOS LTDA", "PERFORMANCE GESTAO EMPRESARIAL LTDA", "PETRODATA PROCESSAMENTO DE DADOS LTDA", "PLATAFORMA AM3 LTDA", "PNEUS JUA COMERCIO DE PNEUS LTDA", "PONTUAUTO CENTRO AUTOMOTIVO LTDA", "POP EMPREENDIMENTOS E PARTICIPACOES S/A", "POSTO AEROPORTO LTDA", "POSTO AGUIA COMERCIO DE COMBUSTIVEIS LTDA", "POSTO ALAMO LTDA", "POSTO ALLGAS LTDA", "POSTO AVENIDA BRASIL COMERCIO DE COMBUSTIVEIS LTDA", "POSTO BALNEARIO AGUA LIMPA LTDA", "POSTO BARAO VPP LTDA", "POSTO BERIMBAU LTDA", "POSTO BURITIS LTDA", "POSTO CATEDRAL LTDA", "POSTO CENTER NORTE LTDA", "POSTO COELHO LTDA", "POSTO DANUBIO LTDA", "POSTO DE COMBUSTIVEIS CENTER SUL LTDA", "POSTO DE COMBUSTIVEIS SANTO AGOSTINHO LTDA", "POSTO DE COMBUSTIVEL PETROLANDIA LTDA", "POSTO DE COMBUSTIVEL VILA CRUZEIRO LIMITADA", "POSTO ESTORIL LTDA", "POSTO FORMULA BR LTDA", "POSTO HUGO WERNECK LTDA", "POSTO IPE COMERCIO DE COMBUSTIVEIS LTDA", "POSTO IRMAOS AULER LTDA", "POSTO JUPITER LTDA", "POSTO LESTE LTDA", "POSTO MARIO WERNECK LIMITADA", "POSTO MAURITANIA LTDA", "POSTO MINAS SHOPPING LTDA", "POSTO MINASLANDIA LTDA", "POSTO MONTE VERDE LTDA", "POSTO MUSTANG LTDA", "POSTO NOGUEIRINHA LTDA", "POSTO OCEANO AZUL LTDA", "POSTO OCEANO LTDA", "POSTO PANAMERA LTDA", "POSTO PARQUE BURITIS LTDA", "POSTO PARQUE JARDIM LTDA", "POSTO PICA PAU LTDA", "POSTO POETA LTDA", "POSTO PORTAL DE BETIM LTDA", "POSTO PORTAL DE CONTAGEM LTDA", "POSTO PORTAL DOS CAICARAS LTDA", "POSTO SIGMA LTDA", "POSTO SOBERANO AUTORAMA LTDA", "POSTO SOBERANO KARRAO LTDA", "POSTO SOBERANO SETE DE SETEMBRO LTDA", "POSTO TATIANA LTDA", "POSTO TROVAO LTDA", "POSTO VIA FERNAO DIAS LTDA", "POSTO VILA CHALE LTDA", "POSTO VILA DA SERRA LTDA", "POSTO VILA PICA PAU LTDA", "POSTO ZEPPE GRAND PRIX LTDA", "POSTO ZEPPE MG LTDA", "POSTO ZEPPE OASIS LTDA", "POSTO ZEPPE SAO JOSE LTDA", "POSTO ZEPPELIN LTDA", "PPML INDUSTRIA E COMERCIO DE ROUPAS EIRELI", "PRESERVAR PARTICIPACOES LTDA", "PRIMA LINEA AUTOMOVEIS LTDA", "PRIMOLA FRAGRANCIAS LTDA FILIAL 04-30", "PROFIT FOODS LTDA", "PROJETOUM COMERCIO E REPRESENTACOES LTDA", "PROJETOUM COMERCIO E REPRESENTACOES LTDA FILIAL 0002-27", "PROPELLER LTDA", "PROSERVICE LTDA", "PROSPECTIVA SOCIEDADE DE PROFISSIONAIS", "PURA SAUDE ALIMENTOS LTDA", "PURA SAUDE ALIMENTOS LTDA FILIAL 02-88", "QUADRIJET ALPHAVILLE COMERCIO LTDA", "QUEOPZ GESTAO PATRIMONIAL LTDA", "QUIBASA QUIMICA BASICA LTDA", "QUIBASA QUIMICA BASICA LTDA FILIAL 02-98", "QUIBASA QUIMICA BASICA LTDA FILIAL 03-79", "QUICK CONVENIENCIAS LTDA", "QUICK LUBE COMERCIO DE PRODUTOS E FRANQUIAS LTDA", "RACCO EQUIPAMENTOS E SERVICOS EIRELI", "RACCO SERVICOS DE PUBLICIDADE E COMUNICACAO LTDA", "RC INVEST PARTICIPACOES LTDA", "RECICLAGEM PASSARELA LTDA", "REDE A PUBLICIDADE E PROPAGANDA LTDA", "REDE OFFICE INCORPORACOES LTDA", "RESIDENCIAL ANDORINHAS SPE LTDA", "RESIDENCIAL PACIFICO RIBEIRAO DAS NEVES SPE LTDA", "RESIDENCIAL PACIFICO RIBEIRAO DAS NEVES SPE LTDA FILIAL 02-72", "RESIDENCIAL VILA AMAZONAS SPE LTDA","RESIDENCIAL VILA AMAZONAS SPE LTDA FILIAL 02-91", "RESIDENCIAL VILA ATLANTICO SABARA SPE LTDA", "RESIDENCIAL VILA ATLANTICO SABARA SPE LTDA", "RESIDENCIAL VILA CONCEICAO SPE LTDA", "RESIDENCIAL VILA CONCEICAO SPE LTDA FILIAL 02-01", "RESIDENCIAL VILA MORGANTI I SCP", "RESIDENCIAL VILA MORGANTI I SPE LTDA", "RESIDENCIAL VILA MORGANTI I SPE LTDA FILIAL 02-05", "RESIDENCIAL VILA SAO JOSE I SPE LTDA", "RESIDENCIAL VILA SAO JOSE I SPE LTDA FILIAL 02-64", "RESIDENCIAL VILA SAO JOSE II SPE LTDA", "RESIDENCIAL VILA SAO JOSE II SPE LTDA FILIAL 0002-01", "RESIDENCIAL VILA SAO JOSE SCP", "RETES IMAGENS SERVICOS E CONSULTORIA LTDA", "RFX ADMINISTRACAO DE RECURSOS LTDA", "RFX CONSULTORIA E GESTAO DE NEGOCIOS LTDA", "RFX DISTRIBUIDORA DE PRODUTOS AUTOMOTIVOS LTDA", "RFX GESTAO PATRIMONIAL LTDA", "RFX LOGISTICA E TRANSPORTES DE COMBUSTIVEIS LTDA", "RFX TREINAMENTO PROFISSIONAL LTDA", "RGGC EMPREENDIMENTOS LTDA", "RH CENTRO DE SAUDE LTDA", "RICARDO SANTOS BRANT", "ROCKET GESTAO PATRIMONIAL LTDA", "ROL COMERCIO DE DERIVADOS DE PETROLEO LTDA", "RPB COMERCIO DE COMBUSTIVEL LTDA", "RSM COMERCIO E GERENCIAMENTO DE RESIDUOS GUAXUPE EIRELI", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SAINT EMILION AUTOMOVEIS PECAS E SERVICOS LTDA", "SANTA CLARA AGROPECUARIA LTDA", "SANTA MARIA ECOLOGIC EQUIPAMENTOS LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC LTDA", "SANTA MARIA ECOLOGIC RESIDUOS LTDA", "SANTORINI POSTO DE SERVICOS LTDA", "SARAMENHA ENGENHARIA LTDA", "SCP AUDITORIA DE IMPOSTOS E CONTRIBUICOES", "SCP CLAM ENGENHARIA LTDA", "SCP CLINICA RADIOLOGICA ELDORADO LTDA", "SCP DIAGNOSTICO BETIMBARREIRO LTDA", "SCP RESIDENCIAL VILA CONCEICAO", "SCP VILA PACIFICO SANCRUZA", "SE LOTEAMENTOS LTDA", "SETEC- CONSULTORIA EMPRESARIAL LTDA", "SICAL INDUSTRIAL LTDA", "SIMEX ENTREGAS E MOVIMENTACAO DE CARGAS LTDA", "SIX TRACKS LTDA", "SOBERANO LOJAS DE CONVENIENCIA LTDA", "SOBERANO LUBRIFICANTES LTDA", "SOBERANO SERVICOS LTDA", "SOBERANO TRANSPORTES LTDA", "SOLAR VOLT SOLUCOES COMERCIO E INSTALACAO PARA ENERGIA LTDA", "SOLUCAO CORTE E DOBRA DE METAIS LTDA", "SOLVE OPERACAO, MANUTENCAO E COMISSIONAMENTO DE SISTEMAS FOTOVOLTAICOS LTDA", "SOLVIA SOLUCOES VIARIAS LTDA", "SP IMPORTS LTDA", "SP IMPORTS LTDA FILIAL 02-70", "SP IMPORTS LTDA FILIAL 03-50", "SPE JARDINS DOS BURITIS LTDA", "SPE JARDINS DOS BURITIS LTDA FILIAL 02-60", "SPE LA BRESSE LTDA", "SPE MARIA FAUSTINA LTDA", "SPE MIRANTE DO LAGO SETE LAGOAS LTDA", "SSME EMPREENDIMENTOS IMOBILIARIOS LTDA FILIAL 02-76", "SSME EMPREENDIMENTOS IMOBILIARIOS LTDA", "SSME FLORESTAL LTDA", "SSME FLORESTAL LTDA FILIAL 0002-43", "SSME FLORESTAL LTDA FILIAL 0003-24", "SSME FLORESTAL LTDA FILIAL 0005-96", "SSME FLORESTAL LTDA FILIAL 0006-77", "SSME FLORESTAL LTDA FILIAL 0007-58", "SSME FLORESTAL LTDA FILIAL 0008-39", "SSME FLORESTAL LTDA FILIAL 0009-10", "SSME FLORESTAL LTDA FILIAL 0010-53", "SSME FLORESTAL LTDA FILIAL 0011-34", "SSME FLORESTAL LTDA FILIAL 0012-15", "SSME FLORESTAL LTDA FILIAL 0013-04", "SSME FLORESTAL LTDA FILIAL 0014-87", "SUDESTE ADMINISTRADORA DE SERVICOS LTDA", "SUDESTE ENGENHARIA E COMERCIO LTDA", "SUDESTE ENGENHARIA E COMERCIO LTDA FILIAL 02-39", "SUDESTE ENGENHARIA E COMERCIO LTDA FILIAL 03-10", "SUDESTE PARTICIPACOES LTDA", "SV LOGISTICA LTDA", "SV RANCHO VELHO GERACAO DE ENERGIA SPE LTDA", "SWA PARTICIPACOES LTDA", "SWA PATRIMONIAL LTDA", "TAKONO DISTRIBUICAO LTDA", "TASK SOFTWARE LTDA", "TAX CLOUD SOLUCOES LTDA", "TCX COMERCIO E INDUSTRIA DE EQUIPAMENTOS PECAS E SERVICOS LTDA", "TEBAS ADMINISTRACAO LTDA", "TECHNEACO ENGENHARIA LTDA", "TECHNEACO ENGENHARIA LTDA FILIAL 02-58", "TECNOCAP RECAPAGEM E PNEUS LTDA", "THAISSA CALAB CURSOS LTDA", "THAISSA CALAB ODONTOLOGIA LTDA", "TIMBIRAS PARTICIPACOES LTDA", "TK LOCACAO DE EQUIPAMENTOS LTDA", "TK PATRIMONIAL LTDA", "TLUANER PARTICIPACOES S/A", "TMJ MARCA E PATENTE LTDA", "TOP RAJA CAR LOCADORA DE VEICULOS LTDA", "TOPAZIO IMPERIAL MINERACAO COMERCIO E INDUSTRIA LTDA", "TRANSPORTADORA DONIZETE LTDA", "TRANSPORTES BOA VISTA LOGISTICA LTDA", "TRIACO ESTRUTURAS METALICAS LTDA", "TURMALINA INCORPORACOES SPE LTDA", "USA DIAGNOSTICA LTDA", "VALADAO E SANTOS PARTICIPACOES LTDA", "VALUMA COBRANCA E NEGOCIOS LTDA", "VCA COMERCIO LTDA", "VCS COMERCIO LTDA", "VEIGA ESTRUTURAS METALICAS LTDA", "VENETO EMPREENDIMENTO COMERCIAL LTDA", "VEREDAS DA SERRA COMBUSTIVEL LTDA", "VERO LATTE COMERCIO DE ALIMENTOS LTDA", "VERO LATTE COMERCIO DE ALIMENTOS LTDA", "VERO LATTE COMERCIO DE ALIMENTOS LTDA", "VIA MONDO APS LTDA", "VIA MONDO APS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA", "VIA MONDO AUTOMOVEIS E PECAS LTDA - FILIAL 08-80", "VIA MONDO AUTOMOVEIS E PECAS LTDA - FILIAL 09-61", "VIA MONDO DISTRIBUIDORA DE PECAS E ACESSORIOS AUTOMOTIVOS LTDA",  "VIA MONDO DISTRIBUIDORA DE PECAS E ACESSORIOS AUTOMOTIVOS LTDA", "VIA MONDO FANDI LTDA", "VIA MONDO LOCADORA LTDA", "VIA MONDO LOCADORA LTDA FILIAL 02-94", "VIA MONDO LOCADORA LTDA FILIAL 03-75", "VIA MONDO MULTIMARCAS LTDA", "VIA MONDO TRANSPORTES LTDA", "VIEIRA ADMINISTRACAO LTDA", "VILA CLARA VITORIA LTDA", "VJ PARTICIPACOES LTDA", "VJ PATRIMONIAL LTDA", "VN EMPREENDIMENTOS LTDA", "VSX VALVULAS E EQUIPAMENTOS LTDA", "WOLF PARTICIPACOES S/A", "WRN PARTICIPACOES LTDA", "ZOX GESTAO PATRIMONIAL LTDA"])
-    query = "SELECT * FROM registros"
-    if empresa_filtro:
-        query += " WHERE empresa LIKE ?"
-        registros = pd.read_sql_query(query, conn, params=(f"%{empresa_filtro}%",))
-    else:
-        registros = pd.read_sql_query(query, conn)
+    empresa_filtro = st.selectbox("Nome da empresa" , nomes_empresas, index=None, placeholder="Todas as empresas")
+    col1, col2, col3 = st.columns(3)
+    status_filtro = col1.selectbox("Status", ["Pendente", "Resolvido", "OK"], index=None, placeholder="Todos")
+    tipo_nota_filtro = col2.selectbox("Tipo de Nota", TIPOS_NOTA, index=None, placeholder="Todos")
+    periodo = col3.date_input("Período", value=(), format="DD/MM/YYYY")
+    termo_erro = st.text_input("Buscar no erro")
+    data_inicio = periodo[0] if len(periodo) > 0 else None
+    data_fim = periodo[1] if len(periodo) > 1 else data_inicio
+
+    # Paginação por chave: guarda o cursor de início de cada página já visitada.
+    filtros = (empresa_filtro, status_filtro, tipo_nota_filtro, data_inicio, data_fim, termo_erro)
+    if st.session_state.get("registros_filtros") != filtros:
+        st.session_state["registros_filtros"] = filtros
+        st.session_state["registros_cursores"] = [None]
+    cursores = st.session_state["registros_cursores"]
+    registros, proximo_cursor = buscar_registros(conn, empresa_filtro, status_filtro, tipo_nota_filtro,
+                                                 data_inicio, data_fim, termo_erro, cursores[-1])
 
     st.subheader("📋 Registros Importação")
-    if not registros.empty:
-        for index, row in registros.iterrows():
+    if registros:
+        for row in registros:
             with st.expander(f"📌 {row['empresa']} - {row['tipo_nota']}"):
                 st.write(f"**Erro:** {row['erro']}" if row['erro'] else "**Sem erro registrado.**")
                 st.write(f"**Data:** {row['data']}")
                 st.write(f"**Status:** {row['status']}")
-                if row['arquivo_erro'] and os.path.exists(row['arquivo_erro']):
-                    st.markdown(f"[📷 Visualizar Imagem]({row['arquivo_erro']})", unsafe_allow_html=True)
-                    st.image(row['arquivo_erro'], caption="", use_container_width=True)
+                # O conteúdo do expander é enviado mesmo fechado: a lista mostra só a miniatura,
+                # e a imagem original só é carregada quando pedida.
+                caminho_miniatura = miniatura(conn, row['arquivo_erro'])
+                if caminho_miniatura:
+                    st.image(caminho_miniatura, caption="")
+                    if st.toggle("📷 Ver imagem original", key=f"imagem_{row['id']}"):
+                        st.image(row['arquivo_erro'], caption="", use_container_width=True)
                 if row['status'] == "Pendente":
                     if st.button("✔ OK", key=row['id']):
                         cursor.execute("UPDATE registros SET status = 'Resolvido' WHERE id = ?", (row['id'],))
                         conn.commit()
                         st.success(f"✅ Status do registro {row['id']} atualizado para 'Resolvido'.")
                         st.rerun()
+    else:
+        st.info("Nenhum registro encontrado.")
+
+    col_anterior, col_pagina, col_proxima = st.columns([1, 2, 1])
+    if col_anterior.button("⬅ Anterior", disabled=len(cursores) == 1):
+        cursores.pop()
+        st.rerun()
+    col_pagina.caption(f"Página {len(cursores)}")
+    if col_proxima.button("Próxima ➡", disabled=proximo_cursor is None):
+        cursores.append(proximo_cursor)
+        st.rerun()
 
 elif menu == "Indicadores":
     st.title("📈 Indicadores de Importação")
-    query = "SELECT * FROM registros"
-    registros = pd.read_sql_query(query, conn)
+    indicadores = carregar_indicadores(versao_registros(conn))
     
-    if not registros.empty:
+    if indicadores["total"]:
         col1, col2 = st.columns(2)
-        empresa_count = registros["empresa"].value_counts().reset_index()
-        empresa_count.columns = ["Empresa", "Total de Registros"]
+        empresa_count = pd.DataFrame(indicadores["empresa"], columns=["Empresa", "Total de Registros"])
         fig1 = px.pie(empresa_count, names="Empresa", values="Total de Registros", title="📌 Registros por Empresa")
         col1.plotly_chart(fig1)
         
-        tipo_nota_count = registros["tipo_nota"].value_counts().reset_index()
-        tipo_nota_count.columns = ["Tipo de Nota", "Quantidade"]
+        tipo_nota_count = pd.DataFrame(indicadores["tipo_nota"], columns=["Tipo de Nota", "Quantidade"])
         fig2 = px.pie(tipo_nota_count, names="Tipo de Nota", values="Quantidade", title="📌 Tipos de Nota Registradas")
         col2.plotly_chart(fig2)
         
-        importadas = registros["empresa"].nunique()
-        total_registros = len(registros)
-        df_empresas = pd.DataFrame({"Status": ["Importadas", "Não Importadas"], "Quantidade": [importadas, total_registros - importadas]})
+        importadas = len(indicadores["empresa"])
+        total = indicadores["total"]
+        df_empresas = pd.DataFrame({"Status": ["Importadas", "Não Importadas"], "Quantidade": [importadas, total - importadas]})
         fig3 = px.pie(df_empresas, names="Status", values="Quantidade", title="📌 Empresas Importadas vs. Não Importadas")
         st.plotly_chart(fig3)
         
-        if registros["erro"].notna().sum() > 0:
-            erro_count = registros["erro"].value_counts().reset_index().head(5)
-            erro_count.columns = ["Erro", "Frequência"]
+        if indicadores["erro"]:
+            erro_count = pd.DataFrame(indicadores["erro"], columns=["Erro", "Frequência"])
             st.subheader("🔴 Erros Mais Comuns")
             fig4 = px.pie(erro_count, names="Erro", values="Frequência", title="📌 Erros Mais Frequentes")
             st.plotly_chart(fig4)
     
+    st.subheader("⏱ Desempenho do Organizador")
+    desempenho = carregar_desempenho(ultima_execucao(conn))
+    if desempenho["execucoes"]:
+        df_execucoes = pd.DataFrame(desempenho["execucoes"])
+        fig5 = px.line(df_execucoes, x="inicio", y="arquivos_por_segundo", color="origem", markers=True,
+                       hover_data=["empresa", "arquivos", "segundos"], title="📌 Vazão por Execução (arquivos/s)")
+        st.plotly_chart(fig5)
+        
+        df_etapas = pd.DataFrame(desempenho["etapas"])
+        fig6 = px.bar(df_etapas, x="execucao_id", y="segundos", color="etapa", title="📌 Tempo por Etapa (últimas execuções)")
+        st.plotly_chart(fig6)
+        
+        st.write("**Execuções mais lentas por empresa**")
+        st.dataframe(pd.DataFrame(desempenho["lentas"]), hide_index=True)
+    else:
+        st.info("Nenhuma execução do organizador registrada.")
+    
+    st.subheader("🧾 Documentos Fiscais")
+    empresa_fiscal = st.selectbox("Empresa", empresas_com_documentos(conn), index=None, placeholder="Todas as empresas",
+                                  key="empresa_documentos_fiscais")
+    fiscais = carregar_documentos_fiscais(versao_documentos(conn), empresa_fiscal)
+    if fiscais["mensal"]:
+        df_mensal = pd.DataFrame(fiscais["mensal"])
+        col1, col2 = st.columns(2)
+        fig7 = px.bar(df_mensal, x="competencia", y="documentos", color="documento", title="📌 Documentos por Mês")
+        col1.plotly_chart(fig7)
+        fig8 = px.bar(df_mensal, x="competencia", y="valor", color="documento", title="📌 Valor por Mês (R$)")
+        col2.plotly_chart(fig8)
+        
+        if not empresa_fiscal:
+            fig9 = px.bar(pd.DataFrame(fiscais["por_empresa"]), x="empresa", y="valor", hover_data=["documentos", "valor_medio"],
+                          title="📌 Empresas de Maior Valor (R$)")
+            st.plotly_chart(fig9)
+        
+        fig10 = px.pie(pd.DataFrame(fiscais["cfop"]), names="cfop", values="valor", title="📌 Valor por CFOP")
+        st.plotly_chart(fig10)
+    else:
+        st.info("Nenhum documento fiscal extraído. Os campos das NF-e/CT-e são gravados pelas tarefas do organizador e pela linha de comando.")
+    
     st.subheader("📥 Download de Registros")
     data_hoje = datetime.date.today().strftime("%d-%m-%Y")
-    df_hoje = registros[registros['data'] == data_hoje]
+    df_hoje = pd.DataFrame(registros_do_dia(conn, data_hoje))
     if not df_hoje.empty:
         csv = df_hoje.to_csv(index=False).encode("utf-8")
         st.download_button("📥 Baixar Planilha do Dia", data=csv, file_name=f"registros_{data_hoje}.csv", mime="text/csv")
     else:
         st.info("Nenhum registro encontrado para hoje.")
 
-
@@ -0,0 +1,122 @@
+"""
+Imagens anexadas aos registros de importação. O original é guardado pelo hash do conteúdo
+(arquivos_erros/<hash>.<ext>), de modo que o mesmo print enviado duas vezes ocupa o disco uma vez só.
+As miniaturas (JPEG reduzido, arquivos_erros/miniaturas/<hash>.jpg) são um cache: as usadas há mais tempo
+são descartadas acima de LIMITE_BYTES_MINIATURAS e refeitas a partir do original quando voltam a ser pedidas.
+"""
+import io
+import os
+import time
+
+from PIL import Image
+
+from cache_classificacao import hash_conteudo
+
+PASTA_IMAGENS = "arquivos_erros"
+PASTA_MINIATURAS = os.path.join(PASTA_IMAGENS, "miniaturas")
+LADO_MINIATURA = 320
+QUALIDADE_MINIATURA = 70
+LIMITE_BYTES_MINIATURAS = 50 * 1024 * 1024
+# usada_em (que orienta o descarte) só é regravado quando mais antigo que isto, para a lista não escrever no banco a cada rerun.
+INTERVALO_USO_MINIATURA = 3600
+
+
+def criar_tabela_imagens(conn):
+    # caminho é o valor de registros.arquivo_erro; imagens gravadas antes do endereçamento por conteúdo
+    # entram aqui (com o hash calculado uma vez) na primeira vez que a miniatura é pedida.
+    conn.execute('''CREATE TABLE IF NOT EXISTS imagens_erro (
+                        caminho TEXT PRIMARY KEY,
+                        hash TEXT,
+                        tamanho INTEGER,
+                        miniatura TEXT,
+                        tamanho_miniatura INTEGER,
+                        usada_em REAL) WITHOUT ROWID''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_imagens_erro_hash ON imagens_erro (hash)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_imagens_erro_usada_em ON imagens_erro (usada_em)")
+    conn.commit()
+
+def gerar_miniatura(origem, hash_):
+    """ Reduz a imagem (caminho ou fluxo) para caber em LADO_MINIATURA e a grava em JPEG. Devolve (caminho, bytes). """
+    os.makedirs(PASTA_MINIATURAS, exist_ok=True)
+    destino = os.path.join(PASTA_MINIATURAS, f"{hash_}.jpg")
+    with Image.open(origem) as imagem:
+        # Em JPEG, draft decodifica já numa escala reduzida, sem montar a imagem inteira na memória.
+        imagem.draft("RGB", (LADO_MINIATURA, LADO_MINIATURA))
+        imagem.thumbnail((LADO_MINIATURA, LADO_MINIATURA))
+        if imagem.mode != "RGB":
+            # Transparência (prints em PNG) vira fundo branco; o JPEG não tem canal alfa.
+            rgba = imagem.convert("RGBA")
+            imagem = Image.new("RGB", rgba.size, "white")
+            imagem.paste(rgba, mask=rgba)
+        imagem.save(destino, "JPEG", quality=QUALIDADE_MINIATURA, optimize=True)
+    return destino, os.path.getsize(destino)
+
+def guardar_imagem(conn, dados, nome_arquivo):
+    """
+    Guarda a imagem enviada e sua miniatura e devolve o caminho a gravar em registros.arquivo_erro.
+    Se o mesmo conteúdo já foi guardado, devolve o caminho existente sem gravar nada.
+    """
+    hash_ = hash_conteudo(dados)
+    linha = conn.execute("SELECT caminho FROM imagens_erro WHERE hash = ? LIMIT 1", (hash_,)).fetchone()
+    if linha and os.path.exists(linha[0]):
+        return linha[0]
+    extensao = os.path.splitext(nome_arquivo)[1].lower() or ".png"
+    os.makedirs(PASTA_IMAGENS, exist_ok=True)
+    caminho = os.path.join(PASTA_IMAGENS, f"{hash_}{extensao}")
+    with open(caminho, "wb") as f:
+        f.write(dados)
+    try:
+        miniatura, tamanho_miniatura = gerar_miniatura(io.BytesIO(dados), hash_)
+    except (OSError, ValueError):
+        miniatura, tamanho_miniatura = None, None
+    conn.execute('''INSERT OR REPLACE INTO imagens_erro (caminho, hash, tamanho, miniatura, tamanho_miniatura, usada_em)
+                    VALUES (?, ?, ?, ?, ?, ?)''', (caminho, hash_, len(dados), miniatura, tamanho_miniatura, time.time()))
+    conn.commit()
+    podar_miniaturas(conn)
+    return caminho
+
+def miniatura(conn, caminho):
+    """
+    Caminho da miniatura da imagem em caminho (refeita se tiver sido descartada), ou None se o original
+    não existe ou não é uma imagem legível.
+    """
+    if not caminho or not os.path.exists(caminho):
+        return None
+    linha = conn.execute("SELECT hash, miniatura, usada_em FROM imagens_erro WHERE caminho = ?", (caminho,)).fetchone()
+    if linha and linha[1] and os.path.exists(linha[1]):
+        if time.time() - linha[2] > INTERVALO_USO_MINIATURA:
+            conn.execute("UPDATE imagens_erro SET usada_em = ? WHERE caminho = ?", (time.time(), caminho))
+            conn.commit()
+        return linha[1]
+
+    if linha:
+        hash_ = linha[0]
+    else:
+        with open(caminho, "rb") as f:
+            hash_ = hash_conteudo(f.read())
+    try:
+        destino, tamanho_miniatura = gerar_miniatura(caminho, hash_)
+    except (OSError, ValueError):
+        return None
+    # Todos os caminhos com o mesmo conteúdo passam a apontar para a miniatura refeita.
+    conn.execute("UPDATE imagens_erro SET miniatura = ?, tamanho_miniatura = ? WHERE hash = ?",
+                 (destino, tamanho_miniatura, hash_))
+    conn.execute('''INSERT OR REPLACE INTO imagens_erro (caminho, hash, tamanho, miniatura, tamanho_miniatura, usada_em)
+                    VALUES (?, ?, ?, ?, ?, ?)''', (caminho, hash_, os.path.getsize(caminho), destino, tamanho_miniatura, time.time()))
+    conn.commit()
+    podar_miniaturas(conn)
+    return destino
+
+def podar_miniaturas(conn, limite=LIMITE_BYTES_MINIATURAS):
+    """ Apaga as miniaturas usadas há mais tempo até o total voltar ao limite; os originais ficam. """
+    linhas = conn.execute('''SELECT hash, miniatura, MAX(tamanho_miniatura), MAX(usada_em) AS usada_em FROM imagens_erro
+                             WHERE miniatura IS NOT NULL GROUP BY hash, miniatura ORDER BY usada_em DESC''').fetchall()
+    total = 0
+    for hash_, caminho_miniatura, tamanho_miniatura, _ in linhas:
+        total += tamanho_miniatura
+        if total <= limite:
+            continue
+        if os.path.exists(caminho_miniatura):
+            os.remove(caminho_miniatura)
+        conn.execute("UPDATE imagens_erro SET miniatura = NULL, tamanho_miniatura = NULL WHERE hash = ?", (hash_,))
+    conn.commit()
@@ -0,0 +1,83 @@
+import os
+import shutil
+import tempfile
+import zipfile
+
+# ZIPs dentro de ZIPs são abertos até esta profundidade (proteção contra "zip bombs").
+PROFUNDIDADE_MAXIMA_ZIP = 5
+# ZIPs aninhados comprimidos são copiados para um arquivo temporário; até este limite ficam em memória.
+LIMITE_MEMORIA_ZIP_ANINHADO = 16 * 1024 * 1024
+TAMANHO_BLOCO = 1024 * 1024
+
+
+def eh_zip(nome_arquivo):
+    return nome_arquivo.lower().endswith(".zip")
+
+def iterar_zip(fonte, profundidade=0):
+    """
+    Percorre os membros de um ZIP, um de cada vez, sem extraí-los para o disco.
+    Gera tuplas (nome_arquivo, info, abrir); abrir() devolve o fluxo do membro e
+    só é válido até o próximo item. ZIPs aninhados são percorridos recursivamente.
+    """
+    with zipfile.ZipFile(fonte, "r") as zip_ref:
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
+            nome_arquivo = os.path.basename(info.filename)
+            if eh_zip(nome_arquivo) and profundidade < PROFUNDIDADE_MAXIMA_ZIP:
+                with tempfile.SpooledTemporaryFile(max_size=LIMITE_MEMORIA_ZIP_ANINHADO) as aninhado:
+                    with zip_ref.open(info) as origem:
+                        shutil.copyfileobj(origem, aninhado, TAMANHO_BLOCO)
+                    aninhado.seek(0)
+                    yield from iterar_zip(aninhado, profundidade + 1)
+                continue
+            yield nome_arquivo, info, lambda info=info: zip_ref.open(info)
+
+def iterar_caminho(caminho):
+    """
+    Percorre uma pasta (recursivamente) ou um ZIP e gera (nome_arquivo, dados) de cada documento,
+    um de cada vez; ZIPs encontrados pelo caminho são abertos em fluxo por iterar_zip.
+    """
+    for nome_arquivo, ler in iterar_documentos(caminho):
+        yield nome_arquivo, ler()
+
+def iterar_documentos(caminho):
+    """
+    Como iterar_caminho, mas gera (nome_arquivo, ler) e só lê o documento quando ler() é chamado
+    (antes do próximo item): contar ou pular documentos não custa a leitura deles.
+    """
+    if os.path.isdir(caminho):
+        for raiz, pastas, arquivos in os.walk(caminho):
+            pastas.sort()
+            for nome_arquivo in sorted(arquivos):
+                yield from iterar_documentos(os.path.join(raiz, nome_arquivo))
+    elif eh_zip(caminho):
+        for nome_arquivo, _, abrir in iterar_zip(caminho):
+            yield nome_arquivo, lambda abrir=abrir: ler_fluxo(abrir)
+    else:
+        yield os.path.basename(caminho), lambda: ler_fluxo(lambda: open(caminho, "rb"))
+
+def ler_fluxo(abrir):
+    with abrir() as origem:
+        return origem.read()
+
+def nome_disponivel(caminho, usados):
+    """ Evita entradas duplicadas no ZIP de saída acrescentando um sufixo numérico. """
+    if caminho not in usados:
+        usados.add(caminho)
+        return caminho
+    base, extensao = os.path.splitext(caminho)
+    contador = 2
+    while f"{base} ({contador}){extensao}" in usados:
+        contador += 1
+    caminho = f"{base} ({contador}){extensao}"
+    usados.add(caminho)
+    return caminho
+
+def copiar_para_zip(zipf, caminho_destino, origem, info):
+    """ Copia um membro para dentro do ZIP de saída em blocos, com memória limitada. """
+    destino_info = zipfile.ZipInfo(caminho_destino, date_time=info.date_time)
+    destino_info.compress_type = zipf.compression
+    destino_info.file_size = info.file_size
+    with zipf.open(destino_info, "w") as destino:
+        shutil.copyfileobj(origem, destino, TAMANHO_BLOCO)
@@ -0,0 +1,155 @@
+import cProfile
+import datetime
+import os
+import time
+from contextlib import contextmanager
+
+from banco import linhas_como_dicts
+
+# Etapas do organizador, na ordem em que aparecem nos indicadores.
+ETAPAS = ("leitura", "classificacao", "gravacao", "finalizacao")
+# Com o perfil ligado, o dump do cProfile só é guardado para execuções pelo menos tão longas quanto isto.
+LIMITE_EXECUCAO_LENTA = 30.0
+PASTA_PERFIS = "perfis"
+
+
+def criar_tabela_metricas(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS execucoes (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        inicio TEXT,
+                        origem TEXT,
+                        empresa TEXT,
+                        segundos REAL,
+                        arquivos INTEGER,
+                        bytes INTEGER,
+                        erros INTEGER,
+                        perfil TEXT)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS etapas_execucao (
+                        execucao_id INTEGER REFERENCES execucoes (id) ON DELETE CASCADE,
+                        etapa TEXT,
+                        segundos REAL,
+                        arquivos INTEGER,
+                        bytes INTEGER,
+                        erros INTEGER,
+                        PRIMARY KEY (execucao_id, etapa)) WITHOUT ROWID''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_execucoes_empresa ON execucoes (empresa, segundos)")
+    conn.commit()
+
+class Medidor:
+    """
+    Acumula, por etapa, o tempo, os arquivos, os bytes e os erros de uma execução do organizador.
+    O tempo de uma etapa é exclusivo: o que é gasto numa etapa aninhada (a leitura consumida de dentro
+    da classificação, por exemplo) conta só para ela. Com perfilar=True, roda também o cProfile.
+    """
+    def __init__(self, perfilar=False):
+        self.etapas = {nome: {"segundos": 0.0, "arquivos": 0, "bytes": 0, "erros": 0} for nome in ETAPAS}
+        self.perfil = cProfile.Profile() if perfilar else None
+        self.pilha = []
+        self.data = None
+        self.segundos = 0.0
+        self.caminho_perfil = None
+        self._inicio = None
+
+    def __enter__(self):
+        self.data = datetime.datetime.now()
+        self._inicio = time.perf_counter()
+        if self.perfil:
+            self.perfil.enable()
+        return self
+
+    def __exit__(self, *excecao):
+        if self.perfil:
+            self.perfil.disable()
+        self.segundos = time.perf_counter() - self._inicio
+
+    def contar(self, etapa, arquivos=0, bytes=0, erros=0):
+        dados = self.etapas.setdefault(etapa, {"segundos": 0.0, "arquivos": 0, "bytes": 0, "erros": 0})
+        dados["arquivos"] += arquivos
+        dados["bytes"] += bytes
+        dados["erros"] += erros
+
+    @contextmanager
+    def etapa(self, nome):
+        """ Cronometra o bloco na etapa nome; uma exceção conta como erro da etapa e é propagada. """
+        self.pilha.append(0.0)
+        inicio = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.contar(nome, erros=1)
+            raise
+        finally:
+            decorrido = time.perf_counter() - inicio
+            aninhado = self.pilha.pop()
+            self.contar(nome)
+            self.etapas[nome]["segundos"] += decorrido - aninhado
+            if self.pilha:
+                self.pilha[-1] += decorrido
+
+    def iterar(self, nome, iteravel, tamanho=None):
+        """ Repassa os itens de iteravel cronometrando cada next() na etapa nome; tamanho(item) soma os bytes. """
+        iterador = iter(iteravel)
+        while True:
+            with self.etapa(nome):
+                try:
+                    item = next(iterador)
+                except StopIteration:
+                    return
+            self.contar(nome, 1, tamanho(item) if tamanho else 0)
+            yield item
+
+    def resumo(self):
+        """ Texto curto com o tempo de cada etapa, para exibir ao fim do processamento. """
+        return " · ".join(f"{nome} {dados['segundos']:.2f}s" for nome, dados in self.etapas.items())
+
+def gravar_execucao(conn, medidor, origem, empresa=None, limite_perfil=LIMITE_EXECUCAO_LENTA):
+    """ Grava a execução e suas etapas; com perfil e execução lenta, guarda o dump em PASTA_PERFIS. Devolve o id. """
+    leitura = medidor.etapas["leitura"]
+    erros = sum(dados["erros"] for dados in medidor.etapas.values())
+    cursor = conn.execute('''INSERT INTO execucoes (inicio, origem, empresa, segundos, arquivos, bytes, erros)
+                             VALUES (?, ?, ?, ?, ?, ?, ?)''',
+                          (medidor.data.strftime("%Y-%m-%d %H:%M:%S"), origem, empresa, medidor.segundos,
+                           leitura["arquivos"], leitura["bytes"], erros))
+    execucao_id = cursor.lastrowid
+    conn.executemany('''INSERT INTO etapas_execucao (execucao_id, etapa, segundos, arquivos, bytes, erros)
+                        VALUES (?, ?, ?, ?, ?, ?)''',
+                     [(execucao_id, nome, dados["segundos"], dados["arquivos"], dados["bytes"], dados["erros"])
+                      for nome, dados in medidor.etapas.items()])
+    if medidor.perfil and medidor.segundos >= limite_perfil:
+        os.makedirs(PASTA_PERFIS, exist_ok=True)
+        caminho = os.path.join(PASTA_PERFIS, f"execucao_{execucao_id}.prof")
+        medidor.perfil.dump_stats(caminho)
+        medidor.caminho_perfil = caminho
+        conn.execute("UPDATE execucoes SET perfil = ? WHERE id = ?", (caminho, execucao_id))
+    conn.commit()
+    return execucao_id
+
+def ultima_execucao(conn):
+    """ Id da execução mais recente; serve de chave para o cache dos indicadores de desempenho. """
+    return conn.execute("SELECT coalesce(MAX(id), 0) FROM execucoes").fetchone()[0]
+
+def execucoes_recentes(conn, limite=200):
+    """ Últimas execuções, da mais antiga para a mais recente, com a vazão já calculada. """
+    cursor = conn.execute('''SELECT id, inicio, origem, coalesce(empresa, 'Várias empresas') AS empresa, segundos,
+                                    arquivos, bytes, erros,
+                                    arquivos / nullif(segundos, 0) AS arquivos_por_segundo,
+                                    bytes / nullif(segundos, 0) / 1048576.0 AS mb_por_segundo
+                             FROM execucoes ORDER BY id DESC LIMIT ?''', (limite,))
+    return linhas_como_dicts(cursor)[::-1]
+
+def tempo_por_etapa(conn, limite=30):
+    """ [{execucao_id, etapa, segundos}] das últimas execuções. """
+    cursor = conn.execute('''SELECT execucao_id, etapa, segundos FROM etapas_execucao
+                             WHERE execucao_id IN (SELECT id FROM execucoes ORDER BY id DESC LIMIT ?)
+                             ORDER BY execucao_id''', (limite,))
+    return linhas_como_dicts(cursor)
+
+def execucoes_mais_lentas(conn, por_empresa=3):
+    """ As por_empresa execuções mais demoradas de cada empresa, da mais lenta para a mais rápida. """
+    cursor = conn.execute('''SELECT empresa, inicio, origem, segundos, arquivos, arquivos_por_segundo, erros, perfil
+                             FROM (SELECT coalesce(empresa, 'Várias empresas') AS empresa, inicio, origem, segundos,
+                                          arquivos, arquivos / nullif(segundos, 0) AS arquivos_por_segundo, erros, perfil,
+                                          ROW_NUMBER() OVER (PARTITION BY empresa ORDER BY segundos DESC) AS posicao
+                                   FROM execucoes)
+                             WHERE posicao <= ? ORDER BY segundos DESC''', (por_empresa,))
+    return linhas_como_dicts(cursor)
@@ -0,0 +1,66 @@
+from cache_classificacao import classificar_com_cache
+from classificacao import recategorizar
+from empresas import EMPRESA_NAO_IDENTIFICADA, pasta_empresa, rotear_documento
+from ingestao import nome_disponivel
+from metricas import Medidor
+
+
+def organizar_documentos(conn, itens, saida, cnpj_empresa=None, workers=None, indice=None, medidor=None,
+                         identificadores=None, caminhos_usados=None, documentos_fiscais=None, empresas_por_chave=None):
+    """
+    Classifica itens (nome_arquivo, dados) e grava cada documento em saida (ConstrutorZip ou GravadorPasta)
+    na pasta da sua categoria; com indice (CNPJ -> empresa), na pasta de cada empresa do documento (ver
+    rotear_documento). Gera um registro por documento gravado, para estatísticas e manifesto: copia é 0 no
+    primeiro registro de cada item e conta as cópias do mesmo item em outras empresas. O medidor recebe os
+    tempos de leitura, classificação e gravação; a finalização da saida fica com quem chama. Para continuar
+    uma execução interrompida, identificadores ((empresa, identificador)), caminhos_usados e empresas_por_chave
+    trazem os documentos já gravados. Com documentos_fiscais (GravadorDocumentosFiscais), os campos fiscais
+    das NF-e/CT-e são extraídos na mesma leitura e entregues a ele.
+    """
+    medidor = medidor or Medidor()
+    identificadores = set() if identificadores is None else identificadores
+    caminhos_usados = set() if caminhos_usados is None else caminhos_usados
+    empresas_por_chave = {} if empresas_por_chave is None else empresas_por_chave
+    itens = medidor.iterar("leitura", itens, lambda item: len(item[1]))
+    classificados = classificar_com_cache(conn, itens, cnpj_empresa or "", workers, documentos_fiscais is not None)
+    for nome_arquivo, dados, resultado in medidor.iterar("classificacao", classificados, lambda item: len(item[1])):
+        if resultado.get("erro"):
+            medidor.contar("classificacao", erros=1)
+        evento = bool(resultado.get("tipo_evento"))
+        rotas = [(None, None)]
+        if indice is not None:
+            rotas = rotear_documento(resultado, indice, empresas_por_chave)
+            # Os eventos seguintes desta chave vão para as mesmas empresas do documento.
+            empresas = [empresa for empresa, _ in rotas if empresa != EMPRESA_NAO_IDENTIFICADA]
+            if resultado["chave"] and not evento and empresas:
+                empresas_por_chave[resultado["chave"]] = empresas
+
+        for copia, (empresa, cnpj_documento) in enumerate(rotas):
+            registro = {"arquivo": nome_arquivo, "tamanho": len(dados), "categoria": resultado["categoria"],
+                        "empresa": empresa, "chave": resultado["chave"], "identificador": resultado["identificador"],
+                        "evento": evento, "competencia": resultado.get("competencia"), "destino": None,
+                        "duplicado": False, "copia": copia}
+            # O mesmo documento (mesma chave de acesso / Id de evento) entra uma única vez na pasta de cada empresa.
+            if resultado["identificador"]:
+                if (empresa, resultado["identificador"]) in identificadores:
+                    registro["duplicado"] = True
+                    yield registro
+                    continue
+                identificadores.add((empresa, resultado["identificador"]))
+
+            prefixo = ""
+            if indice is not None:
+                registro["categoria"] = recategorizar(resultado, cnpj_documento)
+                prefixo = f"{pasta_empresa(empresa)}/"
+            categoria = registro["categoria"]
+            pasta_tipo, pasta_subtipo = categoria.split("/") if "/" in categoria else (categoria, "OUTROS")
+            # Documentos com período conhecido (SPED, NFS) ganham a subpasta da competência (aaaa-mm).
+            pasta_competencia = f"{registro['competencia']}/" if registro["competencia"] else ""
+            registro["destino"] = nome_disponivel(f"{prefixo}{pasta_tipo}/{pasta_subtipo}/{pasta_competencia}{nome_arquivo}",
+                                                  caminhos_usados)
+            with medidor.etapa("gravacao"):
+                saida.adicionar(registro["destino"], dados, prefixo + categoria)
+            medidor.contar("gravacao", 1, len(dados))
+            if documentos_fiscais is not None:
+                documentos_fiscais.adicionar(registro, resultado)
+            yield registro
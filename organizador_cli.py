@@ -0,0 +1,122 @@
+"""
+Organizador de arquivos fiscais em linha de comando, para lotes grandes e execuções agendadas.
+
+    python organizador_cli.py ENTRADA SAIDA [--empresa NOME | --cnpj CNPJ] [--workers N] ...
+
+ENTRADA é uma pasta ou um ZIP; SAIDA é uma pasta ou, terminando em .zip, um arquivo ZIP.
+Sem --empresa/--cnpj, cada documento vai para a pasta da empresa do seu emitente/destinatário.
+Não importa Streamlit nem plotly.
+"""
+import argparse
+import json
+import os
+import resource
+import sqlite3
+import sys
+
+from arquivo_saida import NIVEL_COMPRESSAO_PADRAO, ConstrutorZip, GravadorPasta
+from cache_classificacao import criar_tabela_cache
+from classificacao import apenas_digitos
+from documentos_fiscais import GravadorDocumentosFiscais, criar_tabela_documentos_fiscais
+from empresas import cadastro_empresas
+from ingestao import eh_zip, iterar_caminho
+from metricas import Medidor, criar_tabela_metricas, gravar_execucao
+from organizador import organizar_documentos
+from paralelo import workers_padrao
+
+
+def pico_memoria_mb(quem=resource.RUSAGE_SELF):
+    """ Pico de memória residente (ru_maxrss vem em KiB no Linux e em bytes no macOS). """
+    pico = resource.getrusage(quem).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024
+
+def criar_parser():
+    parser = argparse.ArgumentParser(description="Organiza XML/TXT fiscais por categoria, sem interface gráfica.")
+    parser.add_argument("entrada", help="pasta ou arquivo ZIP com os documentos")
+    parser.add_argument("saida", help="pasta de saída ou caminho de um arquivo .zip")
+    empresa = parser.add_mutually_exclusive_group()
+    empresa.add_argument("--empresa", help="nome da empresa, como no cadastro")
+    empresa.add_argument("--cnpj", help="CNPJ da empresa (com ou sem pontuação)")
+    parser.add_argument("--workers", type=int, default=workers_padrao(), help="processos de classificação (1 = em série)")
+    parser.add_argument("--nivel-compressao", type=int, default=NIVEL_COMPRESSAO_PADRAO, choices=range(10),
+                        help="0 a 9; 0 grava sem compressão (ZIP_STORED)")
+    parser.add_argument("--por-categoria", action="store_true", help="um ZIP por categoria (só com saída .zip)")
+    parser.add_argument("--banco", default="importa_register.db", help="banco SQLite com o cadastro e o cache")
+    parser.add_argument("--manifesto", help="caminho do manifesto JSON (padrão: <saida>_manifesto.json)")
+    parser.add_argument("--sem-documentos-fiscais", action="store_true",
+                        help="não extrai os campos fiscais das NF-e/CT-e para a tabela documentos_fiscais")
+    parser.add_argument("--perfil-lento", type=float, metavar="SEGUNDOS",
+                        help="roda com cProfile e guarda o perfil em perfis/ se a execução levar ao menos SEGUNDOS")
+    return parser
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    conn = sqlite3.connect(args.banco)
+    criar_tabela_cache(conn)
+    criar_tabela_metricas(conn)
+    criar_tabela_documentos_fiscais(conn)
+    empresas, indice = cadastro_empresas(conn)
+
+    cnpj_empresa = args.cnpj
+    if args.empresa:
+        if not empresas.get(args.empresa):
+            sys.exit(f"Empresa sem CNPJ no cadastro: {args.empresa}")
+        cnpj_empresa = empresas[args.empresa]
+    roteamento = cnpj_empresa is None
+    nome_empresa = args.empresa or (indice.get(apenas_digitos(args.cnpj), args.cnpj) if args.cnpj else None)
+
+    if eh_zip(args.saida):
+        saida = ConstrutorZip(args.nivel_compressao, args.por_categoria, args.workers, caminho_saida=args.saida)
+    else:
+        os.makedirs(args.saida, exist_ok=True)
+        saida = GravadorPasta(args.saida)
+
+    manifesto = []
+    documentos_fiscais = None if args.sem_documentos_fiscais else GravadorDocumentosFiscais(conn, nome_empresa)
+    with Medidor(args.perfil_lento is not None) as medidor, saida:
+        registros = organizar_documentos(conn, iterar_caminho(args.entrada), saida, cnpj_empresa, args.workers,
+                                         indice if roteamento else None, medidor, documentos_fiscais=documentos_fiscais)
+        manifesto.extend(registros)
+        if documentos_fiscais is not None:
+            documentos_fiscais.gravar()
+        with medidor.etapa("finalizacao"):
+            for arquivo in saida.finalizar().values():
+                arquivo.close()
+    duracao = medidor.segundos
+    gravar_execucao(conn, medidor, "cli", nome_empresa, args.perfil_lento or 0)
+
+    # Estatísticas por arquivo de entrada; as cópias de um documento em outras empresas ficam só no manifesto.
+    entradas = [registro for registro in manifesto if registro["copia"] == 0]
+    total_arquivos = len(entradas)
+    total_bytes = sum(registro["tamanho"] for registro in entradas)
+    estatisticas = {
+        "arquivos": total_arquivos,
+        "copias": len(manifesto) - total_arquivos,
+        "bytes": total_bytes,
+        "duplicados": sum(1 for registro in manifesto if registro["duplicado"]),
+        "segundos": round(duracao, 3),
+        "arquivos_por_segundo": round(total_arquivos / duracao, 1) if duracao else None,
+        "bytes_por_segundo": round(total_bytes / duracao) if duracao else None,
+        "pico_memoria_mb": round(pico_memoria_mb(), 1),
+        "pico_memoria_processos_mb": round(pico_memoria_mb(resource.RUSAGE_CHILDREN), 1),
+        "workers": args.workers,
+        "etapas": medidor.etapas,
+    }
+
+    caminho_manifesto = args.manifesto or f"{os.path.splitext(args.saida.rstrip(os.sep))[0]}_manifesto.json"
+    with open(caminho_manifesto, "w", encoding="utf-8") as f:
+        json.dump({"entrada": args.entrada, "saida": args.saida, "estatisticas": estatisticas, "documentos": manifesto},
+                  f, ensure_ascii=False, indent=2)
+
+    print(f"{total_arquivos} arquivos ({total_bytes / 1024 / 1024:.1f} MiB) em {duracao:.2f}s")
+    print(f"{estatisticas['arquivos_por_segundo']} arquivos/s, {total_bytes / duracao / 1024 / 1024 if duracao else 0:.1f} MiB/s")
+    print(f"Pico de memória: {estatisticas['pico_memoria_mb']} MiB (processos de classificação: {estatisticas['pico_memoria_processos_mb']} MiB)")
+    print(f"Etapas: {medidor.resumo()}")
+    if documentos_fiscais is not None:
+        print(f"Documentos fiscais gravados: {documentos_fiscais.gravados}")
+    if medidor.caminho_perfil:
+        print(f"Perfil: {medidor.caminho_perfil}")
+    print(f"Manifesto: {caminho_manifesto}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import multiprocessing
+import os
+import sys
+import threading
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+
+TAMANHO_LOTE_PADRAO = 64
+# Lotes em andamento por processo: mantém os processos ocupados sem acumular o lote inteiro em memória.
+LOTES_POR_PROCESSO = 2
+_trava_main = threading.Lock()
+
+
+def workers_padrao():
+    return os.cpu_count() or 1
+
+@contextmanager
+def main_neutro(funcao):
+    """
+    Esconde o __file__ do __main__ enquanto processos "spawn" são criados. Sob o Streamlit, o __main__ é o
+    script da página (com __file__ e sem __spec__): cada processo novo rodaria a página inteira como
+    __mp_main__ (imports, banco, fila de tarefas). Se funcao mora no próprio __main__, ele é mantido.
+    """
+    main = sys.modules.get("__main__")
+    arquivo = getattr(main, "__file__", None)
+    if arquivo is None or getattr(main, "__spec__", None) is not None or funcao.__module__ == "__main__":
+        yield
+        return
+    with _trava_main:
+        del main.__file__
+        try:
+            yield
+        finally:
+            main.__file__ = arquivo
+
+def processar_lote(funcao, lote):
+    return [funcao(item) for item in lote]
+
+def processar_em_serie(pares, funcao):
+    """ pares = (item, resultado já conhecido ou None); só os que não têm resultado passam por funcao. """
+    for item, resultado in pares:
+        yield item, funcao(item) if resultado is None else resultado
+
+def processar_em_paralelo(itens, funcao, workers=None, tamanho_lote=TAMANHO_LOTE_PADRAO, pronto=None):
+    """
+    Aplica funcao a cada item num pool de processos, em lotes, e devolve pares (item, resultado)
+    na mesma ordem da entrada, à medida que ficam prontos. funcao precisa ser importável (nível de módulo).
+    Com pronto, um item para o qual pronto(item) devolve um resultado (não None) sai com ele, na sua vez,
+    sem ir ao pool. Os dois primeiros lotes de itens para funcao são processados em série e o pool só é
+    criado depois deles: com poucos itens (ou quase todos prontos) ele não compensa. Com workers <= 1 ou
+    se o pool não puder ser usado, processa tudo em série.
+    """
+    workers = workers or workers_padrao()
+    pares = ((item, pronto(item) if pronto else None) for item in itens)
+    if workers <= 1:
+        yield from processar_em_serie(pares, funcao)
+        return
+
+    faltas = 0
+    for item, resultado in pares:
+        if resultado is None:
+            resultado = funcao(item)
+            faltas += 1
+        yield item, resultado
+        if faltas >= tamanho_lote * 2:
+            break
+    else:
+        return
+
+    lotes = iter(lambda: list(islice(pares, tamanho_lote)), [])
+    pendentes = deque()
+    try:
+        # "spawn" evita herdar as threads do servidor Streamlit num fork.
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    except (OSError, NotImplementedError):
+        yield from processar_em_serie(pares, funcao)
+        return
+
+    with executor:
+        def enviar(lote):
+            faltam = [item for item, resultado in lote if resultado is None]
+            if not faltam:
+                pendentes.append((lote, None))
+                return
+            # Com "spawn", o ProcessPoolExecutor cria os processos sob demanda, dentro de submit.
+            with main_neutro(funcao):
+                pendentes.append((lote, executor.submit(processar_lote, funcao, faltam)))
+
+        for lote in islice(lotes, workers * LOTES_POR_PROCESSO):
+            enviar(lote)
+
+        while pendentes:
+            lote, futuro = pendentes.popleft()
+            try:
+                resultados = iter(futuro.result() if futuro else ())
+            except BrokenProcessPool:
+                # Um processo morreu (falta de memória, por exemplo): termina o trabalho em série.
+                for lote, _ in [(lote, futuro)] + list(pendentes):
+                    yield from processar_em_serie(lote, funcao)
+                pendentes.clear()
+                yield from processar_em_serie(pares, funcao)
+                return
+            for item, resultado in lote:
+                yield item, next(resultados) if resultado is None else resultado
+            proximo = next(lotes, None)
+            if proximo:
+                enviar(proximo)
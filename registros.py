@@ -0,0 +1,181 @@
+import sqlite3
+
+from banco import linhas_como_dicts
+
+REGISTROS_POR_PAGINA = 50
+# A coluna data é gravada como dd-mm-aaaa; esta expressão a converte para aaaammdd, que ordena
+# corretamente. É a mesma expressão do índice idx_registros_data_iso, que o SQLite só usa se ela for idêntica.
+DATA_ISO_SQL = "(substr(data, 7, 4) || substr(data, 4, 2) || substr(data, 1, 2))"
+# Colunas contadas em resumo_registros, mantido pelos gatilhos a cada inserção/atualização/exclusão.
+DIMENSOES_RESUMO = ("empresa", "tipo_nota", "status", "erro", "data")
+
+
+def criar_tabela_registros(conn):
+    cursor = conn.cursor()
+    cursor.execute('''CREATE TABLE IF NOT EXISTS registros (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        data TEXT,
+                        empresa TEXT,
+                        tipo_nota TEXT,
+                        erro TEXT,
+                        arquivo_erro TEXT,
+                        status TEXT DEFAULT 'Pendente')''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_registros_empresa ON registros (empresa, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_registros_status ON registros (status, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_registros_data ON registros (data)")
+    cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_registros_data_iso ON registros ({DATA_ISO_SQL}, id)")
+    criar_busca_erros(cursor)
+    criar_resumo(cursor)
+    conn.commit()
+
+def criar_busca_erros(cursor):
+    """ Índice FTS5 sobre registros.erro, mantido por gatilhos. Sem FTS5 no SQLite, a busca cai para LIKE. """
+    if tem_busca_erros(cursor):
+        return
+    try:
+        cursor.execute("CREATE VIRTUAL TABLE registros_fts USING fts5(erro, content='registros', content_rowid='id')")
+    except sqlite3.OperationalError:
+        return
+    cursor.execute('''CREATE TRIGGER registros_fts_insert AFTER INSERT ON registros BEGIN
+                        INSERT INTO registros_fts (rowid, erro) VALUES (new.id, new.erro);
+                      END''')
+    cursor.execute('''CREATE TRIGGER registros_fts_delete AFTER DELETE ON registros BEGIN
+                        INSERT INTO registros_fts (registros_fts, rowid, erro) VALUES ('delete', old.id, old.erro);
+                      END''')
+    cursor.execute('''CREATE TRIGGER registros_fts_update AFTER UPDATE OF erro ON registros BEGIN
+                        INSERT INTO registros_fts (registros_fts, rowid, erro) VALUES ('delete', old.id, old.erro);
+                        INSERT INTO registros_fts (rowid, erro) VALUES (new.id, new.erro);
+                      END''')
+    cursor.execute("INSERT INTO registros_fts (registros_fts) VALUES ('rebuild')")
+
+def sql_contagem(linha, delta):
+    """
+    Comandos que somam delta à contagem de cada dimensão da linha (new ou old) nos gatilhos. Ao subtrair,
+    apaga a contagem que chegou a zero, só na chave tocada (o resumo tem uma linha por texto de erro).
+    """
+    comandos = []
+    for dimensao in DIMENSOES_RESUMO:
+        # Erro vazio não é erro: não entra na contagem de "Erros Mais Comuns".
+        condicao = f" WHERE coalesce({linha}.erro, '') <> ''" if dimensao == "erro" else " WHERE true"
+        comandos.append(f"""INSERT INTO resumo_registros (dimensao, valor, total)
+                            SELECT '{dimensao}', coalesce({linha}.{dimensao}, ''), {delta}{condicao}
+                            ON CONFLICT (dimensao, valor) DO UPDATE SET total = total + ({delta});""")
+        if delta < 0:
+            comandos.append(f"""DELETE FROM resumo_registros
+                                WHERE dimensao = '{dimensao}' AND valor = coalesce({linha}.{dimensao}, '') AND total <= 0;""")
+    return "\n".join(comandos)
+
+def criar_resumo(cursor):
+    """
+    Tabelas de contagens por dimensão e contador de versão, atualizados por gatilhos. Os gatilhos são
+    sempre recriados, para que bancos existentes recebam a versão atual.
+    """
+    if not cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'resumo_registros'").fetchone():
+        cursor.execute('''CREATE TABLE resumo_registros (
+                            dimensao TEXT,
+                            valor TEXT,
+                            total INTEGER,
+                            PRIMARY KEY (dimensao, valor)) WITHOUT ROWID''')
+        cursor.execute("CREATE TABLE versao_registros (id INTEGER PRIMARY KEY CHECK (id = 1), versao INTEGER)")
+        cursor.execute("INSERT INTO versao_registros (id, versao) VALUES (1, 0)")
+        for dimensao in DIMENSOES_RESUMO:
+            condicao = "WHERE coalesce(erro, '') <> ''" if dimensao == "erro" else ""
+            cursor.execute(f"""INSERT INTO resumo_registros (dimensao, valor, total)
+                               SELECT '{dimensao}', coalesce({dimensao}, ''), COUNT(*) FROM registros {condicao} GROUP BY 2""")
+    criar_gatilhos_resumo(cursor)
+
+def criar_gatilhos_resumo(cursor):
+    fim = "UPDATE versao_registros SET versao = versao + 1;"
+    gatilhos = {
+        "resumo_registros_insert": f"AFTER INSERT ON registros BEGIN\n{sql_contagem('new', 1)}\n{fim}\nEND",
+        "resumo_registros_delete": f"AFTER DELETE ON registros BEGIN\n{sql_contagem('old', -1)}\n{fim}\nEND",
+        "resumo_registros_update": f"AFTER UPDATE ON registros BEGIN\n{sql_contagem('old', -1)}\n{sql_contagem('new', 1)}\n{fim}\nEND",
+    }
+    for nome, corpo in gatilhos.items():
+        cursor.execute(f"DROP TRIGGER IF EXISTS {nome}")
+        cursor.execute(f"CREATE TRIGGER {nome} {corpo}")
+
+def versao_registros(conn):
+    """ Muda a cada alteração em registros; serve de chave para o cache dos indicadores. """
+    return conn.execute("SELECT versao FROM versao_registros").fetchone()[0]
+
+def contagens(conn, dimensao, limite=None):
+    """ [(valor, total)] de uma dimensão do resumo, do maior para o menor total. """
+    query = "SELECT valor, total FROM resumo_registros WHERE dimensao = ? ORDER BY total DESC"
+    parametros = [dimensao]
+    if limite:
+        query += " LIMIT ?"
+        parametros.append(limite)
+    return conn.execute(query, parametros).fetchall()
+
+def total_registros(conn):
+    return conn.execute("SELECT coalesce(SUM(total), 0) FROM resumo_registros WHERE dimensao = 'status'").fetchone()[0]
+
+def registros_do_dia(conn, data):
+    """ Registros de um dia (dd-mm-aaaa), via idx_registros_data. """
+    cursor = conn.execute("SELECT id, data, empresa, tipo_nota, erro, arquivo_erro, status FROM registros WHERE data = ? ORDER BY id",
+                          (data,))
+    return linhas_como_dicts(cursor)
+
+def tem_busca_erros(conn):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'registros_fts'").fetchone() is not None
+
+def termo_fts(texto):
+    """ Converte o texto digitado numa consulta FTS5 segura: cada palavra vira um prefixo entre aspas. """
+    return " ".join('"' + palavra.replace('"', '""') + '"*' for palavra in texto.split())
+
+def buscar_registros(conn, empresa=None, status=None, tipo_nota=None, data_inicio=None, data_fim=None,
+                     termo_erro=None, antes_de=None, limite=REGISTROS_POR_PAGINA):
+    """
+    Busca uma página de registros, do mais recente para o mais antigo, com paginação por chave: a próxima
+    página começa antes de antes_de, o cursor devolvido pela página anterior. Com período, a ordem é por data
+    e id, a mesma de idx_registros_data_iso (o cursor é (data aaaammdd, id)): o SQLite percorre o índice e
+    para na página, sem ordenar o período inteiro. Devolve (linhas, cursor da próxima página ou None).
+    """
+    por_data = bool(data_inicio or data_fim)
+    condicoes = []
+    parametros = []
+    if empresa:
+        condicoes.append("empresa = ?")
+        parametros.append(empresa)
+    if status:
+        condicoes.append("status = ?")
+        parametros.append(status)
+    if tipo_nota:
+        condicoes.append("tipo_nota = ?")
+        parametros.append(tipo_nota)
+    if data_inicio:
+        condicoes.append(f"{DATA_ISO_SQL} >= ?")
+        parametros.append(data_inicio.strftime("%Y%m%d"))
+    if data_fim:
+        condicoes.append(f"{DATA_ISO_SQL} <= ?")
+        parametros.append(data_fim.strftime("%Y%m%d"))
+    if termo_erro and termo_erro.strip():
+        if tem_busca_erros(conn):
+            condicoes.append("id IN (SELECT rowid FROM registros_fts WHERE registros_fts MATCH ?)")
+            parametros.append(termo_fts(termo_erro))
+        else:
+            condicoes.append("erro LIKE ?")
+            parametros.append(f"%{termo_erro.strip()}%")
+    if antes_de is not None:
+        if por_data:
+            condicoes.append(f"({DATA_ISO_SQL}, id) < (?, ?)")
+            parametros.extend(antes_de)
+        else:
+            condicoes.append("id < ?")
+            parametros.append(antes_de)
+
+    query = f"SELECT id, data, empresa, tipo_nota, erro, arquivo_erro, status, {DATA_ISO_SQL} AS data_iso FROM registros"
+    if condicoes:
+        query += " WHERE " + " AND ".join(condicoes)
+    query += f" ORDER BY {DATA_ISO_SQL} DESC, id DESC LIMIT ?" if por_data else " ORDER BY id DESC LIMIT ?"
+    parametros.append(limite + 1)
+
+    linhas = linhas_como_dicts(conn.execute(query, parametros))
+    proximo = None
+    if len(linhas) > limite:
+        linhas = linhas[:limite]
+        proximo = (linhas[-1]["data_iso"], linhas[-1]["id"]) if por_data else linhas[-1]["id"]
+    for linha in linhas:
+        del linha["data_iso"]
+    return linhas, proximo
@@ -0,0 +1,125 @@
+import io
+import json
+import os
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from classificacao import identificar_documento
+
+ARQUIVO_REGRAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "regras_classificacao.json")
+CATEGORIA_PADRAO = "OUTROS"
+
+# todas/alguma: palavras (minúsculas) que o nome do arquivo deve conter, todas ou pelo menos uma.
+# conteudo: ((campo, valores aceitos), ...) sobre o resultado de identificar_documento.
+Regra = namedtuple("Regra", "id categoria prioridade todas alguma conteudo requer_cnpj ordem")
+# regra é None quando nenhuma regra se aplicou e valeu a categoria padrão.
+Classificacao = namedtuple("Classificacao", "categoria regra")
+
+
+class MotorRegras:
+    """
+    Regras de classificação compiladas uma vez. As palavras-chave de todas as regras formam um único
+    regex que, numa passada pelo nome do arquivo, diz quais delas aparecem. As regras valem da maior
+    para a menor prioridade (no empate, vale a ordem do arquivo de regras) e a primeira satisfeita decide.
+    O cabeçalho do arquivo só é lido quando uma regra de conteúdo ainda pode decidir.
+    """
+    def __init__(self, regras, categoria_padrao=CATEGORIA_PADRAO):
+        self.regras = sorted(regras, key=lambda regra: (-regra.prioridade, regra.ordem))
+        self.categoria_padrao = categoria_padrao
+        palavras = sorted({palavra for regra in regras for palavra in regra.todas | regra.alguma}, key=len, reverse=True)
+        self.bits = {palavra: 1 << indice for indice, palavra in enumerate(palavras)}
+        # Em cada posição o lookahead captura a palavra mais longa que começa ali; as contidas nela
+        # (que começariam na mesma posição ou dentro dela) entram pela máscara implícita.
+        self.implicitas = {palavra: sum(self.bits[outra] for outra in palavras if outra in palavra) for palavra in palavras}
+        self.padrao = re.compile("(?=(" + "|".join(re.escape(palavra) for palavra in palavras) + "))")
+        self.mascaras = [(sum(self.bits[p] for p in regra.todas), sum(self.bits[p] for p in regra.alguma))
+                         for regra in self.regras]
+        # Máscara das palavras presentes -> regras candidatas, até a primeira que só depende do nome.
+        self.candidatas = {}
+
+    def mascara(self, nome_arquivo):
+        mascara = 0
+        for palavra in self.padrao.findall(nome_arquivo.lower()):
+            mascara |= self.implicitas[palavra]
+        return mascara
+
+    def regras_candidatas(self, mascara):
+        candidatas = self.candidatas.get(mascara)
+        if candidatas is None:
+            candidatas = []
+            for regra, (todas, alguma) in zip(self.regras, self.mascaras):
+                if todas & ~mascara or (alguma and not alguma & mascara):
+                    continue
+                candidatas.append(regra)
+                if not regra.conteudo:
+                    break
+            candidatas = self.candidatas[mascara] = tuple(candidatas)
+        return candidatas
+
+    def precisa_conteudo(self, nome_arquivo, cnpj_empresa=""):
+        """ Se classificar vai ler o cabeçalho: uma regra de conteúdo vem antes da primeira que decide só pelo nome. """
+        return any(regra.conteudo and not (regra.requer_cnpj and not cnpj_empresa)
+                   for regra in self.regras_candidatas(self.mascara(nome_arquivo)))
+
+    def classificar(self, nome_arquivo, abrir=None, cnpj_empresa="", fatos=None):
+        """
+        Classifica pelo nome e, se alguma regra de conteúdo for alcançada, pelo cabeçalho lido de abrir()
+        (fluxo binário) ou já lido em fatos (ler_cabecalho, no pool). Regras com requer_cnpj são ignoradas
+        quando o CNPJ da empresa não é conhecido.
+        """
+        for regra in self.regras_candidatas(self.mascara(nome_arquivo)):
+            if regra.conteudo:
+                if (abrir is None and fatos is None) or (regra.requer_cnpj and not cnpj_empresa):
+                    continue
+                if fatos is None:
+                    with abrir() as fluxo:
+                        fatos = identificar_documento(nome_arquivo.lower(), fluxo, cnpj_empresa)
+                if not all(fatos.get(campo) in valores for campo, valores in regra.conteudo):
+                    continue
+            return Classificacao(regra.categoria, regra)
+        return Classificacao(self.categoria_padrao, None)
+
+def ler_cabecalho(item):
+    """ Função do pool: item = (nome_arquivo, dados, cnpj_empresa); devolve os fatos que classificar consulta. """
+    nome_arquivo, dados, cnpj_empresa = item
+    return identificar_documento(nome_arquivo.lower(), io.BytesIO(dados), cnpj_empresa)
+
+def explicar(classificacao):
+    """ Descreve a regra que decidiu uma classificação, para exibir ao usuário. """
+    regra = classificacao.regra
+    if regra is None:
+        return f"{classificacao.categoria}: nenhuma regra se aplicou (categoria padrão)"
+    condicoes = []
+    if regra.todas:
+        condicoes.append("nome contém " + " e ".join(f"'{palavra}'" for palavra in sorted(regra.todas)))
+    if regra.alguma:
+        condicoes.append("nome contém " + " ou ".join(f"'{palavra}'" for palavra in sorted(regra.alguma)))
+    if regra.conteudo:
+        condicoes.append("conteúdo com " + ", ".join(f"{campo} = {' ou '.join(sorted(valores))}"
+                                                     for campo, valores in regra.conteudo))
+    return f"{regra.categoria}: regra '{regra.id}' (prioridade {regra.prioridade}), {'; '.join(condicoes)}"
+
+def carregar_regras(caminho=ARQUIVO_REGRAS):
+    """ Lê e valida o arquivo de regras (JSON) e devolve o MotorRegras compilado. """
+    with open(caminho, encoding="utf-8") as f:
+        configuracao = json.load(f)
+    regras = []
+    for ordem, item in enumerate(configuracao["regras"]):
+        todas = frozenset(palavra.lower() for palavra in item.get("todas", []))
+        alguma = frozenset(palavra.lower() for palavra in item.get("alguma", []))
+        conteudo = tuple((campo, frozenset(valores if isinstance(valores, list) else [valores]))
+                         for campo, valores in item.get("conteudo", {}).items())
+        if not item.get("categoria") or not (todas or alguma or conteudo):
+            raise ValueError(f"Regra sem categoria ou sem condição em {caminho}: {item.get('id', ordem)}")
+        regras.append(Regra(item.get("id", item["categoria"].lower()), item["categoria"], item.get("prioridade", 0),
+                            todas, alguma, conteudo, item.get("requer_cnpj", False), ordem))
+    return MotorRegras(regras, configuracao.get("categoria_padrao", CATEGORIA_PADRAO))
+
+@lru_cache(maxsize=None)
+def motor_padrao():
+    return carregar_regras()
+
+def classificar_arquivo(nome_arquivo):
+    """ Categoria pelo nome do arquivo, com as regras de regras_classificacao.json. """
+    return motor_padrao().classificar(nome_arquivo).categoria
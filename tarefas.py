@@ -0,0 +1,391 @@
+"""
+Fila de tarefas de processamento em segundo plano. Os arquivos enviados ficam em tarefas/<id>/entrada,
+a classificação grava os documentos em tarefas/<id>/saida e, no fim, os ZIPs vão para tarefas/<id>/resultado.
+Estado, progresso e documentos já gravados ficam no SQLite: uma tarefa interrompida (o servidor caiu ou
+foi reiniciado) continua do último lote de documentos confirmado.
+Cada tarefa em andamento tem um dono (a FilaTarefas que a recebeu ou executa) que renova um batimento no
+banco; só as tarefas cujo dono parou de bater voltam para a fila.
+"""
+import datetime
+import multiprocessing
+import os
+import shutil
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from arquivo_saida import NIVEL_COMPRESSAO_PADRAO, ConstrutorZip, GravadorPasta
+from banco import linhas_como_dicts
+from cache_classificacao import criar_tabela_cache
+from documentos_fiscais import GravadorDocumentosFiscais, criar_tabela_documentos_fiscais
+from empresas import EMPRESA_NAO_IDENTIFICADA, carregar_empresas, indice_por_cnpj, pasta_empresa
+from ingestao import iterar_documentos, nome_disponivel
+from metricas import Medidor, criar_tabela_metricas, gravar_execucao
+from organizador import organizar_documentos
+
+PASTA_TAREFAS = "tarefas"
+TAREFAS_SIMULTANEAS = 1
+# O progresso e os documentos gravados vão para o banco a cada tantos documentos; é daí que a tarefa continua.
+LOTE_PROGRESSO = 50
+# recebendo: arquivos sendo copiados para a pasta de entrada; só então a tarefa passa a pendente.
+ESTADOS_ATIVOS = ("recebendo", "pendente", "executando")
+# A fila renova o batimento das suas tarefas a cada BATIMENTO_TAREFAS segundos; sem batimento há mais
+# de LIMITE_BATIMENTO segundos, o dono é dado como morto e a tarefa pode ser retomada por outra fila.
+BATIMENTO_TAREFAS = 5
+LIMITE_BATIMENTO = 30
+# Tempo que a pasta de uma tarefa finalizada (ZIPs de resultado; na que falhou, também a cópia dos arquivos
+# enviados) é mantida depois da última atualização.
+RETENCAO_TAREFAS = 7 * 24 * 60 * 60
+
+
+class TarefaPerdida(Exception):
+    """ A tarefa foi retomada por outra fila (este dono foi dado como morto); a execução atual para. """
+
+
+def agora():
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def conectar(banco):
+    return sqlite3.connect(banco, timeout=30, check_same_thread=False)
+
+def novo_dono():
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+def criar_tabela_tarefas(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS tarefas (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        criada_em TEXT,
+                        atualizada_em TEXT,
+                        estado TEXT DEFAULT 'recebendo',
+                        empresa TEXT,
+                        cnpj TEXT,
+                        roteamento INTEGER,
+                        workers INTEGER,
+                        nivel_compressao INTEGER,
+                        por_categoria INTEGER,
+                        perfilar INTEGER,
+                        pasta TEXT,
+                        total INTEGER,
+                        processados INTEGER DEFAULT 0,
+                        duplicados INTEGER DEFAULT 0,
+                        erro TEXT,
+                        dono TEXT,
+                        batimento REAL,
+                        segundos REAL DEFAULT 0,
+                        bytes INTEGER DEFAULT 0)''')
+    # Bancos criados antes do dono, do batimento e da vazão.
+    colunas = {linha[1] for linha in conn.execute("PRAGMA table_info(tarefas)")}
+    for coluna, tipo in (("dono", "TEXT"), ("batimento", "REAL"), ("segundos", "REAL DEFAULT 0"), ("bytes", "INTEGER DEFAULT 0")):
+        if coluna not in colunas:
+            conn.execute(f"ALTER TABLE tarefas ADD COLUMN {coluna} {tipo}")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tarefas_estado ON tarefas (estado, id)")
+    conn.execute('''CREATE TABLE IF NOT EXISTS documentos_tarefa (
+                        tarefa_id INTEGER,
+                        ordem INTEGER,
+                        arquivo TEXT,
+                        categoria TEXT,
+                        grupo TEXT,
+                        identificador TEXT,
+                        destino TEXT,
+                        duplicado INTEGER,
+                        empresa TEXT,
+                        chave TEXT,
+                        PRIMARY KEY (tarefa_id, ordem)) WITHOUT ROWID''')
+    # Bancos criados antes de um documento poder ir para mais de uma empresa.
+    colunas = {linha[1] for linha in conn.execute("PRAGMA table_info(documentos_tarefa)")}
+    for coluna in ("empresa", "chave"):
+        if coluna not in colunas:
+            conn.execute(f"ALTER TABLE documentos_tarefa ADD COLUMN {coluna} TEXT")
+    conn.commit()
+
+def carregar_tarefa(conn, tarefa_id):
+    linhas = linhas_como_dicts(conn.execute("SELECT * FROM tarefas WHERE id = ?", (tarefa_id,)))
+    return linhas[0] if linhas else None
+
+def listar_tarefas(conn, estados=None, limite=20):
+    """ Tarefas mais recentes primeiro, opcionalmente só as de alguns estados, com a vazão já calculada. """
+    query = '''SELECT *, processados / nullif(segundos, 0) AS arquivos_por_segundo,
+                      bytes / nullif(segundos, 0) / 1048576.0 AS mb_por_segundo
+               FROM tarefas'''
+    parametros = []
+    if estados:
+        query += f" WHERE estado IN ({', '.join('?' * len(estados))})"
+        parametros.extend(estados)
+    query += " ORDER BY id DESC LIMIT ?"
+    parametros.append(limite)
+    return linhas_como_dicts(conn.execute(query, parametros))
+
+def documentos_duplicados(conn, tarefa_id, limite=500):
+    """ [{arquivo, empresa, identificador}] dos documentos que a tarefa deixou de fora por já ter gravado. """
+    cursor = conn.execute('''SELECT arquivo, empresa, identificador FROM documentos_tarefa
+                             WHERE tarefa_id = ? AND duplicado ORDER BY ordem LIMIT ?''', (tarefa_id, limite))
+    return linhas_como_dicts(cursor)
+
+def arquivos_resultado(tarefa):
+    """ ZIPs prontos de uma tarefa concluída (e ainda não expirada), em ordem de nome. """
+    if tarefa["estado"] != "concluida" or not tarefa["pasta"]:
+        return []
+    pasta = os.path.join(tarefa["pasta"], "resultado")
+    if not os.path.isdir(pasta):
+        return []
+    return [os.path.join(pasta, nome) for nome in sorted(os.listdir(pasta)) if nome.endswith(".zip")]
+
+def criar_tarefa(conn, arquivos, empresa, cnpj_empresa, roteamento, workers, nivel_compressao=NIVEL_COMPRESSAO_PADRAO,
+                 por_categoria=False, perfilar=False, dono=None):
+    """
+    Copia os arquivos enviados (objetos com name e getbuffer()) para a pasta da tarefa e a deixa pendente.
+    Durante a cópia a tarefa fica em "recebendo", em nome de dono.
+    """
+    cursor = conn.execute('''INSERT INTO tarefas (criada_em, atualizada_em, estado, empresa, cnpj, roteamento, workers,
+                                                  nivel_compressao, por_categoria, perfilar, dono, batimento)
+                             VALUES (?, ?, 'recebendo', ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                          (agora(), agora(), empresa, cnpj_empresa, int(roteamento), workers, nivel_compressao,
+                           int(por_categoria), int(perfilar), dono, time.time()))
+    tarefa_id = cursor.lastrowid
+    pasta = os.path.join(PASTA_TAREFAS, str(tarefa_id))
+    conn.execute("UPDATE tarefas SET pasta = ? WHERE id = ?", (pasta, tarefa_id))
+    conn.commit()
+
+    entrada = os.path.join(pasta, "entrada")
+    os.makedirs(entrada, exist_ok=True)
+    nomes_usados = set()
+    try:
+        for arquivo in arquivos:
+            nome_arquivo = nome_disponivel(os.path.basename(arquivo.name), nomes_usados)
+            with open(os.path.join(entrada, nome_arquivo), "wb") as f:
+                f.write(arquivo.getbuffer())
+    except Exception as e:
+        conn.execute("UPDATE tarefas SET estado = 'erro', erro = ?, dono = NULL, atualizada_em = ? WHERE id = ?",
+                     (f"Envio interrompido: {e}", agora(), tarefa_id))
+        conn.commit()
+        raise
+    conn.execute("UPDATE tarefas SET estado = 'pendente', dono = NULL, atualizada_em = ? WHERE id = ?", (agora(), tarefa_id))
+    conn.commit()
+    return tarefa_id
+
+def gravar_progresso(conn, tarefa_id, lote, processados, dono, documentos_fiscais=None, bytes_lote=0, segundos=0.0):
+    """
+    Confirma um lote de documentos, seus campos fiscais e o novo ponto de retomada (processados, em arquivos
+    de entrada) numa única transação; bytes_lote e segundos (desde o lote anterior) somam-se à vazão da
+    tarefa, que assim inclui as execuções interrompidas. Se a tarefa já não é de dono (foi retomada por
+    outra fila), desfaz o lote e levanta TarefaPerdida.
+    """
+    if not lote:
+        return
+    if documentos_fiscais is not None:
+        documentos_fiscais.gravar(confirmar=False)
+    conn.executemany('''INSERT OR REPLACE INTO documentos_tarefa
+                        (tarefa_id, ordem, arquivo, categoria, grupo, identificador, destino, duplicado, empresa, chave)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', lote)
+    cursor = conn.execute('''UPDATE tarefas SET processados = ?, atualizada_em = ?, batimento = ?,
+                                    segundos = coalesce(segundos, 0) + ?, bytes = coalesce(bytes, 0) + ?,
+                                    duplicados = (SELECT COUNT(*) FROM documentos_tarefa WHERE tarefa_id = ? AND duplicado)
+                             WHERE id = ? AND estado = 'executando' AND dono = ?''',
+                          (processados, agora(), time.time(), segundos, bytes_lote, tarefa_id, tarefa_id, dono))
+    if cursor.rowcount == 0:
+        conn.rollback()
+        raise TarefaPerdida(tarefa_id)
+    conn.commit()
+    lote.clear()
+
+def montar_resultado(conn, tarefa):
+    """ Empacota os documentos de tarefas/<id>/saida nos ZIPs de tarefas/<id>/resultado, na ordem de entrada. """
+    pasta_saida = os.path.join(tarefa["pasta"], "saida")
+    pasta_resultado = os.path.join(tarefa["pasta"], "resultado")
+    os.makedirs(pasta_resultado, exist_ok=True)
+    nome_base = "EMPRESAS" if tarefa["roteamento"] else pasta_empresa(tarefa["empresa"])
+    caminho_zip = os.path.join(pasta_resultado, f"{nome_base}.zip")
+    documentos = conn.execute('''SELECT destino, grupo FROM documentos_tarefa
+                                 WHERE tarefa_id = ? AND NOT duplicado ORDER BY ordem''', (tarefa["id"],))
+    with ConstrutorZip(tarefa["nivel_compressao"], bool(tarefa["por_categoria"]), tarefa["workers"],
+                       caminho_saida=caminho_zip) as construtor:
+        for destino, grupo in documentos:
+            with open(os.path.join(pasta_saida, *destino.split("/")), "rb") as f:
+                construtor.adicionar(destino, f.read(), grupo)
+        for arquivo in construtor.finalizar().values():
+            arquivo.close()
+
+def expirar_tarefas(conn, retencao=RETENCAO_TAREFAS):
+    """
+    Apaga a pasta e os documentos das tarefas finalizadas há mais de retencao segundos; a linha em tarefas
+    fica, com pasta vazia, para o histórico e a vazão.
+    """
+    limite = (datetime.datetime.now() - datetime.timedelta(seconds=retencao)).strftime("%Y-%m-%d %H:%M:%S")
+    expiradas = conn.execute('''SELECT id, pasta FROM tarefas
+                                WHERE estado IN ('concluida', 'erro') AND pasta IS NOT NULL AND atualizada_em < ?''',
+                             (limite,)).fetchall()
+    for tarefa_id, pasta in expiradas:
+        shutil.rmtree(pasta, ignore_errors=True)
+        conn.execute("DELETE FROM documentos_tarefa WHERE tarefa_id = ?", (tarefa_id,))
+        conn.execute("UPDATE tarefas SET pasta = NULL WHERE id = ?", (tarefa_id,))
+    conn.commit()
+
+def executar_tarefa(banco, tarefa_id, dono=None):
+    """ Processa (ou continua) uma tarefa pendente em nome de dono; roda numa thread da FilaTarefas. """
+    dono = dono or novo_dono()
+    conn = conectar(banco)
+    try:
+        cursor = conn.execute('''UPDATE tarefas SET estado = 'executando', dono = ?, batimento = ?, atualizada_em = ?
+                                 WHERE estado = 'pendente' AND id = ?''', (dono, time.time(), agora(), tarefa_id))
+        conn.commit()
+        if cursor.rowcount == 0:
+            return
+        tarefa = carregar_tarefa(conn, tarefa_id)
+        entrada = os.path.join(tarefa["pasta"], "entrada")
+        if tarefa["total"] is None:
+            tarefa["total"] = sum(1 for _ in iterar_documentos(entrada))
+            conn.execute("UPDATE tarefas SET total = ? WHERE id = ?", (tarefa["total"], tarefa_id))
+            conn.commit()
+
+        # Retomada: o que foi gravado depois do último lote confirmado não chegou ao banco (o lote e o ponto de
+        # retomada são confirmados juntos); recupera o estado da deduplicação e do roteamento dos eventos.
+        processados = tarefa["processados"]
+        ordem = conn.execute("SELECT coalesce(MAX(ordem) + 1, 0) FROM documentos_tarefa WHERE tarefa_id = ?",
+                             (tarefa_id,)).fetchone()[0]
+        identificadores = set()
+        caminhos_usados = set()
+        empresas_por_chave = {}
+        for identificador, destino, empresa, chave in conn.execute('''SELECT identificador, destino, empresa, chave
+                                                                    FROM documentos_tarefa
+                                                                    WHERE tarefa_id = ? AND NOT duplicado
+                                                                    ORDER BY ordem''', (tarefa_id,)):
+            if identificador:
+                identificadores.add((empresa, identificador))
+            if chave and empresa and empresa != EMPRESA_NAO_IDENTIFICADA:
+                empresas_por_chave.setdefault(chave, []).append(empresa)
+            caminhos_usados.add(destino)
+        indice = indice_por_cnpj(carregar_empresas(conn)) if tarefa["roteamento"] else None
+
+        itens = ((nome_arquivo, ler()) for nome_arquivo, ler in islice(iterar_documentos(entrada), processados, None))
+        lote = []
+        bytes_lote = 0
+        marca = time.perf_counter()
+
+        def confirmar():
+            nonlocal bytes_lote, marca
+            instante = time.perf_counter()
+            gravar_progresso(conn, tarefa_id, lote, processados, dono, documentos_fiscais, bytes_lote, instante - marca)
+            bytes_lote, marca = 0, instante
+
+        with Medidor(bool(tarefa["perfilar"])) as medidor:
+            with GravadorPasta(os.path.join(tarefa["pasta"], "saida")) as gravador, \
+                    GravadorDocumentosFiscais(conn, tarefa["empresa"]) as documentos_fiscais:
+                registros = organizar_documentos(conn, itens, gravador, tarefa["cnpj"], tarefa["workers"], indice, medidor,
+                                                 identificadores, caminhos_usados, documentos_fiscais, empresas_por_chave)
+                for registro in registros:
+                    # Um arquivo de entrada pode gerar várias cópias (uma por empresa): o lote só fecha entre arquivos.
+                    if registro["copia"] == 0:
+                        if len(lote) >= LOTE_PROGRESSO:
+                            confirmar()
+                        processados += 1
+                        bytes_lote += registro["tamanho"]
+                    grupo = registro["categoria"]
+                    if registro["empresa"]:
+                        grupo = f"{pasta_empresa(registro['empresa'])}/{grupo}"
+                    # chave só para documentos: é dela que os eventos seguintes tiram a empresa na retomada.
+                    chave = None if registro["evento"] else registro["chave"]
+                    lote.append((tarefa_id, ordem, registro["arquivo"], registro["categoria"], grupo, registro["identificador"],
+                                 registro["destino"], int(registro["duplicado"]), registro["empresa"], chave))
+                    ordem += 1
+                confirmar()
+            with medidor.etapa("finalizacao"):
+                montar_resultado(conn, tarefa)
+        gravar_execucao(conn, medidor, "tarefa", tarefa["empresa"])
+
+        cursor = conn.execute('''UPDATE tarefas SET estado = 'concluida', dono = NULL, atualizada_em = ?,
+                                                segundos = coalesce(segundos, 0) + ?
+                                 WHERE id = ? AND dono = ?''', (agora(), time.perf_counter() - marca, tarefa_id, dono))
+        conn.commit()
+        if cursor.rowcount == 0:
+            raise TarefaPerdida(tarefa_id)
+        shutil.rmtree(entrada, ignore_errors=True)
+        shutil.rmtree(os.path.join(tarefa["pasta"], "saida"), ignore_errors=True)
+    except TarefaPerdida:
+        conn.rollback()
+    except Exception as e:
+        conn.rollback()
+        conn.execute("UPDATE tarefas SET estado = 'erro', erro = ?, dono = NULL, atualizada_em = ? WHERE id = ? AND dono = ?",
+                     (str(e), agora(), tarefa_id, dono))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class FilaTarefas:
+    """
+    Executa as tarefas em threads de fundo. Uma thread de vigia renova o batimento das tarefas desta fila,
+    devolve à fila as tarefas de donos mortos (o servidor caiu ou foi reiniciado), enfileira as pendentes
+    e apaga as pastas das tarefas finalizadas há mais de RETENCAO_TAREFAS.
+    Várias instâncias no mesmo banco (outro servidor, st.cache_resource limpo) não executam a mesma tarefa:
+    a tomada de uma tarefa pendente é atômica e uma tarefa com dono vivo não é retomada.
+    """
+    def __init__(self, banco, simultaneas=TAREFAS_SIMULTANEAS):
+        # Um processo do pool de classificação nunca deve montar uma fila (e retomar tarefas) por conta própria.
+        if multiprocessing.parent_process() is not None:
+            raise RuntimeError("FilaTarefas não pode ser criada num processo filho")
+        self.banco = banco
+        self.dono = novo_dono()
+        self.executor = ThreadPoolExecutor(simultaneas, thread_name_prefix="tarefa")
+        self.enfileiradas = set()
+        self.trava = threading.Lock()
+        conn = conectar(banco)
+        criar_tabela_tarefas(conn)
+        criar_tabela_cache(conn)
+        criar_tabela_documentos_fiscais(conn)
+        criar_tabela_metricas(conn)
+        conn.close()
+        self.vigiar()
+        threading.Thread(target=self.bater, name="tarefa-vigia", daemon=True).start()
+
+    def vigiar(self):
+        conn = conectar(self.banco)
+        try:
+            instante = time.time()
+            conn.execute("UPDATE tarefas SET batimento = ? WHERE dono = ? AND estado IN ('recebendo', 'executando')",
+                         (instante, self.dono))
+            limite = instante - LIMITE_BATIMENTO
+            conn.execute('''UPDATE tarefas SET estado = 'pendente', dono = NULL
+                            WHERE estado = 'executando' AND coalesce(batimento, 0) < ?''', (limite,))
+            # Tarefas que não terminaram de receber os arquivos não têm como continuar.
+            conn.execute('''UPDATE tarefas SET estado = 'erro', erro = 'Envio interrompido', dono = NULL
+                            WHERE estado = 'recebendo' AND coalesce(batimento, 0) < ?''', (limite,))
+            conn.commit()
+            expirar_tarefas(conn)
+            pendentes = [tarefa_id for (tarefa_id,) in conn.execute("SELECT id FROM tarefas WHERE estado = 'pendente' ORDER BY id")]
+        finally:
+            conn.close()
+        for tarefa_id in pendentes:
+            self.enfileirar(tarefa_id)
+
+    def bater(self):
+        while True:
+            time.sleep(BATIMENTO_TAREFAS)
+            try:
+                self.vigiar()
+            except sqlite3.Error:
+                pass
+
+    def enfileirar(self, tarefa_id):
+        with self.trava:
+            if tarefa_id in self.enfileiradas:
+                return
+            self.enfileiradas.add(tarefa_id)
+        self.executor.submit(self.executar, tarefa_id)
+
+    def executar(self, tarefa_id):
+        try:
+            executar_tarefa(self.banco, tarefa_id, self.dono)
+        finally:
+            with self.trava:
+                self.enfileiradas.discard(tarefa_id)
+
+    def enviar(self, conn, arquivos, empresa, cnpj_empresa, roteamento, workers, nivel_compressao=NIVEL_COMPRESSAO_PADRAO,
+               por_categoria=False, perfilar=False):
+        tarefa_id = criar_tarefa(conn, arquivos, empresa, cnpj_empresa, roteamento, workers, nivel_compressao,
+                                 por_categoria, perfilar, self.dono)
+        self.enfileirar(tarefa_id)
+        return tarefa_id